@@ -0,0 +1,144 @@
+# /admin 라우터(운영용, OpenAPI 문서 제외). 모든 엔드포인트 require_admin(X-Admin-Token) 필요.
+# 프로파일러: 샘플링 비율 토글, 저장된 프로파일 목록·다운로드(folded stack). 진행 중 요청 레지스트리·슬로우 요청 스택 캡처 조회. 메모리 진단(tracemalloc·캐시 크기). 이벤트 루프 차단 스택. SQL 지문별 통계.
+from typing import Any, Dict, List, Literal, Optional
+
+from fastapi import APIRouter, Depends, Path, Query
+from fastapi.responses import PlainTextResponse
+from pydantic import Field
+
+from app.api.dependencies import get_kv, require_admin
+from app.common import ApiCode, ApiResponse, BaseSchema, raise_http_error
+from app.core.loop_monitor import loop_report
+from app.core.memory import memory_report, reset_baseline, start_tracing, stop_tracing
+from app.core.profiler import SAMPLE_RATE_KEY, list_profiles, profiler_state, read_profile
+from app.core.watchdog import captures, inflight_snapshot
+from app.db.query_stats import reset_query_stats, top_queries
+from app.infra.kv import KVBackend
+
+admin_router = APIRouter(
+    prefix="/admin",
+    tags=["admin"],
+    include_in_schema=False,
+    dependencies=[Depends(require_admin)],
+)
+
+
+class ProfilingToggleRequest(BaseSchema):
+    sample_rate: float = Field(..., ge=0, le=1, description="프로파일링할 요청 비율(0=끔)")
+    duration_seconds: int = Field(600, ge=1, le=86400, description="이 시간 후 설정 기본값으로 자동 복귀")
+
+
+class ProfilingStateData(BaseSchema):
+    sample_rate: float
+
+
+class ProfileInfo(BaseSchema):
+    request_id: str
+    size: int
+    created_at: float
+
+
+class InflightRequestInfo(BaseSchema):
+    request_id: str
+    method: str
+    path: str
+    route: str
+    age_ms: float
+    phase: str
+    db_count: int
+    statement: Optional[str] = None
+
+
+class SlowRequestCapture(InflightRequestInfo):
+    thread_stack: List[str] = Field(default_factory=list)
+    task_stack: List[str] = Field(default_factory=list)
+    captured_at: float
+
+
+class MemoryTracingRequest(BaseSchema):
+    enabled: bool = Field(..., description="true: tracemalloc 시작+기준 스냅샷, false: 중지")
+
+
+@admin_router.put("/profiling", response_model=ApiResponse[ProfilingStateData])
+async def set_profiling(body: ProfilingToggleRequest, kv: KVBackend = Depends(get_kv)):
+    """KV에 TTL로 저장 → 각 워커가 PROFILE_CONFIG_REFRESH 주기로 반영. 이 워커는 즉시 반영."""
+    await kv.set(SAMPLE_RATE_KEY, str(body.sample_rate), ttl_seconds=body.duration_seconds)
+    profiler_state.sample_rate = body.sample_rate
+    return ApiResponse(code=ApiCode.OK.value, data=ProfilingStateData(sample_rate=body.sample_rate))
+
+
+@admin_router.get("/profiles", response_model=ApiResponse[List[ProfileInfo]])
+def get_profiles():
+    return ApiResponse(code=ApiCode.OK.value, data=[ProfileInfo(**p) for p in list_profiles()])
+
+
+@admin_router.get("/profiles/{request_id}")
+def download_profile(request_id: str = Path(..., description="X-Profile-Id 응답 헤더 값")):
+    content = read_profile(request_id)
+    if content is None:
+        raise_http_error(404, ApiCode.NOT_FOUND, "Profile not found")
+    return PlainTextResponse(
+        content,
+        headers={"Content-Disposition": f'attachment; filename="{request_id}.folded"'},
+    )
+
+
+@admin_router.get("/requests", response_model=ApiResponse[List[InflightRequestInfo]])
+def get_inflight_requests():
+    """이 워커의 진행 중 요청(오래된 순). phase=orm이 오래 지속되면 커넥션 풀 대기 의심."""
+    return ApiResponse(code=ApiCode.OK.value, data=[InflightRequestInfo(**r) for r in inflight_snapshot()])
+
+
+@admin_router.get("/slow-requests", response_model=ApiResponse[List[SlowRequestCapture]])
+def get_slow_requests():
+    """워치독이 캡처한 슬로우 요청 스택(최신순, 이 워커 기준)."""
+    return ApiResponse(code=ApiCode.OK.value, data=[SlowRequestCapture(**c) for c in reversed(captures)])
+
+
+@admin_router.get("/memory", response_model=ApiResponse[Dict[str, Any]])
+def get_memory(
+    limit: int = Query(20, ge=1, le=200, description="상위 할당 위치 수"),
+    group_by: Literal["lineno", "traceback", "filename"] = Query("lineno"),
+):
+    """이 워커의 RSS·인메모리 캐시 크기. 추적 중이면 상위 할당 위치·기준 대비 증가(diff). 스냅샷 비용이 있어 스레드풀(sync)에서 실행."""
+    return ApiResponse(code=ApiCode.OK.value, data=memory_report(limit, group_by))
+
+
+@admin_router.put("/memory/tracing", response_model=ApiResponse[Dict[str, Any]])
+def set_memory_tracing(body: MemoryTracingRequest):
+    if body.enabled:
+        start_tracing()
+    else:
+        stop_tracing()
+    return ApiResponse(code=ApiCode.OK.value, data={"tracing": body.enabled})
+
+
+@admin_router.post("/memory/baseline", response_model=ApiResponse[Dict[str, Any]])
+def set_memory_baseline():
+    """현재 스냅샷을 새 기준으로. 추적 중이 아니면 409."""
+    if not reset_baseline():
+        raise_http_error(409, ApiCode.CONFLICT, "tracemalloc not tracing")
+    return ApiResponse(code=ApiCode.OK.value, data={"tracing": True})
+
+
+@admin_router.get("/loop", response_model=ApiResponse[Dict[str, Any]])
+def get_loop_blocking():
+    """루프 차단 이벤트(최신순): 멈춘 시간·그 순간 루프 스레드 스택·루프에서 처리 중이던 request_id. 지연 분포는 /metrics event_loop_lag_seconds."""
+    return ApiResponse(code=ApiCode.OK.value, data=loop_report())
+
+
+@admin_router.get("/queries", response_model=ApiResponse[List[Dict[str, Any]]])
+def get_query_stats(
+    limit: int = Query(20, ge=1, le=500, description="상위 지문 수"),
+    sort: Literal["total_ms", "count", "mean_ms", "p99_ms", "max_ms", "rows"] = Query("total_ms"),
+    engine: Optional[Literal["writer", "reader"]] = Query(None, description="비우면 전체 엔진"),
+):
+    """이 워커의 SQL 지문별 횟수·총/평균/p50/p99/최대 시간·행 수(정렬 기준 내림차순). 기본은 DB 시간 점유 순."""
+    return ApiResponse(code=ApiCode.OK.value, data=top_queries(limit, sort, engine))
+
+
+@admin_router.delete("/queries", response_model=ApiResponse[Dict[str, Any]])
+def clear_query_stats():
+    """집계 초기화(배포·튜닝 전후 비교용)."""
+    reset_query_stats()
+    return ApiResponse(code=ApiCode.OK.value, data={"cleared": True})
@@ -1,7 +1,9 @@
 # API 의존성 단일 진입점. 라우터/핸들러에서는 여기서만 import.
 # 예: from app.api.dependencies import get_master_db, get_slave_db, get_current_user, CurrentUser, require_post_author, ...
+from .admin import require_admin
 from .auth import CurrentUser, get_current_user
 from .db import get_master_db, get_slave_db
+from .kv import get_kv
 from .permissions import CommentAuthorContext, require_comment_author, require_post_author
 from .query import parse_availability_query
 
@@ -9,9 +11,11 @@ __all__ = [
     "CommentAuthorContext",
     "CurrentUser",
     "get_current_user",
+    "get_kv",
     "get_master_db",
     "get_slave_db",
     "parse_availability_query",
+    "require_admin",
     "require_comment_author",
     "require_post_author",
 ]
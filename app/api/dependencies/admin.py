@@ -0,0 +1,15 @@
+# 관리자 API 인증. X-Admin-Token 헤더를 ADMIN_TOKEN과 상수 시간 비교. ADMIN_TOKEN 미설정 시 관리자 API 자체를 숨김(404).
+import hmac
+
+from fastapi import Request
+
+from app.common import ApiCode, raise_http_error
+from app.core.config import settings
+
+
+def require_admin(request: Request) -> None:
+    if not settings.ADMIN_TOKEN:
+        raise_http_error(404, ApiCode.NOT_FOUND)
+    token = request.headers.get("X-Admin-Token", "")
+    if not hmac.compare_digest(token.encode(), settings.ADMIN_TOKEN.encode()):
+        raise_http_error(401, ApiCode.UNAUTHORIZED, "X-Admin-Token required")
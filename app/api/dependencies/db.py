@@ -1,12 +1,17 @@
 # DB 세션 의존성. get_master_db(CUD) / get_slave_db(Read). yield 후 commit/rollback/close.
+# get_master_db를 쓰는 라우트는 admission 쓰기 한도로 분류(write_dependency).
 # 주의: 세션은 이미 트랜잭션 중이므로 controller에서 db.begin() 사용 시 InvalidRequestError 발생.
+# Reader 서킷이 OPEN이면 조회도 Writer 세션으로(복제본 장애 시 connect_timeout 대기·503 대신 성능 저하로 대체).
 from typing import Generator
 
 from sqlalchemy.orm import Session
 
-from app.db.engine import SessionLocal, SessionLocalReader
+from app.core.middleware.admission import write_dependency
+from app.db.engine import SessionLocal, SessionLocalReader, reader_breaker
+from app.infra.circuit_breaker import HALF_OPEN, OPEN
 
 
+@write_dependency
 def get_master_db() -> Generator[Session, None, None]:
     """CUD용 Writer 세션. yield 후 commit/예외 시 rollback/finally close."""
     db = SessionLocal()
@@ -20,9 +25,15 @@ def get_master_db() -> Generator[Session, None, None]:
         db.close()
 
 
+def _reader_degraded() -> bool:
+    """OPEN(시험 시각 전)·HALF_OPEN(시험 호출 진행 중)이면 True. 시험 시각이 되면 다음 조회 1건이 Reader로 가서 복구 확인."""
+    state = reader_breaker.state
+    return state == HALF_OPEN or (state == OPEN and reader_breaker.retry_after() > 0)
+
+
 def get_slave_db() -> Generator[Session, None, None]:
-    """조회용 Reader 세션(READ ONLY). yield 후 commit/예외 시 rollback/finally close."""
-    db = SessionLocalReader()
+    """조회용 Reader 세션(READ ONLY). yield 후 commit/예외 시 rollback/finally close. Reader 서킷 OPEN이면 Writer 세션."""
+    db = SessionLocal() if _reader_degraded() else SessionLocalReader()
     try:
         yield db
         db.commit()
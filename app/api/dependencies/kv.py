@@ -0,0 +1,8 @@
+# KV 백엔드 의존성. lifespan(init_redis)에서 만든 app.state.kv(Redis/인메모리 자동 전환) 주입.
+from fastapi import Request
+
+from app.infra.kv import KVBackend
+
+
+def get_kv(request: Request) -> KVBackend:
+    return request.app.state.kv
@@ -1,7 +1,7 @@
-# common 패키지: ApiCode, ApiResponse, BaseSchema, enums, validators, raise_http_error, setup_logging.
+# common 패키지: ApiCode, ApiResponse, BaseSchema, enums, validators, raise_http_error, setup_logging, shutdown_logging.
 from .codes import ApiCode
 from .enums import DogGender, UserStatus
-from .logging_config import setup_logging
+from .logging_config import setup_logging, shutdown_logging
 from .response import raise_http_error
 from .schema import ApiResponse, BaseSchema
 from .validators import ensure_nickname_format, ensure_password_format, ensure_utc_datetime, UtcDatetime
@@ -17,5 +17,6 @@ __all__ = [
     "ensure_utc_datetime",
     "raise_http_error",
     "setup_logging",
+    "shutdown_logging",
     "UtcDatetime",
 ]
@@ -58,6 +58,10 @@ class ApiCode(str, Enum):
     UNPROCESSABLE_ENTITY = "UNPROCESSABLE_ENTITY"
     RATE_LIMIT_EXCEEDED = "RATE_LIMIT_EXCEEDED"
     LOGIN_RATE_LIMIT_EXCEEDED = "LOGIN_RATE_LIMIT_EXCEEDED"
+    SERVICE_OVERLOADED = "SERVICE_OVERLOADED"
+    REQUEST_TIMEOUT = "REQUEST_TIMEOUT"
+    DEPENDENCY_UNAVAILABLE = "DEPENDENCY_UNAVAILABLE"
+    NOT_READY = "NOT_READY"
     CONSTRAINT_ERROR = "CONSTRAINT_ERROR"
     DB_ERROR = "DB_ERROR"
     HTTP_ERROR = "HTTP_ERROR"
@@ -1,26 +1,124 @@
-# 로깅 설정. request_id는 app/core/middleware/request_id.py에서 contextvars에 설정. RequestIdFilter가 record.request_id 주입 → 포맷 [%(request_id)s].
+# 로깅 설정. request_id는 요청 파이프라인(app/core/middleware/pipeline.py)이 contextvars에 설정. RequestIdFilter가 record.request_id 주입 → 포맷 [%(request_id)s].
+# 비차단: 루트에는 QueueHandler만 붙이고 포맷·쓰기(콘솔·파일)는 QueueListener 스레드에서 수행. 큐가 가득 차면 버림(요청 경로를 막지 않음).
+# 같은 메시지(로거·템플릿·예외 타입)가 폭주하면 LogRateLimitFilter가 창당 burst건만 통과시키고 나머지는 건수만 집계(DB 장애 시 로그 폭주 방지).
+import json
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Dict, Optional, Tuple
 
 from app.core.config import settings
 from app.core.middleware.request_id import request_id_ctx
 
 _LOG_DATEFMT = "%Y-%m-%d %H:%M:%S"
 _LOG_FMT = "%(asctime)s - [%(request_id)s] - %(levelname)s - %(name)s - %(message)s"
+# JSON 포맷에서 extra로 넘어오면 필드로 출력(접근 로그: route·status·duration_ms 등)
+_JSON_EXTRA_FIELDS = ("method", "path", "route", "status", "duration_ms", "client_ip", "suppressed")
 _configured = False
+_listener: Optional[QueueListener] = None
 
 
 class RequestIdFilter(logging.Filter):
-    """contextvars request_id → LogRecord.request_id → 포맷 [%(request_id)s]."""
+    """contextvars request_id → LogRecord.request_id → 포맷 [%(request_id)s]. 큐에 넣기 전(호출 스레드)에 실행해야 함."""
 
     def filter(self, record: logging.LogRecord) -> bool:
         record.request_id = request_id_ctx.get() or ""
         return True
 
 
+class LogRateLimitFilter(logging.Filter):
+    """WARNING 이상, (로거, 메시지 템플릿, 예외 타입) 키별로 window초당 burst건만 통과. 억제 건수는 다음 통과 레코드의 suppressed로 기록."""
+
+    def __init__(self, window: float, burst: int, max_keys: int = 1000) -> None:
+        super().__init__()
+        self.window = window
+        self.burst = max(1, burst)
+        self.max_keys = max_keys
+        # key → [창 시작, 창 내 건수, 억제 건수]
+        self._counters: Dict[Tuple[str, object, str], list] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < logging.WARNING or self.window <= 0:
+            return True
+        exc_type = record.exc_info[0].__name__ if record.exc_info and record.exc_info[0] else ""
+        key = (record.name, record.msg, exc_type)
+        now = time.monotonic()
+        with self._lock:
+            counter = self._counters.get(key)
+            if counter is None:
+                if len(self._counters) >= self.max_keys:
+                    self._counters.clear()
+                counter = self._counters[key] = [now, 0, 0]
+            elif now - counter[0] >= self.window:
+                counter[0], counter[1] = now, 0
+            counter[1] += 1
+            if counter[1] > self.burst:
+                counter[2] += 1
+                return False
+            suppressed, counter[2] = counter[2], 0
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄 JSON. ts·level·logger·request_id·message + extra 필드(_JSON_EXTRA_FIELDS), 예외 시 exc."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "ts": self.formatTime(record, _LOG_DATEFMT),
+            "level": record.levelname,
+            "logger": record.name,
+            "request_id": getattr(record, "request_id", ""),
+            "message": record.getMessage(),
+        }
+        for field in _JSON_EXTRA_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                data[field] = value
+        if record.exc_info:
+            data["exc"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class _TextFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        suppressed = getattr(record, "suppressed", None)
+        return f"{line} (+{suppressed} suppressed)" if suppressed else line
+
+
+class _NonBlockingQueueHandler(QueueHandler):
+    """호출 스레드에서는 메시지 인자 병합만(포맷·traceback 문자열화는 리스너 스레드). 큐가 가득 차면 버리고 건수만 집계."""
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]") -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def _build_formatter() -> logging.Formatter:
+    if settings.LOG_FORMAT == "json":
+        return JsonFormatter()
+    return _TextFormatter(_LOG_FMT, datefmt=_LOG_DATEFMT)
+
+
 def setup_logging() -> None:
-    global _configured
+    global _configured, _listener
     if _configured:
         return
     level = getattr(logging, settings.LOG_LEVEL, logging.INFO)
@@ -28,13 +126,12 @@ def setup_logging() -> None:
     root.setLevel(level)
     root.handlers.clear()
 
-    formatter = logging.Formatter(_LOG_FMT, datefmt=_LOG_DATEFMT)
-    request_id_filter = RequestIdFilter()
+    formatter = _build_formatter()
+    handlers = []
 
     console = logging.StreamHandler()
     console.setFormatter(formatter)
-    console.addFilter(request_id_filter)
-    root.addHandler(console)
+    handlers.append(console)
 
     if settings.LOG_FILE_PATH:
         log_path = Path(settings.LOG_FILE_PATH)
@@ -46,7 +143,30 @@ def setup_logging() -> None:
             encoding="utf-8",
         )
         file_handler.setFormatter(formatter)
-        file_handler.addFilter(request_id_filter)
-        root.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=max(0, settings.LOG_QUEUE_MAX_SIZE))
+    queue_handler = _NonBlockingQueueHandler(log_queue)
+    queue_handler.addFilter(RequestIdFilter())
+    queue_handler.addFilter(LogRateLimitFilter(settings.LOG_RATE_LIMIT_WINDOW, settings.LOG_RATE_LIMIT_BURST))
+    root.addHandler(queue_handler)
 
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
     _configured = True
+
+
+def shutdown_logging() -> None:
+    """리스너 중지(큐에 남은 레코드 모두 기록 후 반환). lifespan 종료 시 호출."""
+    global _configured, _listener
+    root = logging.getLogger()
+    queue_handlers = [h for h in root.handlers if isinstance(h, _NonBlockingQueueHandler)]
+    for handler in queue_handlers:
+        if handler.dropped:
+            logging.getLogger(__name__).warning("로그 큐 포화로 %s건 버림", handler.dropped)
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    for handler in queue_handlers:
+        root.removeHandler(handler)
+    _configured = False
@@ -1,5 +1,5 @@
 # 공통 API 에러 응답: raise_http_error (HTTPException + code/data/message).
-from typing import Optional, Union
+from typing import Dict, Optional, Union
 
 from fastapi import HTTPException
 
@@ -10,9 +10,10 @@ def raise_http_error(
     status_code: int,
     error_code: Union[str, ApiCode],
     message: Optional[str] = None,
+    headers: Optional[Dict[str, str]] = None,
 ) -> None:
     code_str = error_code.value if isinstance(error_code, ApiCode) else error_code
     detail: dict = {"code": code_str, "data": None}
     if message is not None:
         detail["message"] = message
-    raise HTTPException(status_code=status_code, detail=detail)
+    raise HTTPException(status_code=status_code, detail=detail, headers=headers)
@@ -26,6 +26,8 @@ class Settings:
         ).split(",")
         if origin.strip()
     ]
+    # 프리플라이트 응답 캐시(초). 브라우저 상한(Chromium 7200, Firefox 86400)까지 OPTIONS 재요청 생략
+    CORS_MAX_AGE: int = int(os.getenv("CORS_MAX_AGE", "86400"))
     # 세션 (만료 시간 초, cleanup 주기 초)
     SESSION_EXPIRY_TIME: int = int(os.getenv("SESSION_EXPIRY_TIME", "86400"))
     SESSION_CLEANUP_INTERVAL: int = int(os.getenv("SESSION_CLEANUP_INTERVAL", "3600"))
@@ -36,8 +38,15 @@ class Settings:
     ACCESS_TOKEN_EXPIRE_SECONDS: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_SECONDS", "900"))
     REFRESH_TOKEN_EXPIRE_DAYS: int = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "7"))
     REFRESH_TOKEN_COOKIE_NAME: str = os.getenv("REFRESH_TOKEN_COOKIE_NAME", "refresh_token")
-    # Redis (Rate Limit 분산. 비우면 연결 시도 안 함, 미들웨어는 Fail-open)
+    # Redis (Rate Limit·Refresh Token. 비우면 연결 시도 안 하고 인메모리 백엔드 사용(단일 노드))
     REDIS_URL: str = os.getenv("REDIS_URL", "").strip()
+    # Redis 명령·연결 타임아웃(초). 장애 시 요청이 기다리는 상한
+    REDIS_SOCKET_TIMEOUT: float = float(os.getenv("REDIS_SOCKET_TIMEOUT", "0.5"))
+    # 연속 실패 N회 → 서킷 OPEN(인메모리로 전환), RESET_TIMEOUT초 후 시험 호출로 복구 확인
+    REDIS_BREAKER_FAILURE_THRESHOLD: int = int(os.getenv("REDIS_BREAKER_FAILURE_THRESHOLD", "3"))
+    REDIS_BREAKER_RESET_TIMEOUT: float = float(os.getenv("REDIS_BREAKER_RESET_TIMEOUT", "10"))
+    # 인메모리 백엔드 최대 키 수(초과 시 LRU 제거)
+    KV_MEMORY_MAX_KEYS: int = int(os.getenv("KV_MEMORY_MAX_KEYS", "100000"))
     REDIS_MAX_CONNECTIONS: int = int(os.getenv("REDIS_MAX_CONNECTIONS", "20"))
     # Proxy·Trusted Host. TRUST_X_FORWARDED_FOR=True면 X-Forwarded-For 첫 값으로 request.client 보정. TRUSTED_HOSTS=* 이면 미등록
     TRUST_X_FORWARDED_FOR: bool = os.getenv("TRUST_X_FORWARDED_FOR", "false").lower() == "true"
@@ -48,17 +57,38 @@ class Settings:
     TRUSTED_HOSTS: List[str] = [
         h.strip() for h in os.getenv("TRUSTED_HOSTS", "*").split(",") if h.strip()
     ]
-    # Rate limit (전역: 창 길이 초, 최대 요청 수 / 로그인: 창·최대 시도)
+    # Rate limit (GCRA. 전역: 창 길이 초, 창당 최대 요청 수 / 로그인: 창·최대 시도. 로그인·업로드는 전역 버킷도 함께 차감)
     RATE_LIMIT_WINDOW: int = int(os.getenv("RATE_LIMIT_WINDOW", "60"))
     RATE_LIMIT_MAX_REQUESTS: int = int(os.getenv("RATE_LIMIT_MAX_REQUESTS", "100"))
     LOGIN_RATE_LIMIT_WINDOW: int = int(os.getenv("LOGIN_RATE_LIMIT_WINDOW", "60"))
     LOGIN_RATE_LIMIT_MAX_ATTEMPTS: int = int(os.getenv("LOGIN_RATE_LIMIT_MAX_ATTEMPTS", "5"))
+    # 인증 사용자(검증된 JWT sub) 전역 한도. 비인증은 RATE_LIMIT_MAX_REQUESTS(IP 기준)
+    RATE_LIMIT_USER_MAX_REQUESTS: int = int(os.getenv("RATE_LIMIT_USER_MAX_REQUESTS", "300"))
+    # 요청 비용(전역 버킷 차감량). "METHOD 경로템플릿=비용" 콤마 구분, 미지정 경로는 1. 목록 size가 UNIT 초과 시 UNIT당 +1, 본문 BYTES_PER_UNIT당 +1
+    RATE_LIMIT_ROUTE_COSTS: str = os.getenv(
+        "RATE_LIMIT_ROUTE_COSTS",
+        "POST /v1/posts=3,PATCH /v1/posts/{post_id}=2,POST /v1/posts/{post_id}/comments=2,"
+        "POST /v1/media/images=3,POST /v1/media/images/signup=3,POST /v1/auth/signup=3",
+    )
+    RATE_LIMIT_PAGE_SIZE_UNIT: int = int(os.getenv("RATE_LIMIT_PAGE_SIZE_UNIT", "20"))
+    RATE_LIMIT_BYTES_PER_UNIT: int = int(os.getenv("RATE_LIMIT_BYTES_PER_UNIT", "1048576"))
+    # 워커 내 사전 필터가 기억하는 최대 키 수(IP×버킷). 초과 시 오래된 키부터 제거
+    RATE_LIMIT_LOCAL_MAX_KEYS: int = int(os.getenv("RATE_LIMIT_LOCAL_MAX_KEYS", "10000"))
+    # 허용 임대: 자주 오는 키는 Redis에서 최대 LEASE_MAX 단위(전역 한도의 1/10 이하)를 미리 차감해 TTL 동안 워커에서 소진. 0이면 매 요청 Redis
+    RATE_LIMIT_LEASE_MAX: int = int(os.getenv("RATE_LIMIT_LEASE_MAX", "10"))
+    RATE_LIMIT_LEASE_TTL_MS: int = int(os.getenv("RATE_LIMIT_LEASE_TTL_MS", "1000"))
     # 회원가입용 이미지 (토큰 TTL 초, IP당 업로드 rate limit; MAX=1이면 두 번째 signup 시 업로드만 429되고 /auth/signup 요청 안 나감)
     SIGNUP_IMAGE_TOKEN_TTL_SECONDS: int = int(os.getenv("SIGNUP_IMAGE_TOKEN_TTL_SECONDS", "3600"))
     SIGNUP_UPLOAD_RATE_LIMIT_WINDOW: int = int(os.getenv("SIGNUP_UPLOAD_RATE_LIMIT_WINDOW", "3600"))
     SIGNUP_UPLOAD_RATE_LIMIT_MAX: int = int(os.getenv("SIGNUP_UPLOAD_RATE_LIMIT_MAX", "10"))
     # 파일 업로드 (최대 바이트, 허용 content-type)
     MAX_FILE_SIZE: int = int(os.getenv("MAX_FILE_SIZE", "10485760"))
+    # 업로드 벌크헤드. 워커당 동시 업로드 수(초과 시 즉시 503, 버퍼 메모리 ≤ 이 값 × MAX_FILE_SIZE), 저장(S3·디스크) 전용 스레드 수
+    MEDIA_MAX_INFLIGHT_UPLOADS: int = int(os.getenv("MEDIA_MAX_INFLIGHT_UPLOADS", "8"))
+    MEDIA_IO_THREADS: int = int(os.getenv("MEDIA_IO_THREADS", "4"))
+    # 스토리지(S3·디스크) 서킷 브레이커. 저장·삭제 연속 실패 N회 → OPEN(업로드 즉시 503), RESET_TIMEOUT초 후 시험 호출
+    STORAGE_BREAKER_FAILURE_THRESHOLD: int = int(os.getenv("STORAGE_BREAKER_FAILURE_THRESHOLD", "5"))
+    STORAGE_BREAKER_RESET_TIMEOUT: float = float(os.getenv("STORAGE_BREAKER_RESET_TIMEOUT", "30"))
     ALLOWED_IMAGE_TYPES: List[str] = [
         img_type.strip()
         for img_type in os.getenv("ALLOWED_IMAGE_TYPES", "image/jpeg,image/png").split(",")
@@ -76,6 +106,98 @@ class Settings:
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO").upper()
     LOG_FILE_PATH: str = os.getenv("LOG_FILE_PATH", "").strip()
     SLOW_REQUEST_MS: int = int(os.getenv("SLOW_REQUEST_MS", "1000"))
+    # SQL 지문별 집계(/admin/queries). SLOW_QUERY_MS 이상 걸린 문장은 WARNING 로그. 지문 수 상한(초과분은 <other>), 백분위 계산용 최근 표본 수
+    QUERY_STATS_ENABLED: bool = os.getenv("QUERY_STATS_ENABLED", "true").lower() == "true"
+    SLOW_QUERY_MS: int = int(os.getenv("SLOW_QUERY_MS", "200"))
+    QUERY_STATS_MAX_FINGERPRINTS: int = int(os.getenv("QUERY_STATS_MAX_FINGERPRINTS", "500"))
+    QUERY_STATS_SAMPLES: int = int(os.getenv("QUERY_STATS_SAMPLES", "200"))
+    # SQL 주석 태깅(sqlcommenter). 요청 중 문장 끝에 /*controller=,route=*/ 추가 → DB 측 performance_schema에서 엔드포인트 추적
+    # request_id는 선택(추가 시 문장 텍스트가 요청마다 달라져 서버 쿼리 캐시·로그 집계 도구가 문장을 묶지 못함)
+    SQL_COMMENT_ENABLED: bool = os.getenv("SQL_COMMENT_ENABLED", "true").lower() == "true"
+    SQL_COMMENT_FIELDS: str = os.getenv("SQL_COMMENT_FIELDS", "controller,route")
+    # 슬로우 요청 워치독: 진행 중 요청이 SLOW_REQUEST_MS를 넘으면 스택 캡처(요청당 1회). 검사 주기(초)·보관 건수
+    WATCHDOG_ENABLED: bool = os.getenv("WATCHDOG_ENABLED", "true").lower() == "true"
+    WATCHDOG_INTERVAL: float = float(os.getenv("WATCHDOG_INTERVAL", "0.25"))
+    WATCHDOG_MAX_CAPTURES: int = int(os.getenv("WATCHDOG_MAX_CAPTURES", "100"))
+    # text | json(한 줄 JSON, request_id·route·status·duration_ms 필드)
+    LOG_FORMAT: str = os.getenv("LOG_FORMAT", "text").strip().lower()
+    # 로그 큐 최대 레코드 수(초과 시 버림, 0=무제한). 같은 메시지(WARNING 이상)는 창(초)당 BURST건만 기록
+    LOG_QUEUE_MAX_SIZE: int = int(os.getenv("LOG_QUEUE_MAX_SIZE", "10000"))
+    LOG_RATE_LIMIT_WINDOW: float = float(os.getenv("LOG_RATE_LIMIT_WINDOW", "10"))
+    LOG_RATE_LIMIT_BURST: int = int(os.getenv("LOG_RATE_LIMIT_BURST", "20"))
+
+    # 관리자 API(/admin). X-Admin-Token 헤더로 인증, 비어 있으면 /admin 전체 404
+    ADMIN_TOKEN: str = os.getenv("ADMIN_TOKEN", "").strip()
+    # 온디맨드 프로파일러. X-Profile: {ADMIN_TOKEN} 요청 또는 샘플링 비율(0~1, /admin/profiling으로 런타임 변경)로 스택 샘플링
+    PROFILE_ENABLED: bool = os.getenv("PROFILE_ENABLED", "true").lower() == "true"
+    PROFILE_SAMPLE_RATE: float = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+    PROFILE_INTERVAL_MS: float = float(os.getenv("PROFILE_INTERVAL_MS", "5"))
+    # 동시에 프로파일하는 요청 상한(샘플러 스레드는 프로세스당 1개). 초과 요청은 프로파일 없이 처리
+    PROFILE_MAX_CONCURRENT: int = int(os.getenv("PROFILE_MAX_CONCURRENT", "4"))
+    # 결과 저장 디렉터리(비우면 시스템 임시 디렉터리 하위). 워커 간 공유되도록 같은 경로 사용, 최대 보관 개수
+    PROFILE_DIR: str = os.getenv("PROFILE_DIR", "").strip()
+    PROFILE_MAX_STORED: int = int(os.getenv("PROFILE_MAX_STORED", "50"))
+    # 관리자 토글(KV 저장) 반영 주기(초)
+    PROFILE_CONFIG_REFRESH: float = float(os.getenv("PROFILE_CONFIG_REFRESH", "5"))
+
+    # 적응형 동시성 제한(부하 차단). 읽기(GET)·쓰기 클래스별 워커당 동시 처리 한도를 AIMD로 조정, 초과 시 즉시 503 + Retry-After(초)
+    # 응답이 LATENCY_TARGET_MS 이내면 한도 증가, 초과·5xx면 × BACKOFF. 한도 범위 MIN ~ *_MAX_LIMIT
+    ADMISSION_ENABLED: bool = os.getenv("ADMISSION_ENABLED", "true").lower() == "true"
+    ADMISSION_LATENCY_TARGET_MS: float = float(os.getenv("ADMISSION_LATENCY_TARGET_MS", "1000"))
+    ADMISSION_BACKOFF: float = float(os.getenv("ADMISSION_BACKOFF", "0.9"))
+    ADMISSION_MIN_LIMIT: int = int(os.getenv("ADMISSION_MIN_LIMIT", "4"))
+    ADMISSION_READ_INITIAL_LIMIT: int = int(os.getenv("ADMISSION_READ_INITIAL_LIMIT", "40"))
+    ADMISSION_READ_MAX_LIMIT: int = int(os.getenv("ADMISSION_READ_MAX_LIMIT", "200"))
+    ADMISSION_WRITE_INITIAL_LIMIT: int = int(os.getenv("ADMISSION_WRITE_INITIAL_LIMIT", "20"))
+    ADMISSION_WRITE_MAX_LIMIT: int = int(os.getenv("ADMISSION_WRITE_MAX_LIMIT", "100"))
+    ADMISSION_RETRY_AFTER: int = int(os.getenv("ADMISSION_RETRY_AFTER", "1"))
+    # 요청 데드라인(ms, 0=무제한). 경로별은 "METHOD 경로템플릿=ms" 콤마 구분. HEADER=true면 클라이언트 X-Request-Timeout(ms)이 더 짧을 때 적용
+    # SELECT에 MAX_EXECUTION_TIME 힌트, Redis 명령·스레드풀 진입에 남은 시간 적용, 초과 시 504 REQUEST_TIMEOUT
+    REQUEST_TIMEOUT_MS: int = int(os.getenv("REQUEST_TIMEOUT_MS", "10000"))
+    REQUEST_TIMEOUT_ROUTES: str = os.getenv(
+        "REQUEST_TIMEOUT_ROUTES",
+        "POST /v1/media/images=30000,POST /v1/media/images/signup=30000",
+    )
+    REQUEST_TIMEOUT_HEADER: bool = os.getenv("REQUEST_TIMEOUT_HEADER", "true").lower() == "true"
+    # 스레드풀(sync 라우트·의존성) 최대 동시 실행 수. 0이면 엔진당 커넥션 상한(pool_size+max_overflow)에 맞춤 → 초과 스레드가 체크아웃에서 숨어 대기하지 않음
+    THREADPOOL_SIZE: int = int(os.getenv("THREADPOOL_SIZE", "0"))
+    # Server-Timing 응답 헤더(구간: db·redis·storage·pre·handler·post). DEBUG면 모든 요청, 아니면 SAMPLE_RATE(0~1) 비율. LOG=true면 구간 요약을 로그에도 기록
+    SERVER_TIMING_SAMPLE_RATE: float = float(os.getenv("SERVER_TIMING_SAMPLE_RATE", "0"))
+    SERVER_TIMING_LOG: bool = os.getenv("SERVER_TIMING_LOG", "false").lower() == "true"
+
+    # Accept: application/msgpack 요청에 MessagePack 응답(도메인 라우터만). 기본 응답은 JSON
+    RESPONSE_MSGPACK_ENABLED: bool = os.getenv("RESPONSE_MSGPACK_ENABLED", "true").lower() == "true"
+    # 응답 압축(br·gzip). MIN_SIZE 바이트 미만은 그대로, OFFLOAD_SIZE 이상은 전용 스레드(THREADS개)에서 압축(16KB 본문 gzip 약 0.5ms가 루프에서 실행되는 상한)
+    # 압축 결과는 본문 해시 기준 LRU(CACHE_MAX_BYTES)에 보관 → 같은 본문 재전송 시 압축 생략. 0이면 캐시·해시 없음
+    COMPRESSION_ENABLED: bool = os.getenv("COMPRESSION_ENABLED", "true").lower() == "true"
+    COMPRESSION_MIN_SIZE: int = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+    COMPRESSION_OFFLOAD_SIZE: int = int(os.getenv("COMPRESSION_OFFLOAD_SIZE", "16384"))
+    COMPRESSION_GZIP_LEVEL: int = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+    COMPRESSION_BROTLI_QUALITY: int = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "5"))
+    COMPRESSION_THREADS: int = int(os.getenv("COMPRESSION_THREADS", "2"))
+    COMPRESSION_CACHE_MAX_BYTES: int = int(os.getenv("COMPRESSION_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+
+    # 헬스 프로버. INTERVAL(초)마다 writer·reader·Redis·풀 점검 결과를 캐시(/health/ready). 풀 사용률이 SATURATION 이상이면 degraded 표시
+    HEALTH_CHECK_INTERVAL: float = float(os.getenv("HEALTH_CHECK_INTERVAL", "5"))
+    HEALTH_POOL_SATURATION: float = float(os.getenv("HEALTH_POOL_SATURATION", "0.9"))
+
+    # 이벤트 루프 지연 모니터. INTERVAL(초)마다 지연 측정, 루프가 THRESHOLD_MS 넘게 멈추면 루프 스레드 스택 캡처(최근 MAX_EVENTS건)
+    LOOP_MONITOR_ENABLED: bool = os.getenv("LOOP_MONITOR_ENABLED", "true").lower() == "true"
+    LOOP_LAG_INTERVAL: float = float(os.getenv("LOOP_LAG_INTERVAL", "0.1"))
+    LOOP_BLOCK_THRESHOLD_MS: float = float(os.getenv("LOOP_BLOCK_THRESHOLD_MS", "100"))
+    LOOP_BLOCK_MAX_EVENTS: int = int(os.getenv("LOOP_BLOCK_MAX_EVENTS", "50"))
+    # 테스트 전용: true면 테스트 중 루프 차단 이벤트를 실패로 처리(test/conftest.py)
+    LOOP_BLOCK_STRICT: bool = os.getenv("LOOP_BLOCK_STRICT", "false").lower() == "true"
+    # 메모리 진단(/admin/memory). tracemalloc 추적 시 보관할 스택 깊이(클수록 오버헤드↑)
+    MEMORY_TRACE_FRAMES: int = int(os.getenv("MEMORY_TRACE_FRAMES", "1"))
+    # 워커 RSS 한도(MB, 0=끔). 초과 시 graceful 종료 → Gunicorn이 새 워커 기동. 확인 주기(초)
+    WORKER_MAX_RSS_MB: int = int(os.getenv("WORKER_MAX_RSS_MB", "0"))
+    WORKER_RSS_CHECK_INTERVAL: float = float(os.getenv("WORKER_RSS_CHECK_INTERVAL", "30"))
+
+    # 메트릭(/metrics). 멀티 워커 시 METRICS_MULTIPROC_DIR에 워커별 스냅샷 파일 기록 → 스크레이프 시 병합
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+    METRICS_MULTIPROC_DIR: str = os.getenv("METRICS_MULTIPROC_DIR", "").strip()
+    METRICS_FLUSH_INTERVAL: int = int(os.getenv("METRICS_FLUSH_INTERVAL", "5"))
     # 보안 헤더 (HSTS, Referrer-Policy, Permissions-Policy, CSP)
     HSTS_ENABLED: bool = os.getenv("HSTS_ENABLED", "false").lower() == "true"
     HSTS_MAX_AGE: int = int(os.getenv("HSTS_MAX_AGE", "31536000"))
@@ -90,11 +212,26 @@ class Settings:
     DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "20"))
     DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
     DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "3600"))
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+    # 엔진별 서킷 브레이커. 연결 실패·끊김 N회 연속 → OPEN(체크아웃 즉시 503), RESET_TIMEOUT초 후 시험 호출. reader OPEN이면 조회는 writer로
+    DB_BREAKER_FAILURE_THRESHOLD: int = int(os.getenv("DB_BREAKER_FAILURE_THRESHOLD", "5"))
+    DB_BREAKER_RESET_TIMEOUT: float = float(os.getenv("DB_BREAKER_RESET_TIMEOUT", "10"))
+    # 소켓 읽기 타임아웃(초, 0=없음). MAX_EXECUTION_TIME이 적용되지 않는 쓰기 문장의 상한(초과 시 연결 폐기)
+    DB_READ_TIMEOUT: int = int(os.getenv("DB_READ_TIMEOUT", "0"))
+    # DB 풀 예산·헬스체크. DB_MAX_CONNECTIONS_PER_HOST>0 이면 (상한 / WEB_CONCURRENCY / 같은 호스트 엔진 수)로 풀 크기 산출(DB_POOL_SIZE·DB_MAX_OVERFLOW 무시)
+    DB_MAX_CONNECTIONS_PER_HOST: int = int(os.getenv("DB_MAX_CONNECTIONS_PER_HOST", "0"))
+    WEB_CONCURRENCY: int = int(os.getenv("WEB_CONCURRENCY", "1"))
+    DB_POOL_MIN_SIZE: int = int(os.getenv("DB_POOL_MIN_SIZE", "2"))
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "false").lower() == "true"
+    # 이 시간(초) 이상 유휴였던 연결만 체크아웃 시 ping(0=비활성, DB_POOL_PRE_PING이면 불필요)
+    DB_POOL_HEALTHCHECK_INTERVAL: int = int(os.getenv("DB_POOL_HEALTHCHECK_INTERVAL", "30"))
     DB_HOST: str = os.getenv("DB_HOST", "localhost")
     DB_PORT: int = int(os.getenv("DB_PORT", "3306"))
     DB_USER: str = os.getenv("DB_USER", "root")
     DB_PASSWORD: str = os.getenv("DB_PASSWORD", "")
     DB_NAME: str = os.getenv("DB_NAME", "puppytalk")
+    # strict loading: 명시하지 않은 관계 지연 로딩 시 예외(raiseload). 테스트·개발에서 N+1 검출용
+    DB_STRICT_LOADING: bool = os.getenv("DB_STRICT_LOADING", "false").lower() == "true"
     WRITER_DB_URL: str = os.getenv("WRITER_DB_URL", "").strip()
     READER_DB_URL: str = os.getenv("READER_DB_URL", "").strip()
 
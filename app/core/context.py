@@ -0,0 +1,73 @@
+# 요청 스코프 컨텍스트. RequestPipelineMiddleware가 요청마다 RequestContext를 contextvars에 설정.
+# 스레드풀(sync 라우트)로 컨텍스트가 복사돼도 같은 객체를 가리키므로 DB 훅 등에서 누적한 값이 미들웨어에서 보임.
+# 진행 중 요청 레지스트리(inflight)에도 같은 객체를 등록 → 워치독·/admin/requests가 단계(phase)·실행 중 SQL·처리 스레드를 조회.
+import contextvars
+import time
+from typing import Any, Dict, List, Optional
+
+# 요청 단계. pipeline: 라우팅 전(rate limit 등) / handler: 앱 처리 중 / orm: 세션 실행(커넥션 대기 포함) / db: SQL 실행 중 / responding: 응답 전송 중
+PHASE_PIPELINE = "pipeline"
+PHASE_HANDLER = "handler"
+PHASE_ORM = "orm"
+PHASE_DB = "db"
+PHASE_RESPONDING = "responding"
+
+
+class RequestContext:
+    """request_id 기준 요청 단위 계측값. db_count·db_time(초)은 SQL 훅이 누적. thread_id는 마지막으로 ORM/SQL을 실행한 스레드. spans는 Server-Timing 구간."""
+
+    __slots__ = (
+        "request_id",
+        "started",
+        "db_count",
+        "db_time",
+        "scope",
+        "phase",
+        "statement",
+        "thread_id",
+        "task",
+        "captured",
+        "spans",
+        "route_started",
+        "handler_ended",
+        "sql_comment",
+        "thread_wait",
+        "pool_wait",
+        "deadline",
+        "profile",
+    )
+
+    def __init__(self, request_id: str, scope: Optional[Dict[str, Any]] = None) -> None:
+        self.request_id = request_id
+        self.started = time.perf_counter()
+        self.db_count = 0
+        self.db_time = 0.0
+        self.scope = scope
+        self.phase = PHASE_PIPELINE
+        self.statement: Optional[str] = None
+        self.thread_id: Optional[int] = None
+        self.task: Any = None
+        self.captured = False
+        # Server-Timing 샘플링된 요청만 dict(구간 → [누적 초, 횟수]), 아니면 None(app.core.timing)
+        self.spans: Optional[Dict[str, List[float]]] = None
+        self.route_started: Optional[float] = None
+        self.handler_ended: Optional[float] = None
+        # SQL 주석 태그(app.db.sql_comment). 첫 쿼리에서 1회 계산
+        self.sql_comment: Optional[str] = None
+        # 스레드풀 토큰 대기·DB 커넥션 체크아웃 대기 누적(초). app.core.threadpool·app.db.pool이 기록
+        self.thread_wait = 0.0
+        self.pool_wait = 0.0
+        # 요청 데드라인(perf_counter 기준 절대 시각). app.core.deadline, None이면 무제한
+        self.deadline: Optional[float] = None
+        # 프로파일 중이면 app.core.profiler.ProfileSession(스레드풀이 실행 스레드 등록), 아니면 None
+        self.profile: Any = None
+
+
+request_ctx: contextvars.ContextVar[Optional[RequestContext]] = contextvars.ContextVar("request_ctx", default=None)
+
+# id(ctx) → ctx. 파이프라인이 등록·해제(dict 단일 연산이라 GIL 하에서 워치독 스레드와 안전하게 공유)
+inflight: Dict[int, RequestContext] = {}
+
+
+def current_request() -> Optional[RequestContext]:
+    return request_ctx.get()
@@ -0,0 +1,119 @@
+# 요청 데드라인. 파이프라인이 요청 시작 + 제한 시간(REQUEST_TIMEOUT_MS, 경로별 REQUEST_TIMEOUT_ROUTES, 클라이언트 X-Request-Timeout은 줄이는 방향만)을
+# RequestContext.deadline에 기록 → 스레드풀 진입·SQL 실행(MAX_EXECUTION_TIME 힌트)·Redis 명령이 남은 시간만큼만 기다리고, 이미 지났으면 시작하지 않고 DeadlineExceeded.
+# 예외 핸들러가 504 REQUEST_TIMEOUT으로 변환. 실행 중인 스레드는 중단할 수 없으므로 다음 I/O 지점에서 포기(협조적 취소).
+import asyncio
+import functools
+import logging
+import re
+import time
+from typing import Any, Callable, List, NamedTuple, Optional, Pattern
+
+from starlette.responses import JSONResponse, Response
+
+from app.core.config import settings
+from app.core.context import RequestContext, request_ctx
+from app.core.metrics import Counter, register
+
+logger = logging.getLogger(__name__)
+
+DEADLINE_EXCEEDED = register(
+    Counter("request_deadline_exceeded_total", "데드라인 초과로 포기한 요청 수(중단 지점별)", ("stage",))
+)
+
+
+class DeadlineExceeded(Exception):
+    """남은 시간이 없어 작업을 시작하지 않음(또는 중단). args[0] = 중단 지점(pipeline·threadpool·db·redis)."""
+
+
+class RouteTimeout(NamedTuple):
+    method: str
+    pattern: Pattern[str]
+    seconds: float
+
+
+def parse_route_timeouts(spec: str) -> List[RouteTimeout]:
+    """"GET /v1/posts=3000,..." 형식(ms, RATE_LIMIT_ROUTE_COSTS와 같은 경로 규칙). 잘못된 항목은 경고 후 무시."""
+    rules: List[RouteTimeout] = []
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        try:
+            route, ms = item.rsplit("=", 1)
+            method, template = route.split()
+            regex = re.sub(r"\\\{[^/]+?\\\}", "[^/]+", re.escape(template.rstrip("/")))
+            rules.append(RouteTimeout(method.upper(), re.compile(regex), max(1, int(ms)) / 1000))
+        except ValueError:
+            logger.warning("REQUEST_TIMEOUT_ROUTES 항목 무시: %r", item)
+    return rules
+
+
+_route_timeouts = parse_route_timeouts(settings.REQUEST_TIMEOUT_ROUTES)
+
+
+def resolve_timeout(method: str, path: str, header: Optional[bytes] = None) -> Optional[float]:
+    """제한 시간(초). 경로별 설정 → 기본값 순, 0이면 None(무제한). 클라이언트 헤더(ms)는 설정보다 짧을 때만 적용."""
+    p = path.rstrip("/") or "/"
+    timeout: Optional[float] = settings.REQUEST_TIMEOUT_MS / 1000 if settings.REQUEST_TIMEOUT_MS > 0 else None
+    for rule in _route_timeouts:
+        if rule.method == method and rule.pattern.fullmatch(p):
+            timeout = rule.seconds
+            break
+    if header is not None and settings.REQUEST_TIMEOUT_HEADER and header.isdigit():
+        requested = int(header) / 1000
+        if requested > 0 and (timeout is None or requested < timeout):
+            timeout = requested
+    return timeout
+
+
+def remaining(ctx: Optional[RequestContext] = None) -> Optional[float]:
+    """남은 시간(초, 음수 가능). 요청 밖이거나 데드라인이 없으면 None."""
+    if ctx is None:
+        ctx = request_ctx.get()
+    if ctx is None or ctx.deadline is None:
+        return None
+    return ctx.deadline - time.perf_counter()
+
+
+def deadline_exceeded(stage: str) -> DeadlineExceeded:
+    DEADLINE_EXCEEDED.inc((stage,))
+    return DeadlineExceeded(stage)
+
+
+def check_deadline(stage: str, ctx: Optional[RequestContext] = None) -> None:
+    """이미 지났으면 DeadlineExceeded. 새 작업(스레드·SQL·외부 호출) 시작 직전에 호출."""
+    left = remaining(ctx)
+    if left is not None and left <= 0:
+        raise deadline_exceeded(stage)
+
+
+def bounded(stage: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """async 함수 데코레이터. 남은 시간을 넘기면 취소하고 DeadlineExceeded. 함수 자체의 타임아웃(소켓 등)은 그대로 유지."""
+
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            left = remaining()
+            if left is None:
+                return await fn(*args, **kwargs)
+            if left <= 0:
+                raise deadline_exceeded(stage)
+            # asyncio.timeout은 3.11+ → wait_for(pyproject python ^3.8). 함수 자체 타임아웃과는 데드라인 경과 여부로 구분
+            try:
+                return await asyncio.wait_for(fn(*args, **kwargs), left)
+            except asyncio.TimeoutError:
+                left = remaining()
+                if left is not None and left <= 0:
+                    raise deadline_exceeded(stage) from None
+                raise
+
+        return wrapper
+
+    return decorator
+
+
+def timeout_response() -> Response:
+    # app.common → 로깅 설정 → 파이프라인 → 이 모듈 순환을 피하려고 호출 시 import(app.db가 먼저 로드되는 Alembic 등)
+    from app.common import ApiCode
+
+    return JSONResponse(status_code=504, content={"code": ApiCode.REQUEST_TIMEOUT.value, "data": None})
@@ -1,5 +1,6 @@
-# 전역 예외 핸들러. RequestValidationError, HTTPException, DB 예외 → { code, data } 통일.
+# 전역 예외 핸들러. RequestValidationError, HTTPException, DB 예외, 데드라인 초과, 서킷 OPEN → { code, data } 통일.
 import logging
+import math
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
@@ -7,7 +8,10 @@ from fastapi.responses import JSONResponse
 from sqlalchemy.exc import IntegrityError, OperationalError
 
 from app.common import ApiCode
+from app.core.deadline import DEADLINE_EXCEEDED, DeadlineExceeded, timeout_response
 from app.db import get_connection
+from app.db.statement_timeout import MYSQL_QUERY_TIMEOUT
+from app.infra.circuit_breaker import CircuitOpenError
 from app.posts.model import PostsModel
 
 logger = logging.getLogger(__name__)
@@ -97,9 +101,30 @@ def register_exception_handlers(app: FastAPI) -> None:
             return JSONResponse(status_code=409, content={"code": ApiCode.CONSTRAINT_ERROR.value, "data": None})
         return JSONResponse(status_code=400, content={"code": ApiCode.INVALID_REQUEST.value, "data": None})
 
+    @app.exception_handler(DeadlineExceeded)
+    async def deadline_exceeded_handler(request: Request, exc: DeadlineExceeded):
+        request_id = getattr(request.state, "request_id", "")
+        logger.warning("request_id=%s deadline exceeded: path=%s stage=%s", request_id, request.url.path, exc)
+        return timeout_response()
+
+    @app.exception_handler(CircuitOpenError)
+    async def circuit_open_handler(request: Request, exc: CircuitOpenError):
+        retry_after = max(1, math.ceil(exc.retry_after))
+        return JSONResponse(
+            status_code=503,
+            content={"code": ApiCode.DEPENDENCY_UNAVAILABLE.value, "data": {"dependency": exc.name}},
+            headers={"Retry-After": str(retry_after)},
+        )
+
     @app.exception_handler(OperationalError)
     async def operational_error_handler(request: Request, exc: OperationalError):
         request_id = getattr(request.state, "request_id", "")
+        orig = getattr(exc, "orig", None)
+        if orig is not None and getattr(orig, "args", None) and orig.args[0] == MYSQL_QUERY_TIMEOUT:
+            # MAX_EXECUTION_TIME 힌트(요청 데드라인)로 서버가 중단한 SELECT
+            DEADLINE_EXCEEDED.inc(("mysql",))
+            logger.warning("request_id=%s query interrupted by MAX_EXECUTION_TIME: path=%s", request_id, request.url.path)
+            return timeout_response()
         logger.exception(
             "request_id=%s DB OperationalError: path=%s exception=%s: %s",
             request_id,
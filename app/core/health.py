@@ -0,0 +1,134 @@
+# 헬스·준비 상태. /health/live: 프로세스·이벤트 루프 생존만(의존성 조회 없음). /health/ready·/health: 백그라운드 프로버가 캐시한 결과만 반환.
+# 프로버: HEALTH_CHECK_INTERVAL마다 writer·reader SELECT 1(전용 프로브 연결), Redis PING, 풀 포화도 → 캐시. ALB 프로브가 요청 트래픽과 커넥션·스레드를 다투지 않음.
+# 준비 = 시작 워밍업(풀 prefill + 핫 조회 쿼리 1회 실행으로 컴파일 캐시 적재) 완료 + writer 정상 + 결과가 오래되지 않음.
+# reader·Redis 장애, 풀 포화는 degraded 목록에만 표시(대체 경로·부하 차단이 따로 있으므로 트래픽을 빼지 않음).
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+log = logging.getLogger(__name__)
+
+
+class HealthState:
+    """프로버가 이벤트 루프에서 갱신, 엔드포인트가 읽기만 함."""
+
+    def __init__(self) -> None:
+        self.warmed = False
+        self.writer: Optional[bool] = None
+        self.reader: Optional[bool] = None
+        self.redis = "unknown"
+        self.pools: Dict[str, float] = {}
+        self.checked_at: Optional[float] = None
+
+    def age(self) -> Optional[float]:
+        return None if self.checked_at is None else time.monotonic() - self.checked_at
+
+    def stale(self) -> bool:
+        age = self.age()
+        return age is None or age > max(3 * settings.HEALTH_CHECK_INTERVAL, 15.0)
+
+    def ready(self) -> bool:
+        return self.warmed and bool(self.writer) and not self.stale()
+
+    def degraded(self) -> List[str]:
+        items: List[str] = []
+        if self.reader is False:
+            items.append("reader")
+        if self.redis == "down":
+            items.append("redis")
+        items.extend(f"pool.{name}" for name, ratio in self.pools.items() if ratio >= settings.HEALTH_POOL_SATURATION)
+        return items
+
+
+health_state = HealthState()
+
+
+def warm_up() -> None:
+    """풀 prefill + 핫 조회 쿼리 1회 실행(reader 엔진 컴파일 캐시·ORM 로더 경로 적재). 실패 시 예외 → 다음 주기에 재시도."""
+    from app.comments.model import CommentsModel
+    from app.db import SessionLocalReader, prefill_pools
+    from app.posts.model import PostsModel
+
+    prefill_pools()
+    with SessionLocalReader() as db:
+        PostsModel.get_all_posts(1, 1, db=db)
+        PostsModel.get_posts_count(db=db)
+        PostsModel.get_post_by_id(0, db=db)
+        CommentsModel.get_comments_by_post_id(0, 1, 1, db=db)
+
+
+def _pool_saturation() -> Dict[str, float]:
+    """엔진별 사용 중 연결 / 최대 연결(pool_size+max_overflow)."""
+    from app.db import connection_capacity, get_pool_stats
+
+    capacity = max(1, connection_capacity())
+    return {name: round(stats["checked_out"] / capacity, 3) for name, stats in get_pool_stats().items()}
+
+
+async def _redis_status(app) -> str:
+    redis = getattr(app.state, "redis", None)
+    if redis is None:
+        return "disabled"
+    try:
+        await asyncio.wait_for(redis.ping(), timeout=settings.REDIS_SOCKET_TIMEOUT)
+        return "ok"
+    except Exception:
+        return "down"
+
+
+async def probe(app) -> None:
+    """1회 점검. 블로킹 DB 작업은 기본 executor 스레드에서(요청용 AnyIO 스레드풀 토큰을 쓰지 않음)."""
+    from app.db import probe_databases
+
+    state = health_state
+    if not state.warmed:
+        try:
+            await asyncio.to_thread(warm_up)
+            state.warmed = True
+            log.info("워밍업 완료(풀 prefill·핫 쿼리)")
+        except Exception as e:
+            log.warning("워밍업 실패, 다음 점검에서 재시도: %s", e)
+    databases = await asyncio.to_thread(probe_databases)
+    state.writer = databases.get("writer", False)
+    state.reader = databases.get("reader", False)
+    state.redis = await _redis_status(app)
+    state.pools = _pool_saturation()
+    state.checked_at = time.monotonic()
+
+
+async def run_health_loop(app, stop_event: asyncio.Event) -> None:
+    interval = max(1.0, settings.HEALTH_CHECK_INTERVAL)
+    while not stop_event.is_set():
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            try:
+                await probe(app)
+            except Exception as e:
+                log.warning("헬스 점검 실패: %s", e)
+
+
+def readiness() -> Tuple[int, Dict[str, Any]]:
+    """(HTTP 상태, {code, data}). writer 장애 503 DB_ERROR, 워밍업 전·결과 만료 503 NOT_READY."""
+    from app.common import ApiCode
+    from app.infra.circuit_breaker import breaker_states
+
+    state = health_state
+    age = state.age()
+    data: Dict[str, Any] = {
+        "status": "ok",
+        "database": "connected" if state.writer else "disconnected",
+        "warmed": state.warmed,
+        "degraded": state.degraded(),
+        "checks": {"writer": state.writer, "reader": state.reader, "redis": state.redis, "pools": state.pools},
+        "checked_seconds_ago": None if age is None else round(age, 3),
+        "breakers": breaker_states(),
+    }
+    if state.ready():
+        return 200, {"code": ApiCode.OK.value, "data": data}
+    data["status"] = "degraded"
+    code = ApiCode.DB_ERROR if state.writer is False else ApiCode.NOT_READY
+    return 503, {"code": code.value, "data": data}
@@ -0,0 +1,97 @@
+# 이벤트 루프 지연(lag) 모니터. 루프 안 태스크가 LOOP_LAG_INTERVAL마다 깨어나 예정 대비 지연을 히스토그램(event_loop_lag_seconds)에 기록하고 하트비트 갱신.
+# 감시 스레드가 하트비트가 LOOP_BLOCK_THRESHOLD_MS 넘게 멈춘 것을 보면 그 순간 루프 스레드 스택(sys._current_frames)을 캡처 = 루프를 막고 있는 코드.
+# LOOP_BLOCK_STRICT=true면 테스트 픽스처가 캡처된 차단 이벤트를 테스트 실패로 전환(async 라우트의 동기 DB·bcrypt 호출 회귀 방지).
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.context import inflight
+from app.core.memory import register_cache_size
+from app.core.metrics import LabeledHistogram, register
+
+log = logging.getLogger(__name__)
+
+LOOP_LAG = register(
+    LabeledHistogram(
+        "event_loop_lag_seconds",
+        "이벤트 루프 스케줄링 지연(초)",
+        buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+    )
+)
+
+blocking_events: Deque[Dict[str, Any]] = deque(maxlen=max(1, settings.LOOP_BLOCK_MAX_EVENTS))
+# 누적 차단 이벤트 수(링 버퍼와 달리 줄지 않음). 테스트 픽스처가 전후 비교
+blocking_count = 0
+register_cache_size("loop_monitor.blocking_events", lambda: len(blocking_events))
+
+
+def _request_ids_on_loop(loop_thread_id: int) -> List[str]:
+    """루프 스레드에서 처리 중이던(스레드풀로 넘어가지 않은) 요청 request_id. 어떤 요청이 막았는지 좁히는 참고값."""
+    return [ctx.request_id for ctx in list(inflight.values()) if ctx.thread_id == loop_thread_id]
+
+
+class LoopMonitor:
+    def __init__(self, interval: float, threshold_ms: float) -> None:
+        self.interval = max(0.005, interval)
+        self.threshold = threshold_ms / 1000
+        self.last_beat = time.monotonic()
+        self._loop_thread_id: Optional[int] = None
+        self._stop = threading.Event()
+        self._watcher: Optional[threading.Thread] = None
+
+    async def run(self, stop_event: asyncio.Event) -> None:
+        """루프 안에서 실행. interval 만큼 잠든 뒤 실제 경과 - interval = lag."""
+        self._loop_thread_id = threading.get_ident()
+        self.last_beat = time.monotonic()
+        self._watcher = threading.Thread(target=self._watch, name="loop-block-watcher", daemon=True)
+        self._watcher.start()
+        try:
+            while not stop_event.is_set():
+                expected = time.monotonic() + self.interval
+                await asyncio.sleep(self.interval)
+                now = time.monotonic()
+                lag = max(0.0, now - expected)
+                LOOP_LAG.observe((), lag)
+                self.last_beat = now
+        finally:
+            self._stop.set()
+            self._watcher.join(timeout=5)
+
+    def _watch(self) -> None:
+        """하트비트 정지 감시. 정상 상태에서도 하트비트 간격은 interval이므로 그 초과분이 threshold 이상일 때만. 같은 정지 구간(last_beat 동일)은 1회만 캡처."""
+        global blocking_count
+        reported_beat = None
+        poll = max(0.005, min(self.interval, self.threshold / 2))
+        while not self._stop.wait(poll):
+            beat = self.last_beat
+            stalled = time.monotonic() - beat - self.interval
+            if stalled < self.threshold or beat == reported_beat:
+                continue
+            reported_beat = beat
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            event = {
+                "stalled_ms": round(stalled * 1000, 1),
+                "stack": traceback.format_stack(frame),
+                "request_ids": _request_ids_on_loop(self._loop_thread_id),
+                "captured_at": time.time(),
+            }
+            blocking_events.append(event)
+            blocking_count += 1
+            log.warning(
+                "event loop blocked %.1fms request_ids=%s\n%s",
+                event["stalled_ms"],
+                event["request_ids"],
+                "".join(event["stack"][-8:]),
+            )
+
+
+def loop_report() -> Dict[str, Any]:
+    return {"blocking_events": list(reversed(blocking_events))}
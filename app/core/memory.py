@@ -0,0 +1,139 @@
+# 메모리 진단. tracemalloc 온디맨드 시작·기준 스냅샷 대비 diff·상위 할당 위치, 프로세스 RSS, 알려진 인메모리 캐시 크기 → /admin/memory.
+# RSS 기반 워커 재시작(선택): WORKER_MAX_RSS_MB 초과 시 자신에게 SIGTERM → Gunicorn(UvicornWorker)이 진행 중 요청을 마친 뒤 새 워커로 교체.
+# 진단 값은 워커(프로세스) 단위.
+import asyncio
+import logging
+import os
+import signal
+import tracemalloc
+from typing import Any, Callable, Dict, Optional
+
+from app.core.config import settings
+
+log = logging.getLogger(__name__)
+
+# 추적 노이즈 제외(tracemalloc 자체·import 시스템)
+_SNAPSHOT_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+]
+
+_cache_sizes: Dict[str, Callable[[], int]] = {}
+_baseline: Optional[tracemalloc.Snapshot] = None
+
+
+def register_cache_size(name: str, size_fn: Callable[[], int]) -> None:
+    """인메모리 캐시 크기(항목 수) 보고 함수 등록. 모듈 로드 시 1회 호출."""
+    _cache_sizes[name] = size_fn
+
+
+def cache_sizes() -> Dict[str, int]:
+    result: Dict[str, int] = {}
+    for name, size_fn in _cache_sizes.items():
+        try:
+            result[name] = int(size_fn())
+        except Exception:
+            result[name] = -1
+    return result
+
+
+def rss_bytes() -> int:
+    """현재 RSS. Linux는 /proc/self/statm, 그 외는 최대 RSS(ru_maxrss)로 대체, 실패 시 0."""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+        import sys
+
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return maxrss if sys.platform == "darwin" else maxrss * 1024
+    except (ImportError, OSError):
+        return 0
+
+
+def _take_snapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+
+
+def start_tracing() -> None:
+    """추적 시작 + 기준 스냅샷. 추적 중에는 할당마다 오버헤드가 있으므로 진단이 끝나면 stop_tracing."""
+    global _baseline
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(max(1, settings.MEMORY_TRACE_FRAMES))
+    _baseline = _take_snapshot()
+
+
+def stop_tracing() -> None:
+    global _baseline
+    _baseline = None
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def reset_baseline() -> bool:
+    global _baseline
+    if not tracemalloc.is_tracing():
+        return False
+    _baseline = _take_snapshot()
+    return True
+
+
+def _format_stat(stat: Any) -> Dict[str, Any]:
+    frames = [f"{frame.filename}:{frame.lineno}" for frame in stat.traceback]
+    entry: Dict[str, Any] = {"location": frames[-1] if frames else "", "size": stat.size, "count": stat.count}
+    if len(frames) > 1:
+        entry["traceback"] = frames
+    if hasattr(stat, "size_diff"):
+        entry["size_diff"] = stat.size_diff
+        entry["count_diff"] = stat.count_diff
+    return entry
+
+
+def memory_report(limit: int = 20, group_by: str = "lineno") -> Dict[str, Any]:
+    """RSS·캐시 크기는 항상. 추적 중이면 현재 상위 할당 위치와 기준 대비 증가 상위(diff) 포함."""
+    report: Dict[str, Any] = {
+        "pid": os.getpid(),
+        "rss_bytes": rss_bytes(),
+        "caches": cache_sizes(),
+        "tracing": tracemalloc.is_tracing(),
+    }
+    if not tracemalloc.is_tracing():
+        return report
+    current, peak = tracemalloc.get_traced_memory()
+    snapshot = _take_snapshot()
+    report["traced_current_bytes"] = current
+    report["traced_peak_bytes"] = peak
+    report["top"] = [_format_stat(s) for s in snapshot.statistics(group_by)[:limit]]
+    if _baseline is not None:
+        diff = snapshot.compare_to(_baseline, group_by)
+        report["diff"] = [_format_stat(s) for s in diff[:limit] if s.size_diff > 0]
+    return report
+
+
+async def run_rss_watch_loop(stop_event: asyncio.Event) -> None:
+    """WORKER_RSS_CHECK_INTERVAL초마다 RSS 확인, WORKER_MAX_RSS_MB 초과 시 1회 SIGTERM(graceful) 후 종료.
+    Gunicorn 등 워커를 재생성하는 프로세스 관리자 아래에서만 켤 것(단독 uvicorn이면 서버가 종료됨)."""
+    limit = settings.WORKER_MAX_RSS_MB * 1024 * 1024
+    while not stop_event.is_set():
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=settings.WORKER_RSS_CHECK_INTERVAL)
+            return
+        except asyncio.TimeoutError:
+            pass
+        rss = rss_bytes()
+        if rss > limit:
+            log.warning(
+                "워커 RSS %.1fMB > 한도 %sMB. graceful 재시작 요청(pid=%s), 캐시=%s",
+                rss / 1024 / 1024,
+                settings.WORKER_MAX_RSS_MB,
+                os.getpid(),
+                cache_sizes(),
+            )
+            os.kill(os.getpid(), signal.SIGTERM)
+            return
+
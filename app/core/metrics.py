@@ -0,0 +1,133 @@
+# 인프로세스 메트릭 기본형. Histogram(고정 버킷 누적), 라벨별 Counter·Gauge·LabeledHistogram, 레지스트리. config 외 app 모듈 import 금지(db·middleware 어디서나 사용).
+import threading
+from bisect import bisect_left
+from typing import Dict, List, Sequence, Tuple, Union
+
+# 지연 시간(초) 기본 버킷. 1ms ~ 10s.
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# 응답 크기(바이트) 기본 버킷. 200B ~ 5MB.
+SIZE_BUCKETS = (200, 1000, 5000, 20000, 100000, 500000, 1000000, 5000000)
+
+Labels = Tuple[str, ...]
+
+
+class Histogram:
+    """고정 버킷 히스토그램. observe는 bisect 1회 + 락 안 카운터 증가만 수행."""
+
+    __slots__ = ("buckets", "_counts", "_sum", "_count", "_lock")
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        idx = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[idx] += 1
+            self._sum += value
+            self._count += 1
+
+    def snapshot(self) -> Dict[str, object]:
+        """{"buckets": {le: 누적 개수}, "sum", "count"}. 마지막 버킷은 +Inf."""
+        with self._lock:
+            counts = list(self._counts)
+            total_sum = self._sum
+            total_count = self._count
+        cumulative: Dict[str, int] = {}
+        running = 0
+        for le, c in zip(self.buckets, counts):
+            running += c
+            cumulative[repr(le)] = running
+        cumulative["+Inf"] = total_count
+        return {"buckets": cumulative, "sum": total_sum, "count": total_count}
+
+
+class _LabeledMetric:
+    """라벨 값 튜플 → 값. collect()는 {"type", "help", "labelnames", "samples": [[라벨 값 목록, 값]]}."""
+
+    type_name = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _samples(self) -> List[list]:
+        raise NotImplementedError
+
+    def collect(self) -> Dict[str, object]:
+        return {"type": self.type_name, "help": self.help, "labelnames": list(self.labelnames), "samples": self._samples()}
+
+
+class Counter(_LabeledMetric):
+    type_name = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, help_text, labelnames)
+        self._values: Dict[Labels, float] = {}
+
+    def inc(self, labels: Labels = (), amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def _samples(self) -> List[list]:
+        with self._lock:
+            return [[list(k), v] for k, v in self._values.items()]
+
+
+class Gauge(Counter):
+    """현재값(in-flight 등). 멀티프로세스 병합 시 살아 있는 프로세스 값만 합산."""
+
+    type_name = "gauge"
+
+    def dec(self, labels: Labels = (), amount: float = 1.0) -> None:
+        self.inc(labels, -amount)
+
+    def set(self, labels: Labels, value: float) -> None:
+        with self._lock:
+            self._values[labels] = value
+
+
+class LabeledHistogram(_LabeledMetric):
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(buckets)
+        self._children: Dict[Labels, Histogram] = {}
+
+    def observe(self, labels: Labels, value: float) -> None:
+        child = self._children.get(labels)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(labels, Histogram(self.buckets))
+        child.observe(value)
+
+    def _samples(self) -> List[list]:
+        with self._lock:
+            items = list(self._children.items())
+        return [[list(k), h.snapshot()] for k, h in items]
+
+
+Metric = Union[Counter, Gauge, LabeledHistogram]
+_REGISTRY: Dict[str, Metric] = {}
+
+
+def register(metric: Metric) -> Metric:
+    """이름 기준 1회 등록. 같은 이름 재등록 시 기존 객체 반환(모듈 재import 대비)."""
+    return _REGISTRY.setdefault(metric.name, metric)
+
+
+def collect_all() -> Dict[str, Dict[str, object]]:
+    """{메트릭 이름: collect()} 현재 프로세스 값."""
+    return {name: m.collect() for name, m in list(_REGISTRY.items())}
@@ -0,0 +1,257 @@
+# 메트릭 노출. 워커별 스냅샷 파일(METRICS_MULTIPROC_DIR/<pid>-<시작 시각>.json) 기록·병합, Prometheus 텍스트 포맷 렌더링.
+# 요청 경로는 인메모리 갱신만 하고 파일 I/O는 주기 태스크에서만 수행(요청당 오버헤드 없음).
+# 종료된 워커 파일은 주기 태스크가 누적 파일(_accumulated.json)에 합친 뒤 삭제 → 재시작이 반복돼도 파일 수·스크레이프 비용이 늘지 않고, PID 재사용에도 합계가 줄지 않음.
+import asyncio
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from app.core.config import settings
+from app.core.metrics import collect_all
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover (Windows: 종료된 워커 파일 정리 없음)
+    fcntl = None
+
+log = logging.getLogger(__name__)
+
+_ACCUMULATOR = "_accumulated.json"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _snapshot_dir() -> Optional[Path]:
+    if not settings.METRICS_MULTIPROC_DIR:
+        return None
+    return Path(settings.METRICS_MULTIPROC_DIR)
+
+
+def _proc_start(pid: Union[int, str]) -> str:
+    """프로세스 시작 시각(/proc/<pid>/stat starttime, 부팅 후 클럭 틱). /proc 없으면 빈 문자열."""
+    try:
+        stat = Path(f"/proc/{pid}/stat").read_text()
+    except OSError:
+        return ""
+    # comm(2번째 필드)에 공백·괄호가 있을 수 있어 마지막 ')' 뒤부터 분리. starttime은 22번째 필드
+    return stat.rsplit(")", 1)[1].split()[19]
+
+
+_own: Tuple[int, str] = (0, "")
+
+
+def _own_identity() -> Tuple[int, str]:
+    """(pid, 시작 시각). fork(gunicorn preload) 후에도 맞도록 pid가 바뀌면 다시 계산."""
+    global _own
+    pid = os.getpid()
+    if _own[0] != pid:
+        _own = (pid, _proc_start("self") or str(int(time.time() * 1000)))
+    return _own
+
+
+def _own_name() -> str:
+    """파일명 <pid>-<시작 시각>: PID가 재사용돼도 이전 프로세스 파일과 구분."""
+    pid, start = _own_identity()
+    return f"{pid}-{start}.json"
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _alive(pid: int, start: str) -> bool:
+    """pid가 살아 있고 같은 프로세스(시작 시각 일치)인지. 시작 시각을 모르면 pid만 확인."""
+    if not _pid_alive(pid):
+        return False
+    current = _proc_start(pid)
+    return not (start and current) or current == start
+
+
+def write_snapshot() -> None:
+    """현재 프로세스 메트릭을 <pid>-<start>.json으로 원자적 기록(임시 파일 → rename) 후 종료된 워커 파일 정리."""
+    directory = _snapshot_dir()
+    if directory is None:
+        return
+    directory.mkdir(parents=True, exist_ok=True)
+    pid, start = _own_identity()
+    name = _own_name()
+    target = directory / name
+    tmp = directory / f".{name}.tmp"
+    data = {"pid": pid, "start": start, "metrics": collect_all()}
+    tmp.write_text(json.dumps(data), encoding="utf-8")
+    os.replace(tmp, target)
+    fold_dead_snapshots(directory)
+
+
+async def run_snapshot_loop(stop_event: asyncio.Event) -> None:
+    """METRICS_FLUSH_INTERVAL 주기로 스냅샷 기록. 종료 시 마지막 1회 기록."""
+    interval = max(1, settings.METRICS_FLUSH_INTERVAL)
+    while not stop_event.is_set():
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=float(interval))
+        except asyncio.TimeoutError:
+            pass
+        try:
+            await asyncio.to_thread(write_snapshot)
+        except Exception as e:
+            log.warning("메트릭 스냅샷 기록 실패: %s", e)
+
+
+def _read_json(path: Path) -> Optional[dict]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        log.warning("메트릭 스냅샷 읽기 실패 %s: %s", path, e)
+        return None
+
+
+def _worker_files(directory: Path) -> Iterator[Tuple[Path, dict]]:
+    """다른 워커 스냅샷(누적 파일·자기 파일 제외)."""
+    skip = (_own_name(), _ACCUMULATOR)
+    for path in directory.glob("*.json"):
+        if path.name in skip:
+            continue
+        data = _read_json(path)
+        if data is not None:
+            yield path, data
+
+
+def _dead(data: dict) -> bool:
+    return not _alive(int(data.get("pid", 0)), str(data.get("start", "")))
+
+
+def fold_dead_snapshots(directory: Path) -> int:
+    """종료된 워커 파일의 counter·histogram을 누적 파일(_accumulated.json)에 합치고 삭제 → 파일 수가 워커 재시작마다 늘지 않음.
+    여러 워커가 동시에 실행해도 디렉터리 잠금(flock, 비차단)으로 1개만 수행. 누적 파일에 합친 파일명을 기록해 삭제 전 중단돼도 이중 합산 없음."""
+    if fcntl is None:
+        return 0
+    with open(directory / ".fold.lock", "a") as lock:
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            return 0
+        accumulated = _read_json(directory / _ACCUMULATOR) or {"metrics": {}, "folded": []}
+        folded = set(accumulated.get("folded", ()))
+        dead = [(path, data) for path, data in _worker_files(directory) if path.name in folded or _dead(data)]
+        fresh = [(path, data) for path, data in dead if path.name not in folded]
+        if fresh:
+            merged = merge_snapshots([(False, accumulated["metrics"])] + [(False, d.get("metrics", {})) for _, d in fresh])
+            # 이번에 삭제할 파일명만 유지(목록이 계속 늘지 않음)
+            accumulated = {"metrics": _to_snapshot(merged), "folded": sorted(p.name for p, _ in dead)}
+            tmp = directory / f".{_ACCUMULATOR}.tmp"
+            tmp.write_text(json.dumps(accumulated), encoding="utf-8")
+            os.replace(tmp, directory / _ACCUMULATOR)
+        for path, _ in dead:
+            path.unlink(missing_ok=True)
+        return len(fresh)
+
+
+def _load_snapshots() -> List[Tuple[bool, Dict[str, dict]]]:
+    """(살아 있는지, 메트릭). 현재 프로세스는 인메모리 최신값, 종료된 워커는 누적 파일 + 아직 합치지 않은 파일."""
+    result: List[Tuple[bool, Dict[str, dict]]] = [(True, collect_all())]
+    directory = _snapshot_dir()
+    if directory is None or not directory.is_dir():
+        return result
+    with open(directory / ".fold.lock", "a") as lock:
+        # 합치는 중(누적 파일 갱신 ~ 삭제 사이)에 읽으면 같은 워커가 빠지거나 두 번 셀 수 있으므로 공유 잠금
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_SH)
+        accumulated = _read_json(directory / _ACCUMULATOR) or {"metrics": {}, "folded": []}
+        folded = set(accumulated.get("folded", ()))
+        result.append((False, accumulated["metrics"]))
+        for path, data in _worker_files(directory):
+            if path.name not in folded:
+                result.append((not _dead(data), data.get("metrics", {})))
+    return result
+
+
+def _merge_histogram(into: dict, snap: dict) -> None:
+    buckets = into["buckets"]
+    for le, count in snap["buckets"].items():
+        buckets[le] = buckets.get(le, 0) + count
+    into["sum"] += snap["sum"]
+    into["count"] += snap["count"]
+
+
+def merge_snapshots(snapshots: List[Tuple[bool, Dict[str, dict]]]) -> Dict[str, dict]:
+    """counter·histogram은 종료된 워커 포함 전부 합산(단조 증가 유지), gauge는 살아 있는 워커만 합산."""
+    merged: Dict[str, dict] = {}
+    for alive, metrics in snapshots:
+        for name, family in metrics.items():
+            kind = family["type"]
+            if kind == "gauge" and not alive:
+                continue
+            out = merged.setdefault(
+                name,
+                {"type": kind, "help": family["help"], "labelnames": family["labelnames"], "values": {}},
+            )
+            values = out["values"]
+            for labels, value in family["samples"]:
+                key = tuple(labels)
+                if kind == "histogram":
+                    current = values.setdefault(key, {"buckets": {}, "sum": 0.0, "count": 0})
+                    _merge_histogram(current, value)
+                else:
+                    values[key] = values.get(key, 0.0) + value
+    return merged
+
+
+def _to_snapshot(merged: Dict[str, dict]) -> Dict[str, dict]:
+    """merge_snapshots 결과 → collect_all 형식(누적 파일 저장용)."""
+    return {
+        name: {
+            "type": family["type"],
+            "help": family["help"],
+            "labelnames": family["labelnames"],
+            "samples": [[list(key), value] for key, value in family["values"].items()],
+        }
+        for name, family in merged.items()
+    }
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: List[str], values: Tuple[str, ...], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _number(value: float) -> str:
+    return repr(int(value)) if float(value).is_integer() else repr(value)
+
+
+def render_metrics() -> str:
+    """전체 워커 병합 결과를 Prometheus 텍스트 노출 포맷으로 렌더링."""
+    merged = merge_snapshots(_load_snapshots())
+    lines: List[str] = []
+    for name in sorted(merged):
+        family = merged[name]
+        names = family["labelnames"]
+        lines.append(f"# HELP {name} {family['help']}")
+        lines.append(f"# TYPE {name} {family['type']}")
+        for key in sorted(family["values"]):
+            value = family["values"][key]
+            if family["type"] != "histogram":
+                lines.append(f"{name}{_labels(names, key)} {_number(value)}")
+                continue
+            buckets = value["buckets"]
+            for le in sorted(buckets, key=lambda b: float("inf") if b == "+Inf" else float(b)):
+                le_label = 'le="%s"' % le
+                lines.append(f"{name}_bucket{_labels(names, key, le_label)} {buckets[le]}")
+            lines.append(f"{name}_sum{_labels(names, key)} {_number(value['sum'])}")
+            lines.append(f"{name}_count{_labels(names, key)} {value['count']}")
+    return "\n".join(lines) + "\n"
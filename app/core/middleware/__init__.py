@@ -1,14 +1,16 @@
-from .access_log import access_log_middleware
-from .proxy_headers import proxy_headers_middleware
-from .rate_limit import get_client_ip, rate_limit_middleware
-from .request_id import request_id_middleware
-from .security_headers import security_headers_middleware
+from .compression import CompressionMiddleware, compression_bulkhead
+from .deadline import DeadlineMiddleware
+from .pipeline import RequestPipelineMiddleware
+from .profiling import ProfilerMiddleware
+from .rate_limit import get_client_ip
+from .server_timing import ServerTimingMiddleware
 
 __all__ = [
-    "access_log_middleware",
+    "CompressionMiddleware",
+    "compression_bulkhead",
+    "DeadlineMiddleware",
+    "ProfilerMiddleware",
+    "RequestPipelineMiddleware",
+    "ServerTimingMiddleware",
     "get_client_ip",
-    "proxy_headers_middleware",
-    "rate_limit_middleware",
-    "request_id_middleware",
-    "security_headers_middleware",
 ]
@@ -1,77 +1,78 @@
-# 4xx/5xx·슬로우 요청 접근 로그. request_id, Method, Path, Status, 소요 시간. 4xx→WARNING, 5xx→ERROR.
+# 4xx/5xx·슬로우 요청 접근 로그. request_id, Method, Path, Status, 소요 시간. 4xx→WARNING, 5xx→ERROR. RequestPipelineMiddleware에서 호출.
+# 같은 필드를 extra로도 넘겨 LOG_FORMAT=json일 때 route·status·duration_ms가 개별 필드로 출력됨.
 import logging
-import time
-from typing import Awaitable, Callable
-
-from starlette.requests import Request
-from starlette.responses import Response
 
 from app.core.config import settings
-from app.core.middleware.rate_limit import get_client_ip
 
 _access_logger = logging.getLogger("app.access")
 
 
-async def access_log_middleware(
-    request: Request,
-    call_next: Callable[[Request], Awaitable[Response]],
-) -> Response:
-    """요청 전 구간 시간 측정, call_next 실행. 예외 시 traceback 포함 ERROR 로그 후 재발생. DEBUG 시 X-Process-Time 헤더."""
-    start = time.perf_counter()
-    try:
-        response = await call_next(request)
-    except Exception as exc:
-        duration_ms = (time.perf_counter() - start) * 1000
-        request_id = getattr(request.state, "request_id", "")
-        client_ip = get_client_ip(request)
-        _access_logger.exception(
-            "request_id=%s method=%s path=%s duration_ms=%.2f client_ip=%s exception=%s",
-            request_id,
-            request.method,
-            request.url.path,
-            duration_ms,
-            client_ip,
-            exc,
-        )
-        raise
+def _extra(method: str, path: str, route: str, status: int, duration_ms: float, client_ip: str) -> dict:
+    return {
+        "method": method,
+        "path": path,
+        "route": route,
+        "status": status,
+        "duration_ms": round(duration_ms, 2),
+        "client_ip": client_ip,
+    }
+
 
-    duration_ms = (time.perf_counter() - start) * 1000
-    request_id = getattr(request.state, "request_id", "")
-    client_ip = get_client_ip(request)
+def log_exception(
+    request_id: str, method: str, path: str, route: str, duration_ms: float, client_ip: str, exc: BaseException
+) -> None:
+    """처리 중 예외. traceback 포함 ERROR 로그(except 블록 안에서 호출). 반복 예외는 로깅 설정의 LogRateLimitFilter가 억제."""
+    _access_logger.exception(
+        "request_id=%s method=%s path=%s duration_ms=%.2f client_ip=%s exception=%s",
+        request_id,
+        method,
+        path,
+        duration_ms,
+        client_ip,
+        exc,
+        extra=_extra(method, path, route, 500, duration_ms, client_ip),
+    )
 
-    if settings.DEBUG:
-        response.headers["X-Process-Time"] = f"{duration_ms:.2f}"
 
-    if response.status_code >= 500:
+def log_access(
+    request_id: str, method: str, path: str, route: str, status: int, duration_ms: float, client_ip: str
+) -> None:
+    """2xx·3xx이고 SLOW_REQUEST_MS 미만이면 로그 없음."""
+    slow = duration_ms >= settings.SLOW_REQUEST_MS
+    if status < 400 and not slow:
+        return
+    extra = _extra(method, path, route, status, duration_ms, client_ip)
+    if status >= 500:
         _access_logger.error(
             "request_id=%s method=%s path=%s status=%s duration_ms=%.2f client_ip=%s",
             request_id,
-            request.method,
-            request.url.path,
-            response.status_code,
+            method,
+            path,
+            status,
             duration_ms,
             client_ip,
+            extra=extra,
         )
-    elif response.status_code >= 400:
+    elif status >= 400:
         _access_logger.warning(
             "request_id=%s method=%s path=%s status=%s duration_ms=%.2f client_ip=%s",
             request_id,
-            request.method,
-            request.url.path,
-            response.status_code,
+            method,
+            path,
+            status,
             duration_ms,
             client_ip,
+            extra=extra,
         )
 
-    if duration_ms >= settings.SLOW_REQUEST_MS:
+    if slow:
         _access_logger.warning(
             "slow request_id=%s method=%s path=%s status=%s duration_ms=%.2f client_ip=%s",
             request_id,
-            request.method,
-            request.url.path,
-            response.status_code,
+            method,
+            path,
+            status,
             duration_ms,
             client_ip,
+            extra=extra,
         )
-
-    return response
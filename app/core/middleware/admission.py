@@ -0,0 +1,175 @@
+# 적응형 동시성 제한(부하 차단). 라우트의 DB 의존성으로 분류한 읽기(get_slave_db·DB 없음)·쓰기(get_master_db, 하위 의존성 포함) 클래스별 동시 처리 한도를 AIMD로 조정.
+# 메서드가 아니라 의존성 기준: GET이라도 Writer 세션을 쓰면 쓰기 한도(커넥션 풀이 다름), GET /v1/auth/me처럼 Reader만 쓰면 읽기 한도.
+# 완료 요청이 ADMISSION_LATENCY_TARGET_MS 이내·5xx 아님 → 한도 +1/limit(한도의 절반 이상 사용 중일 때만), 초과·5xx → 한도 × ADMISSION_BACKOFF(목표 시간당 최대 1회).
+# 한도를 넘는 요청은 스레드풀·커넥션 풀에서 타임아웃까지 줄 서지 않고 즉시 503 SERVICE_OVERLOADED + Retry-After.
+# 매칭된 라우트가 필요하므로 미들웨어가 아닌 라우트 단계(AdmissionRoute, RenderedRoute가 상속): /health·/metrics·/admin(기본 APIRoute)·CORS 프리플라이트는 대상 아님.
+# FastAPI include_router는 라우트를 복사하지 않고 get_route_handler로 핸들러를 만들므로 route.app 교체가 아닌 get_route_handler에서 감쌈.
+# 이벤트 루프 스레드에서만 호출(라우트 핸들러)하므로 락 없음. 한도는 워커(프로세스) 단위.
+import time
+from typing import Any, Callable, Dict, Set
+
+from fastapi.dependencies.models import Dependant
+from fastapi.exceptions import RequestValidationError
+from fastapi.routing import APIRoute
+from sqlalchemy.exc import IntegrityError
+from starlette.exceptions import HTTPException
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+from app.common import ApiCode
+from app.core.config import settings
+from app.core.metrics import Counter, Gauge, register
+
+ADMISSION_LIMIT = register(Gauge("admission_limit", "적응형 동시 처리 한도", ("class",)))
+ADMISSION_IN_FLIGHT = register(Gauge("admission_in_flight", "허용되어 처리 중인 요청 수", ("class",)))
+ADMISSION_REJECTED = register(Counter("admission_rejected_total", "동시성 한도 초과로 거절(503)한 요청 수", ("class",)))
+
+READ = "read"
+WRITE = "write"
+# 쓰기 한도로 분류할 의존성(get_master_db). app.api가 app.core를 가져오므로 등록 방식(순환 import 방지)
+_WRITE_DEPENDENCIES: Set[Callable[..., Any]] = set()
+
+
+def write_dependency(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """데코레이터. 이 의존성을 (하위 의존성으로라도) 쓰는 라우트는 쓰기 한도."""
+    _WRITE_DEPENDENCIES.add(fn)
+    return fn
+
+
+def uses_write_dependency(dependant: Dependant) -> bool:
+    return any(dep.call in _WRITE_DEPENDENCIES or uses_write_dependency(dep) for dep in dependant.dependencies)
+
+
+class AdaptiveLimit:
+    """AIMD 한도. try_acquire → (처리) → release(소요 초, 상태 코드)."""
+
+    def __init__(
+        self,
+        name: str,
+        initial: float,
+        min_limit: float,
+        max_limit: float,
+        latency_target: float,
+        backoff: float,
+    ) -> None:
+        self.name = name
+        self.min_limit = max(1.0, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = min(self.max_limit, max(self.min_limit, initial))
+        self.latency_target = latency_target
+        self.backoff = backoff
+        self.in_flight = 0
+        self._last_decrease = 0.0
+        self._labels = (name,)
+        ADMISSION_LIMIT.set(self._labels, self.limit)
+
+    def try_acquire(self) -> bool:
+        if self.in_flight >= int(self.limit):
+            ADMISSION_REJECTED.inc(self._labels)
+            return False
+        self.in_flight += 1
+        ADMISSION_IN_FLIGHT.set(self._labels, self.in_flight)
+        return True
+
+    def release(self, elapsed: float, status: int) -> None:
+        in_flight = self.in_flight
+        self.in_flight -= 1
+        ADMISSION_IN_FLIGHT.set(self._labels, self.in_flight)
+        if status >= 500 or elapsed > self.latency_target:
+            now = time.monotonic()
+            # 같은 혼잡으로 동시에 끝난 요청들이 한도를 연쇄적으로 깎지 않도록 목표 시간당 1회
+            if now - self._last_decrease < self.latency_target:
+                return
+            self._last_decrease = now
+            self.limit = max(self.min_limit, self.limit * self.backoff)
+        elif in_flight * 2 >= self.limit:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+        else:
+            return
+        ADMISSION_LIMIT.set(self._labels, self.limit)
+
+    def snapshot(self) -> Dict[str, float]:
+        return {"limit": round(self.limit, 2), "in_flight": self.in_flight}
+
+
+class AdmissionController:
+    def __init__(self) -> None:
+        target = settings.ADMISSION_LATENCY_TARGET_MS / 1000
+        self.limits = {
+            READ: AdaptiveLimit(
+                READ,
+                settings.ADMISSION_READ_INITIAL_LIMIT,
+                settings.ADMISSION_MIN_LIMIT,
+                settings.ADMISSION_READ_MAX_LIMIT,
+                target,
+                settings.ADMISSION_BACKOFF,
+            ),
+            WRITE: AdaptiveLimit(
+                WRITE,
+                settings.ADMISSION_WRITE_INITIAL_LIMIT,
+                settings.ADMISSION_MIN_LIMIT,
+                settings.ADMISSION_WRITE_MAX_LIMIT,
+                target,
+                settings.ADMISSION_BACKOFF,
+            ),
+        }
+
+    def classify(self, dependant: Dependant) -> AdaptiveLimit:
+        return self.limits[WRITE if uses_write_dependency(dependant) else READ]
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        return {name: limit.snapshot() for name, limit in self.limits.items()}
+
+
+def overloaded_response(retry_after_seconds: int) -> Response:
+    return JSONResponse(
+        status_code=503,
+        content={
+            "code": ApiCode.SERVICE_OVERLOADED.value,
+            "data": {"retry_after_seconds": retry_after_seconds},
+        },
+        headers={"Retry-After": str(retry_after_seconds)},
+    )
+
+
+admission = AdmissionController() if settings.ADMISSION_ENABLED else None
+
+
+def _status_of(exc: Exception) -> int:
+    """예외 핸들러(exception_handlers)가 만들 응답 상태. 클라이언트 오류(검증·중복)는 한도를 깎지 않음."""
+    if isinstance(exc, HTTPException):
+        return exc.status_code
+    if isinstance(exc, RequestValidationError):
+        return 400
+    if isinstance(exc, IntegrityError):
+        return 409
+    return 500
+
+
+class AdmissionRoute(APIRoute):
+    """라우터 route_class. 핸들러(의존성 해석·엔드포인트·직렬화) 전체를 라우트 분류의 한도 안에서 실행."""
+
+    def get_route_handler(self) -> Callable[[Request], Any]:
+        handler = super().get_route_handler()
+        if admission is None:
+            return handler
+        # 라우트 생성 후 의존성은 바뀌지 않으므로 분류는 1회
+        gate = admission.classify(self.dependant)
+        retry_after = settings.ADMISSION_RETRY_AFTER
+
+        async def admitted_handler(request: Request) -> Response:
+            if not gate.try_acquire():
+                return overloaded_response(retry_after)
+            status = 500
+            admitted = time.perf_counter()
+            try:
+                response = await handler(request)
+                status = response.status_code
+                return response
+            except Exception as exc:
+                status = _status_of(exc)
+                raise
+            finally:
+                gate.release(time.perf_counter() - admitted, status)
+
+        return admitted_handler
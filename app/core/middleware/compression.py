@@ -0,0 +1,210 @@
+# 응답 압축(순수 ASGI, 파이프라인 안쪽 → 메트릭·접근 로그의 응답 크기는 압축 후 값). Accept-Encoding 협상: br → gzip, q=0 제외.
+# JSON·MessagePack·텍스트 응답 중 COMPRESSION_MIN_SIZE 바이트 이상, 본문을 한 번에 보내는 응답만 압축(스트리밍·이미 인코딩된 응답·이미지는 그대로).
+# 응답 캐시는 없음(조회 결과를 캐시하는 계층이 이 코드베이스에 없음). 대신 압축 결과를 (인코딩, 본문 blake2b) 키 LRU(COMPRESSION_CACHE_MAX_BYTES)에 보관:
+# 같은 본문을 다시 보낼 때만 적중하며, 적중해도 본문 해시(압축 비용의 약 1/20)는 매번 계산. 0이면 해시·캐시 없이 매번 압축.
+# COMPRESSION_OFFLOAD_SIZE 이상 본문은 전용 벌크헤드 스레드에서 해시·압축(이벤트 루프 차단 없음). 구획이 차면 기다리지 않고 압축 없이 전송.
+# 측정: benchmarks/bench_compression.py
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import brotli
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.memory import register_cache_size
+from app.core.metrics import Counter, register
+from app.core.timing import span
+from app.infra.bulkhead import Bulkhead, BulkheadFull
+
+COMPRESSED = register(Counter("response_compressed_total", "압축 응답 수(cache=hit|miss)", ("encoding", "cache")))
+COMPRESSION_SAVED = register(Counter("response_compression_saved_bytes_total", "압축으로 줄인 응답 바이트", ("encoding",)))
+COMPRESSION_SKIPPED = register(Counter("response_compression_skipped_total", "압축 스레드 구획 초과로 원본 전송한 응답 수"))
+
+_COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/msgpack",
+    "text/",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+)
+# 같은 q값이면 앞쪽 우선(br이 같은 CPU로 더 작음)
+_SUPPORTED = ("br", "gzip")
+
+compression_bulkhead = Bulkhead("compression", settings.COMPRESSION_THREADS * 4, settings.COMPRESSION_THREADS)
+
+
+def negotiate(accept_encoding: bytes) -> Optional[str]:
+    """Accept-Encoding 헤더 → 사용할 인코딩(br·gzip) 또는 None. "*"는 명시되지 않은 지원 인코딩에 적용."""
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.decode("latin-1").lower().split(","):
+        name, _, params = item.partition(";")
+        name = name.strip()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name] = q
+    wildcard = weights.get("*")
+    best: Optional[str] = None
+    best_q = 0.0
+    for name in _SUPPORTED:
+        q = weights.get(name, wildcard if wildcard is not None else 0.0)
+        if q > best_q:
+            best, best_q = name, q
+    return best
+
+
+def is_compressible(content_type: str) -> bool:
+    content_type = content_type.lower()
+    return content_type.startswith(_COMPRESSIBLE_TYPES) or "+json" in content_type
+
+
+def _encode(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=settings.COMPRESSION_BROTLI_QUALITY)
+    # mtime=0: 같은 본문 → 같은 바이트(캐시·프록시 재검증에 유리)
+    return gzip.compress(body, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0)
+
+
+class CompressedBodyCache:
+    """(인코딩, 본문 blake2b) → 압축 바이트. 총 바이트 상한 LRU, 벌크헤드 스레드·이벤트 루프 양쪽에서 쓰므로 락."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max(0, max_bytes)
+        self.size = 0
+        self._entries: "OrderedDict[Tuple[str, bytes], bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, bytes]) -> Optional[bytes]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Tuple[str, bytes], value: bytes) -> None:
+        # 한 항목이 캐시를 통째로 밀어내지 않도록 상한의 1/4 초과는 저장하지 않음
+        if len(value) > self.max_bytes // 4:
+            return
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = value
+            self.size += len(value)
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+body_cache = CompressedBodyCache(settings.COMPRESSION_CACHE_MAX_BYTES)
+register_cache_size("compression.bodies", body_cache.__len__)
+
+
+def compress_body(body: bytes, encoding: str) -> Tuple[bytes, bool]:
+    """(압축 바이트, 캐시 적중 여부). 스레드 안전."""
+    if body_cache.max_bytes == 0:
+        return _encode(body, encoding), False
+    key = (encoding, hashlib.blake2b(body, digest_size=16).digest())
+    cached = body_cache.get(key)
+    if cached is not None:
+        return cached, True
+    compressed = _encode(body, encoding)
+    body_cache.put(key, compressed)
+    return compressed, False
+
+
+class CompressionMiddleware:
+    """http 요청만. 응답 시작 메시지를 첫 본문까지 보류했다가 압축 여부를 정해 헤더(Content-Encoding·Content-Length·Vary)를 고침."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self.min_size = settings.COMPRESSION_MIN_SIZE
+        self.offload_size = settings.COMPRESSION_OFFLOAD_SIZE
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding: Optional[str] = None
+        for name, value in scope["headers"]:
+            if name == b"accept-encoding":
+                encoding = negotiate(value)
+                break
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[Message] = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(raw=list(message.get("headers", ())))
+                if "content-encoding" in headers or not is_compressible(headers.get("content-type", "")):
+                    passthrough = True
+                    await send(message)
+                    return
+                start_message = message
+                return
+            if start_message is None:
+                await send(message)
+                return
+            headers = MutableHeaders(raw=start_message["headers"])
+            headers.add_vary_header("Accept-Encoding")
+            start_message["headers"] = headers.raw
+            body = message.get("body", b"")
+            passthrough = True
+            if message.get("more_body", False) or len(body) < self.min_size:
+                await send(start_message)
+                await send(message)
+                return
+            compressed = await self._compress(body, encoding)
+            if compressed is not None:
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(compressed))
+                start_message["headers"] = headers.raw
+                message["body"] = compressed
+            await send(start_message)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    async def _compress(self, body: bytes, encoding: str) -> Optional[bytes]:
+        """압축 바이트, 압축 스레드 구획이 찼거나 이득이 없으면 None(원본 전송)."""
+        with span("compress"):
+            if len(body) < self.offload_size:
+                compressed, hit = compress_body(body, encoding)
+            else:
+                try:
+                    async with compression_bulkhead.slot():
+                        compressed, hit = await compression_bulkhead.run(compress_body, body, encoding)
+                except BulkheadFull:
+                    COMPRESSION_SKIPPED.inc()
+                    return None
+        if len(compressed) >= len(body):
+            return None
+        COMPRESSED.inc((encoding, "hit" if hit else "miss"))
+        COMPRESSION_SAVED.inc((encoding,), len(body) - len(compressed))
+        return compressed
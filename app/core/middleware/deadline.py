@@ -0,0 +1,35 @@
+# 요청 데드라인 스테이지(순수 ASGI). 라우트별 타임아웃·X-Request-Timeout(app.core.deadline.resolve_timeout)으로 RequestContext.deadline 설정(요청 시작 기준).
+# rate limit 조회 등 앞 단계에서 이미 지났으면 앱에 들어가지 않고 504. 이후 스레드풀·DB·Redis 단계가 남은 시간을 확인.
+import time
+from typing import Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.context import request_ctx
+from app.core.deadline import deadline_exceeded, resolve_timeout, timeout_response
+
+
+class DeadlineMiddleware:
+    """RequestPipelineMiddleware 안쪽(컨텍스트 필요). 타임아웃이 없는 경로는 데드라인 없이 전달."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        ctx = request_ctx.get()
+        if scope["type"] != "http" or ctx is None:
+            await self.app(scope, receive, send)
+            return
+        timeout_header: Optional[bytes] = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-timeout":
+                timeout_header = value
+                break
+        timeout = resolve_timeout(scope["method"], scope["path"], timeout_header)
+        if timeout is not None:
+            ctx.deadline = ctx.started + timeout
+            if time.perf_counter() >= ctx.deadline:
+                deadline_exceeded("pipeline")
+                await timeout_response()(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
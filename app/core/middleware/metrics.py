@@ -0,0 +1,68 @@
+# HTTP 요청 메트릭. 라우트 템플릿(원시 경로 아님) 기준 지연 히스토그램·상태 코드 카운트·in-flight·응답 크기·프록시 큐 대기. RequestPipelineMiddleware에서 호출.
+import time
+from typing import Optional
+
+from app.core.metrics import SIZE_BUCKETS, Counter, Gauge, LabeledHistogram, register
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+REQUEST_DURATION = register(
+    LabeledHistogram("http_request_duration_seconds", "요청 처리 시간(초)", ("method", "route"))
+)
+REQUESTS_TOTAL = register(Counter("http_requests_total", "요청 수(상태 코드별)", ("method", "route", "status")))
+IN_FLIGHT = register(Gauge("http_requests_in_flight", "처리 중인 요청 수"))
+RESPONSE_SIZE = register(
+    LabeledHistogram("http_response_size_bytes", "응답 본문 크기(Content-Length)", ("route",), SIZE_BUCKETS)
+)
+QUEUE_TIME = register(
+    LabeledHistogram("http_request_queue_seconds", "프록시 수신 ~ 앱 수신 대기(X-Request-Start)")
+)
+
+# 프록시 시계와의 오차·잘못된 헤더 값 무시 상한(초)
+_MAX_QUEUE_SECONDS = 600.0
+
+
+def parse_request_start(value: str, now: float) -> Optional[float]:
+    """X-Request-Start("t=1700000000.123" 초, 또는 ms·µs 정수) → 대기 시간(초). 해석 불가·비정상 값은 None."""
+    raw = value.strip()
+    if raw.startswith("t="):
+        raw = raw[2:]
+    try:
+        started = float(raw)
+    except ValueError:
+        return None
+    if started > 1e15:
+        started /= 1e6
+    elif started > 1e12:
+        started /= 1e3
+    waited = now - started
+    if waited > _MAX_QUEUE_SECONDS or waited < -_MAX_QUEUE_SECONDS:
+        return None
+    return max(0.0, waited)
+
+
+def route_template(scope: dict) -> str:
+    """라우팅 후 경로 템플릿(/v1/posts/{post_id}). 미매칭(404 등)은 하나의 라벨로 묶어 카디널리티 제한.
+    include_router 하위 라우트는 scope["route"]에 prefix 없는 경로만 있어 FastAPI 유효 라우트 컨텍스트(전체 경로) 우선."""
+    effective = scope.get("fastapi", {}).get("effective_route_context")
+    path = getattr(effective, "path", None)
+    if path:
+        return path
+    route = scope.get("route")
+    return getattr(route, "path_format", None) or UNMATCHED_ROUTE
+
+
+def observe_queue_time(header_value: bytes) -> None:
+    waited = parse_request_start(header_value.decode("latin-1"), time.time())
+    if waited is not None:
+        QUEUE_TIME.observe((), waited)
+
+
+def record_request(scope: dict, status: int, duration: float, content_length: Optional[int]) -> None:
+    """요청 1건 기록. 딕셔너리 조회·bisect 몇 회뿐이라 요청당 수 µs."""
+    route = route_template(scope)
+    method = scope["method"]
+    REQUEST_DURATION.observe((method, route), duration)
+    REQUESTS_TOTAL.inc((method, route, str(status)))
+    if content_length is not None:
+        RESPONSE_SIZE.observe((route,), float(content_length))
@@ -0,0 +1,129 @@
+# 요청 파이프라인(순수 ASGI). 프록시 IP 보정 → request_id·RequestContext → 메트릭·접근 로그 → rate limit(주체·비용) → 보안 헤더를 scope/send 한 번 통과로 처리.
+# 요청별 선택 기능은 안쪽의 독립 스테이지(순수 ASGI, RequestContext를 contextvar로 공유)로 분리해 main.py에서 조합:
+# 프로파일러(profiling) → 데드라인(deadline) → Server-Timing(server_timing). 동시성 한도(admission)는 라우트의 DB 의존성을 봐야 하므로 라우트 단계(AdmissionRoute).
+# BaseHTTPMiddleware(app.middleware("http")) 계층마다 생기던 태스크·스트림 오버헤드 제거, 스트리밍 응답도 그대로 전달.
+import asyncio
+import threading
+import time
+from typing import Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.context import PHASE_HANDLER, PHASE_RESPONDING, RequestContext, inflight, request_ctx
+from app.core.middleware.access_log import log_access, log_exception
+from app.core.middleware.metrics import IN_FLIGHT, observe_queue_time, record_request, route_template
+from app.core.middleware.proxy_headers import parse_trusted_proxies, resolve_client
+from app.core.middleware.rate_limit import (
+    check_rate_limit,
+    client_ip_from_scope,
+    get_kv_from_scope,
+    rate_limited_response,
+)
+from app.core.middleware.request_id import request_id_ctx, resolve_request_id
+from app.core.middleware.security_headers import build_csp_header, build_security_headers, skip_csp
+
+
+class RequestPipelineMiddleware:
+    """http 요청만 처리, 그 외(lifespan·websocket)는 그대로 전달. 설정 기반 값(신뢰 프록시 대역·보안 헤더 바이트)은 생성 시 1회 계산."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self.trusted_proxies = parse_trusted_proxies(settings.TRUSTED_PROXY_IPS)
+        self.security_headers = build_security_headers()
+        self.csp_header = build_csp_header()
+        self.metrics = settings.METRICS_ENABLED
+        self.debug = settings.DEBUG
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        request_id_header: Optional[bytes] = None
+        forwarded_for: Optional[bytes] = None
+        request_start: Optional[bytes] = None
+        authorization: Optional[bytes] = None
+        request_length: Optional[int] = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                request_id_header = value
+            elif name == b"x-forwarded-for":
+                forwarded_for = value
+            elif name == b"x-request-start":
+                request_start = value
+            elif name == b"authorization":
+                authorization = value
+            elif name == b"content-length" and value.isdigit():
+                request_length = int(value)
+
+        resolve_client(scope, forwarded_for, self.trusted_proxies)
+        request_id = resolve_request_id(request_id_header)
+        scope.setdefault("state", {})["request_id"] = request_id
+        ctx = RequestContext(request_id, scope)
+        ctx.thread_id = threading.get_ident()
+        ctx.task = asyncio.current_task()
+        id_token = request_id_ctx.set(request_id)
+        ctx_token = request_ctx.set(ctx)
+        inflight[id(ctx)] = ctx
+
+        path = scope["path"]
+        method = scope["method"]
+        extra_headers = [(b"x-request-id", request_id.encode("latin-1"))]
+        extra_headers.extend(self.security_headers)
+        if self.csp_header is not None and not skip_csp(path):
+            extra_headers.append(self.csp_header)
+
+        status = 500
+        content_length: Optional[int] = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status, content_length
+            if message["type"] == "http.response.start":
+                ctx.phase = PHASE_RESPONDING
+                status = message["status"]
+                headers = MutableHeaders(raw=list(message.get("headers", ())))
+                length = headers.get("content-length")
+                if length is not None and length.isdigit():
+                    content_length = int(length)
+                # 앱이 같은 헤더를 이미 넣었어도 중복되지 않도록 대체
+                for name, value in extra_headers:
+                    headers[name.decode("latin-1")] = value.decode("latin-1")
+                if self.debug:
+                    headers["x-process-time"] = f"{(time.perf_counter() - start) * 1000:.2f}"
+                    headers["x-db-query-count"] = str(ctx.db_count)
+                    headers["x-db-time"] = f"{ctx.db_time * 1000:.2f}"
+                message["headers"] = headers.raw
+            await send(message)
+
+        if self.metrics:
+            if request_start is not None:
+                observe_queue_time(request_start)
+            IN_FLIGHT.inc()
+        client_ip = client_ip_from_scope(scope)
+        try:
+            limited = await check_rate_limit(get_kv_from_scope(scope), scope, client_ip, authorization, request_length)
+            if limited is not None:
+                await rate_limited_response(*limited)(scope, receive, send_wrapper)
+            else:
+                ctx.phase = PHASE_HANDLER
+                await self.app(scope, receive, send_wrapper)
+        except Exception as exc:
+            duration = time.perf_counter() - start
+            if self.metrics:
+                record_request(scope, 500, duration, None)
+            log_exception(request_id, method, path, route_template(scope), duration * 1000, client_ip, exc)
+            raise
+        else:
+            duration = time.perf_counter() - start
+            if self.metrics:
+                record_request(scope, status, duration, content_length)
+            log_access(request_id, method, path, route_template(scope), status, duration * 1000, client_ip)
+        finally:
+            inflight.pop(id(ctx), None)
+            if self.metrics:
+                IN_FLIGHT.dec()
+            request_ctx.reset(ctx_token)
+            request_id_ctx.reset(id_token)
@@ -0,0 +1,58 @@
+# 온디맨드 프로파일러 스테이지(순수 ASGI). X-Profile 헤더 = ADMIN_TOKEN 또는 샘플링 비율(profiler_state)에 당첨된 요청만 세션 시작(app.core.profiler).
+# 이 스테이지의 코루틴 프레임이 세션 기준 프레임 → 안쪽 스테이지·라우트 처리만 샘플. 응답에 X-Profile-Id, 종료 후 folded 파일 기록(스레드).
+import hmac
+import random
+import time
+from typing import Optional
+
+import anyio.to_thread
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.context import request_ctx
+from app.core.profiler import finish_profile, is_safe_profile_id, profiler_state, start_profile
+
+
+class ProfilerMiddleware:
+    """RequestPipelineMiddleware 안쪽(컨텍스트·request_id 필요). 프로파일하지 않는 요청은 그대로 전달."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self.profile_token: Optional[bytes] = settings.ADMIN_TOKEN.encode() if settings.ADMIN_TOKEN else None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        ctx = request_ctx.get()
+        if scope["type"] != "http" or ctx is None or not self._should_profile(scope) or not is_safe_profile_id(ctx.request_id):
+            await self.app(scope, receive, send)
+            return
+        profile = ctx.profile = start_profile(ctx.request_id)
+        if profile is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(raw=list(message.get("headers", ())))
+                headers["x-profile-id"] = ctx.request_id
+                message["headers"] = headers.raw
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            ctx.profile = None
+            duration_ms = (time.perf_counter() - ctx.started) * 1000
+            # 요청 데드라인과 무관하게 기록(run_in_threadpool 래퍼의 데드라인 확인을 거치지 않음)
+            await anyio.to_thread.run_sync(finish_profile, profile, scope["method"], scope["path"], duration_ms)
+
+    def _should_profile(self, scope: Scope) -> bool:
+        """X-Profile 헤더가 ADMIN_TOKEN과 일치하거나 샘플링 비율에 당첨되면 True."""
+        if self.profile_token is not None:
+            for name, value in scope["headers"]:
+                if name == b"x-profile":
+                    if hmac.compare_digest(value, self.profile_token):
+                        return True
+                    break
+        rate = profiler_state.sample_rate
+        return rate > 0 and random.random() < rate
@@ -1,47 +1,47 @@
-# Nginx/ALB 뒤에서 실제 클라이언트 IP를 request.client에 반영. 신뢰 프록시 IP 대역에서 온 요청일 때만 X-Forwarded-For 파싱(IP 스푸핑 방어).
+# Nginx/ALB 뒤에서 실제 클라이언트 IP를 scope["client"]에 반영. 신뢰 프록시 IP 대역에서 온 요청일 때만 X-Forwarded-For 파싱(IP 스푸핑 방어).
 import ipaddress
-from typing import Awaitable, Callable, List
-
-from starlette.requests import Request
-from starlette.responses import Response
+import logging
+from typing import List, Optional, Union
 
 from app.core.config import settings
 
+log = logging.getLogger(__name__)
 
-def _is_trusted_proxy(direct_client_ip: str, allowed: List[str]) -> bool:
-    if not allowed:
-        return True
-    try:
-        client = ipaddress.ip_address(direct_client_ip)
-    except ValueError:
-        return False
-    for item in allowed:
+IPNetwork = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+
+def parse_trusted_proxies(items: List[str]) -> List[IPNetwork]:
+    """TRUSTED_PROXY_IPS(IP·CIDR 문자열) → ip_network 목록. 시작 시 1회, 잘못된 항목은 경고 후 무시."""
+    networks: List[IPNetwork] = []
+    for item in items:
         item = item.strip()
         if not item:
             continue
         try:
-            if "/" in item:
-                if client in ipaddress.ip_network(item, strict=False):
-                    return True
-            else:
-                if client == ipaddress.ip_address(item):
-                    return True
+            networks.append(ipaddress.ip_network(item, strict=False))
         except ValueError:
-            continue
-    return False
-
-
-async def proxy_headers_middleware(
-    request: Request,
-    call_next: Callable[[Request], Awaitable[Response]],
-) -> Response:
-    if not settings.TRUST_X_FORWARDED_FOR:
-        return await call_next(request)
-    direct_client = (request.scope.get("client") or ("", 0))[0]
-    if not _is_trusted_proxy(direct_client, settings.TRUSTED_PROXY_IPS):
-        return await call_next(request)
-    forwarded = request.headers.get("x-forwarded-for") or request.headers.get("X-Forwarded-For")
-    if forwarded:
-        client_ip = forwarded.split(",")[0].strip()
-        request.scope["client"] = (client_ip, 0)
-    return await call_next(request)
+            log.warning("TRUSTED_PROXY_IPS 항목 무시(형식 오류): %s", item)
+    return networks
+
+
+def is_trusted_proxy(direct_client_ip: str, networks: List[IPNetwork]) -> bool:
+    """networks가 비어 있으면 모든 요청 신뢰(TRUSTED_PROXY_IPS 미설정)."""
+    if not networks:
+        return True
+    try:
+        client = ipaddress.ip_address(direct_client_ip)
+    except ValueError:
+        return False
+    return any(client in network for network in networks)
+
+
+def resolve_client(scope: dict, forwarded_for: Optional[bytes], networks: List[IPNetwork]) -> None:
+    """TRUST_X_FORWARDED_FOR이고 직전 홉이 신뢰 프록시면 X-Forwarded-For 첫 값으로 scope["client"] 교체."""
+    if not settings.TRUST_X_FORWARDED_FOR or not forwarded_for:
+        return
+    direct_client = (scope.get("client") or ("", 0))[0]
+    if not is_trusted_proxy(direct_client, networks):
+        return
+    client_ip = forwarded_for.decode("latin-1").split(",")[0].strip()
+    if client_ip:
+        scope["client"] = (client_ip, 0)
@@ -1,58 +1,205 @@
-# Redis 기반 분산 Rate Limit. Lua로 INCR+EXPIRE+TTL 원자 수행, 비차단, Fail-open.
+# 분산 Rate Limit. GCRA(연속 토큰 버킷)로 전역+경로별 버킷을 KV 백엔드 1회 호출(Redis면 EVALSHA)에 원자 검사, 비차단.
+# KV 백엔드는 Redis 장애·미설정 시 인메모리로 자동 전환되므로 제한이 풀리지 않음(워커 단위 제한으로 축소).
+# 프로세스 내 사전 필터(Redis 사용 중일 때만): 이 워커만으로 이미 한도를 넘은 키·Redis가 거절한 키는 retry_after 동안 Redis 왕복 없이 거절.
+# 허용 임대(전역 버킷만 쓰는 요청): Redis에서 요청 비용 + 임대분을 한 번에 차감하고, 임대분은 RATE_LIMIT_LEASE_TTL_MS 동안 이 워커에서 Redis 없이 소진.
+# 임대 크기는 키별로 적응(다 쓰면 2배, 남기고 만료되면 실제 사용량으로, 한동안 없던 키는 0) → 자주 오는 키만 왕복이 줄고 드문 키는 매 요청 Redis.
+# 임대분은 Redis에서 이미 차감된 단위라 워커 수와 무관하게 한도를 넘지 않음. 만료로 남는 단위만큼(키·워커당 최대 RATE_LIMIT_LEASE_MAX) 한도가 일시적으로 더 엄격해짐.
+# 전역 버킷은 주체(검증된 JWT sub, 없으면 IP)별·티어별 한도, 요청 비용(경로 가중치 + 페이지 크기 + 업로드 바이트)만큼 차감.
 import logging
-from typing import Awaitable, Callable, Optional, Tuple
+import math
+import re
+import time
+from collections import OrderedDict
+from typing import List, NamedTuple, Optional, Pattern, Tuple
+from urllib.parse import parse_qsl
 
+import jwt
 from fastapi import Request
-from redis.asyncio import Redis
 from starlette.responses import JSONResponse, Response
 
 from app.common import ApiCode
 from app.core.config import settings
+from app.core.memory import register_cache_size
+from app.core.security import verify_access_token
+from app.infra.kv import FailoverBackend, GcraParams, KVBackend, MemoryBackend
 
 logger = logging.getLogger(__name__)
 
-_SKIP_PATHS = frozenset({"/health"})
+_SKIP_PATHS = frozenset({"/health", "/health/live", "/health/ready", "/metrics"})
 _KEY_PREFIX = "rl"
 
-# Fixed Window: INCR → (count==1이면 EXPIRE) → TTL 반환. 한 번에 원자 수행.
-_LUA_FIXED_WINDOW = """
-local c = redis.call('INCR', KEYS[1])
-if c == 1 then
-    redis.call('EXPIRE', KEYS[1], ARGV[1])
-end
-local ttl = redis.call('TTL', KEYS[1])
-return {c, ttl}
-"""
 
+class Bucket(NamedTuple):
+    name: str
+    window_ms: int
+    emission_ms: int
+    code: ApiCode
 
-def get_client_ip(request: Request) -> str:
-    """프록시 검증이 끝난 request.client만 사용. X-Forwarded-For 직접 파싱 금지(proxy_headers 미들웨어가 이미 scope['client'] 갱신)."""
-    if request.client:
-        return request.client.host
-    return "unknown"
+
+def _bucket(name: str, window_sec: int, limit: int, code: ApiCode, cost: int = 1) -> Bucket:
+    """cost만큼 한 번에 차감. 한도보다 큰 비용은 한도로 잘라 빈 버킷에서는 항상 통과 가능하게 함."""
+    limit = max(1, limit)
+    window_ms = max(1, window_sec) * 1000
+    return Bucket(name, window_ms, max(1, window_ms // limit) * min(max(1, cost), limit), code)
+
+
+class RouteCost(NamedTuple):
+    method: str
+    pattern: Pattern[str]
+    cost: int
+
+
+def parse_route_costs(spec: str) -> List[RouteCost]:
+    """"POST /v1/posts/{post_id}/comments=2,..." 형식. {name}은 경로 한 구간과 매치. 잘못된 항목은 경고 후 무시."""
+    rules: List[RouteCost] = []
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        try:
+            route, cost = item.rsplit("=", 1)
+            method, template = route.split()
+            regex = re.sub(r"\\\{[^/]+?\\\}", "[^/]+", re.escape(template.rstrip("/")))
+            rules.append(RouteCost(method.upper(), re.compile(regex), max(1, int(cost))))
+        except ValueError:
+            logger.warning("RATE_LIMIT_ROUTE_COSTS 항목 무시: %r", item)
+    return rules
+
+
+_route_costs = parse_route_costs(settings.RATE_LIMIT_ROUTE_COSTS)
+
+
+def _page_size(query_string: bytes) -> int:
+    if b"size=" not in query_string:
+        return 0
+    for name, value in parse_qsl(query_string.decode("latin-1")):
+        if name == "size":
+            try:
+                return max(0, int(value))
+            except ValueError:
+                return 0
+    return 0
 
 
-def _get_redis(request: Request) -> Optional[Redis]:
-    return getattr(request.app.state, "redis", None)
+def request_cost(method: str, path: str, query_string: bytes = b"", content_length: Optional[int] = None) -> int:
+    """경로 가중치(기본 1) + 기본 페이지 크기 초과분(RATE_LIMIT_PAGE_SIZE_UNIT당 1) + 본문 크기(RATE_LIMIT_BYTES_PER_UNIT당 1)."""
+    p = path.rstrip("/") or "/"
+    cost = 1
+    for rule in _route_costs:
+        if rule.method == method and rule.pattern.fullmatch(p):
+            cost = rule.cost
+            break
+    if method == "GET":
+        size = _page_size(query_string)
+        if size > settings.RATE_LIMIT_PAGE_SIZE_UNIT:
+            cost += math.ceil(size / settings.RATE_LIMIT_PAGE_SIZE_UNIT) - 1
+    if content_length:
+        cost += content_length // max(1, settings.RATE_LIMIT_BYTES_PER_UNIT)
+    return cost
 
 
-async def _check_fixed_window(
-    redis: Redis,
-    key: str,
-    window_sec: int,
-    max_count: int,
-) -> Tuple[bool, int]:
-    full_key = f"{_KEY_PREFIX}:{key}"
+def resolve_principal(authorization: Optional[bytes]) -> Optional[str]:
+    """Bearer 서명·만료 검증 통과 시 "u:{sub}", 아니면 None(IP로 제한). DB 조회는 하지 않음."""
+    if not authorization or not authorization.startswith(b"Bearer "):
+        return None
+    token = authorization[7:].strip()
+    if not token:
+        return None
     try:
-        result = await redis.eval(_LUA_FIXED_WINDOW, 1, full_key, window_sec)
-        count, ttl = int(result[0]), int(result[1])
-        retry_after = max(0, ttl) if ttl >= 0 else window_sec
-        if count > max_count:
-            return False, retry_after
-        return True, 0
-    except Exception as e:
-        logger.warning("Rate limit Redis 오류: %s. 요청 허용(Fail-open).", e)
-        return True, 0
+        payload = verify_access_token(token.decode("latin-1"))
+    except (jwt.InvalidTokenError, UnicodeDecodeError):
+        return None
+    sub = payload.get("sub")
+    return f"u:{sub}" if sub else None
+
+
+class Lease(NamedTuple):
+    units: int
+    expires_ms: float
+    size: int
+
+
+class LocalRateLimiter:
+    """워커 내 GCRA(MemoryBackend) + 거절 캐시 + 허용 임대. 키 수는 RATE_LIMIT_LOCAL_MAX_KEYS로 제한(오래된 키부터 제거). 이벤트 루프 단일 스레드에서만 호출."""
+
+    def __init__(self, max_keys: int) -> None:
+        self.max_keys = max(1, max_keys)
+        self._tats = MemoryBackend(max_keys)
+        self._blocked: "OrderedDict[str, float]" = OrderedDict()
+        self._leases: "OrderedDict[str, Lease]" = OrderedDict()
+
+    def check(self, keys: List[str], buckets: List[Bucket], now_ms: float, cost: int = 1) -> Optional[Tuple[int, float]]:
+        """거절 시 (버킷 index, retry_after_ms), 허용 시 로컬 TAT 갱신 후 None."""
+        for i, key in enumerate(keys):
+            blocked_until = self._blocked.get(key)
+            if blocked_until is not None:
+                if blocked_until > now_ms:
+                    return i, blocked_until - now_ms
+                del self._blocked[key]
+        allowed, index, retry_ms = self._tats.gcra_at(keys, _params(buckets), now_ms)
+        if allowed:
+            return None
+        if index > 0 or cost == 1:
+            # 고비용 요청의 retry_after로 저비용 요청까지 막지 않도록 비용 1일 때만 거절 캐시
+            self.block(keys[index], now_ms + retry_ms)
+        return index, retry_ms
+
+    def block(self, key: str, until_ms: float) -> None:
+        self._blocked[key] = until_ms
+        self._blocked.move_to_end(key)
+        while len(self._blocked) > self.max_keys:
+            self._blocked.popitem(last=False)
+
+    def take(self, key: str, cost: int, now_ms: float) -> bool:
+        """유효한 임대분에서 cost 차감. 부족하거나 만료면 False(Redis로)."""
+        lease = self._leases.get(key)
+        if lease is None or lease.expires_ms <= now_ms or lease.units < cost:
+            return False
+        self._leases[key] = lease._replace(units=lease.units - cost)
+        return True
+
+    def next_lease_size(self, key: str, now_ms: float, ttl_ms: float, cap: int) -> int:
+        """다음 임대 크기. 직전 임대를 다 썼으면 2배, 남기고 만료됐으면 사용량, 만료 후 TTL 넘게 조용했던 키는 0."""
+        lease = self._leases.get(key)
+        if lease is None or cap <= 0 or now_ms > lease.expires_ms + ttl_ms:
+            return 0
+        if lease.units == 0:
+            return min(cap, max(1, lease.size * 2))
+        return min(cap, lease.size - lease.units)
+
+    def grant(self, key: str, units: int, expires_ms: float) -> None:
+        """Redis에서 차감한 임대분 기록(0이어도 기록: 다음 요청의 크기 판단용)."""
+        self._leases[key] = Lease(units, expires_ms, units)
+        self._leases.move_to_end(key)
+        while len(self._leases) > self.max_keys:
+            self._leases.popitem(last=False)
+
+
+_local = LocalRateLimiter(settings.RATE_LIMIT_LOCAL_MAX_KEYS)
+register_cache_size("rate_limit.local_tats", lambda: len(_local._tats))
+register_cache_size("rate_limit.local_blocked", lambda: len(_local._blocked))
+register_cache_size("rate_limit.local_leases", lambda: len(_local._leases))
+
+
+def _params(buckets: List[Bucket]) -> List[GcraParams]:
+    return [(b.emission_ms, b.window_ms) for b in buckets]
+
+
+def get_client_ip(request: Request) -> str:
+    """프록시 검증이 끝난 request.client만 사용. X-Forwarded-For 직접 파싱 금지(파이프라인이 이미 scope['client'] 갱신)."""
+    return client_ip_from_scope(request.scope)
+
+
+def client_ip_from_scope(scope: dict) -> str:
+    client = scope.get("client")
+    if client:
+        return client[0]
+    return "unknown"
+
+
+def get_kv_from_scope(scope: dict) -> Optional[KVBackend]:
+    app = scope.get("app")
+    return getattr(app.state, "kv", None) if app is not None else None
 
 
 def _path_is_login(path: str) -> bool:
@@ -65,43 +212,97 @@ def _path_is_signup_upload(path: str) -> bool:
     return p == "/v1/media/images/signup" or p.endswith("/media/images/signup")
 
 
-async def rate_limit_middleware(
-    request: Request,
-    call_next: Callable[[Request], Awaitable[Response]],
-) -> Response:
-    """Redis 없거나 예외 시 call_next(Fail-open). OPTIONS·/health 제외. 경로별 키·제한 적용."""
-    if request.method == "OPTIONS":
-        return await call_next(request)
-    if request.url.path in _SKIP_PATHS:
-        return await call_next(request)
-
-    redis = _get_redis(request)
-    if redis is None:
-        return await call_next(request)
+def _global_limit(authenticated: bool) -> int:
+    return settings.RATE_LIMIT_USER_MAX_REQUESTS if authenticated else settings.RATE_LIMIT_MAX_REQUESTS
 
-    ip = get_client_ip(request)
-    path = request.url.path
 
+def _buckets_for(path: str, authenticated: bool = False, cost: int = 1) -> List[Bucket]:
+    """전역 버킷은 항상 포함(인증 주체는 user 티어 한도, 비용만큼 차감). 로그인·회원가입 업로드는 경로 전용 버킷(시도 1회=1)을 함께 검사."""
+    limit = _global_limit(authenticated)
+    buckets = [_bucket("global", settings.RATE_LIMIT_WINDOW, limit, ApiCode.RATE_LIMIT_EXCEEDED, cost)]
     if _path_is_login(path):
-        key = f"login:{ip}"
-        window = settings.LOGIN_RATE_LIMIT_WINDOW
-        max_count = settings.LOGIN_RATE_LIMIT_MAX_ATTEMPTS
-        code = ApiCode.LOGIN_RATE_LIMIT_EXCEEDED
+        buckets.append(
+            _bucket(
+                "login",
+                settings.LOGIN_RATE_LIMIT_WINDOW,
+                settings.LOGIN_RATE_LIMIT_MAX_ATTEMPTS,
+                ApiCode.LOGIN_RATE_LIMIT_EXCEEDED,
+            )
+        )
     elif _path_is_signup_upload(path):
-        key = f"signup_upload:{ip}"
-        window = settings.SIGNUP_UPLOAD_RATE_LIMIT_WINDOW
-        max_count = settings.SIGNUP_UPLOAD_RATE_LIMIT_MAX
-        code = ApiCode.RATE_LIMIT_EXCEEDED
-    else:
-        key = f"global:{ip}"
-        window = settings.RATE_LIMIT_WINDOW
-        max_count = settings.RATE_LIMIT_MAX_REQUESTS
-        code = ApiCode.RATE_LIMIT_EXCEEDED
-
-    allowed, retry_after_seconds = await _check_fixed_window(redis, key, window, max_count)
+        buckets.append(
+            _bucket(
+                "signup_upload",
+                settings.SIGNUP_UPLOAD_RATE_LIMIT_WINDOW,
+                settings.SIGNUP_UPLOAD_RATE_LIMIT_MAX,
+                ApiCode.RATE_LIMIT_EXCEEDED,
+            )
+        )
+    return buckets
+
+
+def _retry_after_seconds(retry_ms: float) -> int:
+    return max(1, math.ceil(retry_ms / 1000))
+
+
+async def check_rate_limit(
+    kv: Optional[KVBackend],
+    scope: dict,
+    ip: str,
+    authorization: Optional[bytes] = None,
+    content_length: Optional[int] = None,
+) -> Optional[Tuple[ApiCode, int]]:
+    """허용 시 None, 초과 시 (code, retry_after_seconds). 백엔드 예외 시 허용(Fail-open). OPTIONS·/health·/metrics 제외.
+    전역 키는 rl:global:u:{sub}(인증) 또는 rl:global:{ip}. 경로 전용 버킷은 항상 IP 기준(무차별 대입 방어)."""
+    method = scope["method"]
+    path = scope["path"]
+    if method == "OPTIONS" or path in _SKIP_PATHS or kv is None:
+        return None
+
+    principal = resolve_principal(authorization)
+    cost = request_cost(method, path, scope.get("query_string", b""), content_length)
+    buckets = _buckets_for(path, principal is not None, cost)
+    keys = [f"{_KEY_PREFIX}:{b.name}:{ip}" for b in buckets]
+    if principal is not None:
+        keys[0] = f"{_KEY_PREFIX}:global:{principal}"
+    remote = isinstance(kv, FailoverBackend) and kv.remote_available()
+    now_ms = time.monotonic() * 1000
+    # 경로 전용 버킷(로그인 등)이 있는 요청은 임대 없이 매번 Redis
+    leasable = remote and len(buckets) == 1
+    lease = 0
+    if remote:
+        denied = _local.check(keys, buckets, now_ms, cost)
+        if denied is not None:
+            index, retry_ms = denied
+            return buckets[index].code, _retry_after_seconds(retry_ms)
+        if leasable:
+            if _local.take(keys[0], cost, now_ms):
+                return None
+            cap = min(settings.RATE_LIMIT_LEASE_MAX, _global_limit(principal is not None) // 10)
+            lease = _local.next_lease_size(keys[0], now_ms, settings.RATE_LIMIT_LEASE_TTL_MS, cap)
+
+    try:
+        if lease:
+            # 비용 + 임대분을 한 번에. 남은 한도가 부족하면 임대 없이 비용만 다시 검사
+            allowed, _, _ = await kv.gcra(keys, _params(_buckets_for(path, principal is not None, cost + lease)))
+            if not allowed:
+                lease = 0
+        if not lease:
+            allowed, index, retry_ms = await kv.gcra(keys, _params(buckets))
+    except Exception as e:
+        logger.warning("Rate limit 백엔드 오류: %s. 요청 허용(Fail-open).", e)
+        return None
     if allowed:
-        return await call_next(request)
+        if leasable:
+            _local.grant(keys[0], lease, now_ms + settings.RATE_LIMIT_LEASE_TTL_MS)
+        return None
+    if remote and (index > 0 or cost == 1):
+        # 고비용 요청의 retry_after로 저비용 요청까지 막지 않도록 비용 1일 때만 거절 캐시
+        _local.block(keys[index], now_ms + retry_ms)
+    return buckets[index].code, _retry_after_seconds(retry_ms)
+
 
+def rate_limited_response(code: ApiCode, retry_after_seconds: int) -> Response:
     return JSONResponse(
         status_code=429,
         content={
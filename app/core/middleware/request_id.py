@@ -1,24 +1,13 @@
-# X-Request-ID 생성·전달. contextvars에 설정해 비동기 태스크 전역에서 접근. main에서 마지막 등록 → 요청 시 가장 먼저 실행.
+# X-Request-ID 생성·전달. contextvars에 설정해 비동기 태스크 전역에서 접근. RequestPipelineMiddleware가 요청 시작 시 가장 먼저 설정.
 import contextvars
 import uuid
-from typing import Awaitable, Callable
-
-from starlette.requests import Request
-from starlette.responses import Response
+from typing import Optional
 
 request_id_ctx: contextvars.ContextVar[str] = contextvars.ContextVar("request_id", default="")
 
 
-async def request_id_middleware(
-    request: Request,
-    call_next: Callable[[Request], Awaitable[Response]],
-) -> Response:
-    request_id = request.headers.get("X-Request-ID") or str(uuid.uuid4())
-    request.state.request_id = request_id
-    token = request_id_ctx.set(request_id)
-    try:
-        response = await call_next(request)
-        response.headers["X-Request-ID"] = request_id
-        return response
-    finally:
-        request_id_ctx.reset(token)
+def resolve_request_id(header_value: Optional[bytes]) -> str:
+    """클라이언트·프록시가 보낸 X-Request-ID 재사용, 없으면 UUID4 생성."""
+    if header_value:
+        return header_value.decode("latin-1")
+    return str(uuid.uuid4())
@@ -1,32 +1,36 @@
-# 보안 헤더. X-Frame-Options, X-Content-Type-Options, Referrer-Policy, Permissions-Policy, CSP.
-from typing import Awaitable, Callable
-
-from starlette.requests import Request
-from starlette.responses import Response
+# 보안 헤더. X-Frame-Options, X-Content-Type-Options, Referrer-Policy, Permissions-Policy, CSP. 시작 시 바이트 쌍으로 1회 구성.
+from typing import List, Optional, Tuple
 
 from app.core.config import settings
 
+HeaderPair = Tuple[bytes, bytes]
+
+_DOCS_PATHS = frozenset({"/openapi.json", "/redoc", "/docs/oauth2-redirect"})
 
-async def security_headers_middleware(
-    request: Request,
-    call_next: Callable[[Request], Awaitable[Response]],
-) -> Response:
-    response = await call_next(request)
-    response.headers["X-Frame-Options"] = "DENY"
-    response.headers["X-Content-Type-Options"] = "nosniff"
-    response.headers["Referrer-Policy"] = settings.REFERRER_POLICY
-    response.headers["Permissions-Policy"] = settings.PERMISSIONS_POLICY
+
+def build_security_headers() -> List[HeaderPair]:
+    """CSP 제외 공통 보안 헤더. 응답 시작 메시지에 그대로 이어 붙임."""
+    headers = [
+        (b"x-frame-options", b"DENY"),
+        (b"x-content-type-options", b"nosniff"),
+        (b"referrer-policy", settings.REFERRER_POLICY.encode("latin-1")),
+        (b"permissions-policy", settings.PERMISSIONS_POLICY.encode("latin-1")),
+    ]
     if settings.HSTS_ENABLED:
-        response.headers["Strict-Transport-Security"] = (
-            f"max-age={settings.HSTS_MAX_AGE}; includeSubDomains"
+        headers.append(
+            (b"strict-transport-security", f"max-age={settings.HSTS_MAX_AGE}; includeSubDomains".encode("latin-1"))
         )
+    return headers
+
+
+def build_csp_header() -> Optional[HeaderPair]:
+    if not settings.CONTENT_SECURITY_POLICY:
+        return None
+    return (b"content-security-policy", settings.CONTENT_SECURITY_POLICY.encode("latin-1"))
+
+
+def skip_csp(path: str) -> bool:
     # FastAPI의 Swagger UI(/docs)와 ReDoc(/redoc)은 HTML 내 인라인 스크립트를 사용합니다.
     # 개발환경에서 CSP가 엄격하면(예: script-src 'self') 문서 페이지가 하얗게 뜨거나 로딩이 막힐 수 있어,
     # DEBUG=True일 때는 문서 경로에 한해 CSP를 적용하지 않습니다.
-    is_docs_path = (
-        request.url.path in {"/openapi.json", "/redoc", "/docs/oauth2-redirect"}
-        or request.url.path.startswith("/docs")
-    )
-    if settings.CONTENT_SECURITY_POLICY and not (settings.DEBUG and is_docs_path):
-        response.headers["Content-Security-Policy"] = settings.CONTENT_SECURITY_POLICY
-    return response
+    return settings.DEBUG and (path in _DOCS_PATHS or path.startswith("/docs"))
@@ -0,0 +1,36 @@
+# Server-Timing 스테이지(순수 ASGI). 샘플링된 요청(DEBUG 또는 SERVER_TIMING_SAMPLE_RATE)만 RequestContext.spans를 켜고 응답 시작 시 헤더 추가,
+# SERVER_TIMING_LOG=true면 요청 종료 후 구간 요약 1줄. RequestPipelineMiddleware 안쪽(컨텍스트 필요), 압축 바깥(compress 구간 포함).
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.context import request_ctx
+from app.core.timing import log_spans, server_timing_header, should_sample
+
+
+class ServerTimingMiddleware:
+    """샘플링되지 않은 요청은 분기 1회 외 비용 없이 그대로 전달."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self.timing_log = settings.SERVER_TIMING_LOG
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        ctx = request_ctx.get()
+        if scope["type"] != "http" or ctx is None or not should_sample():
+            await self.app(scope, receive, send)
+            return
+        ctx.spans = {}
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Server-Timing은 여러 헤더가 합쳐지는 목록 → 앱 값과 함께 추가
+                headers = list(message.get("headers", ()))
+                headers.append((b"server-timing", server_timing_header(ctx, time.perf_counter() - ctx.started)))
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+        if self.timing_log:
+            log_spans(ctx, scope["method"], scope["path"], time.perf_counter() - ctx.started)
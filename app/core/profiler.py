@@ -0,0 +1,205 @@
+# 요청 단위 온디맨드 프로파일러. 프로세스당 샘플러 스레드 1개가 PROFILE_INTERVAL_MS마다 스택을 읽어, 프로파일 중인 요청(세션)별로
+# 그 요청을 실제로 실행 중인 스레드만 기록: 이벤트 루프 스레드는 스택에 요청 파이프라인 코루틴 프레임이 있을 때(다른 요청 처리 중이면 제외),
+# 스레드풀 스레드는 그 요청 작업을 실행하는 동안(app.core.threadpool이 RequestContext.profile에 등록). 전용 벌크헤드 스레드(압축·스토리지)는 제외.
+# 동시 세션은 PROFILE_MAX_CONCURRENT개까지, 초과 요청은 프로파일 없이 처리(profile_skipped_total).
+# 결과는 folded stack(한 줄 "프레임;프레임;... 샘플수", flamegraph.pl·speedscope 호환)으로 PROFILE_DIR/{request_id}.folded에 저장 → /admin/profiles에서 다운로드.
+# 트리거: X-Profile 헤더 = ADMIN_TOKEN, 또는 샘플링 비율(관리자 토글, KV에 TTL로 저장해 워커 간 공유·자동 해제). 비활성 시 파이프라인 분기 1회 외 비용 없음.
+import asyncio
+import collections
+import logging
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from types import FrameType
+from typing import Dict, List, Optional, Set
+
+from app.core.config import settings
+from app.core.metrics import Counter, register
+
+log = logging.getLogger(__name__)
+
+SAMPLE_RATE_KEY = "profiler:sample_rate"
+_SAFE_ID = re.compile(r"^[A-Za-z0-9_.-]{1,64}$")
+_MAX_DEPTH = 128
+
+PROFILE_SKIPPED = register(Counter("profile_skipped_total", "동시 프로파일 상한(PROFILE_MAX_CONCURRENT)으로 건너뛴 요청 수"))
+
+
+def profile_dir() -> Path:
+    return Path(settings.PROFILE_DIR or os.path.join(tempfile.gettempdir(), "puppytalk-profiles"))
+
+
+def is_safe_profile_id(request_id: str) -> bool:
+    """request_id는 클라이언트 헤더에서 올 수 있으므로 파일명으로 쓰기 전 검사(경로 조작 방지)."""
+    return bool(_SAFE_ID.match(request_id)) and request_id not in (".", "..")
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    name = getattr(code, "co_qualname", code.co_name)
+    return f"{name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class ProfileSession:
+    """프로파일 중인 요청 1건. anchor는 파이프라인 코루틴 프레임, threads는 이 요청 작업을 실행 중인 스레드풀 스레드 id."""
+
+    __slots__ = ("request_id", "loop_thread", "anchor", "threads", "samples")
+
+    def __init__(self, request_id: str, loop_thread: int, anchor: FrameType) -> None:
+        self.request_id = request_id
+        self.loop_thread = loop_thread
+        self.anchor = anchor
+        self.threads: Set[int] = set()
+        self.samples: "collections.Counter[str]" = collections.Counter()
+
+    def folded(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+
+def _runs(frame: Optional[FrameType], anchor: FrameType) -> bool:
+    """이벤트 루프 스레드 스택에 요청의 코루틴 프레임이 있으면 그 요청을 실행 중."""
+    while frame is not None:
+        if frame is anchor:
+            return True
+        frame = frame.f_back
+    return False
+
+
+def _collapse(frame: Optional[FrameType], thread_name: str) -> str:
+    stack: List[str] = []
+    while frame is not None and len(stack) < _MAX_DEPTH:
+        stack.append(_frame_label(frame))
+        frame = frame.f_back
+    stack.append(thread_name)
+    stack.reverse()
+    return ";".join(stack)
+
+
+class StackSampler:
+    """프로세스 공용 샘플러. 첫 세션에서 스레드 시작, 세션이 없으면 대기. 한 틱에 sys._current_frames()는 1회만 읽음."""
+
+    def __init__(self, interval: float, max_sessions: int) -> None:
+        self.interval = max(0.001, interval)
+        self.max_sessions = max(1, max_sessions)
+        self._sessions: Dict[int, ProfileSession] = {}
+        self._lock = threading.Lock()
+        self._active = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self, session: ProfileSession) -> bool:
+        """동시 세션 상한이면 False(프로파일하지 않음)."""
+        with self._lock:
+            if len(self._sessions) >= self.max_sessions:
+                return False
+            self._sessions[id(session)] = session
+            self._active.set()
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="profiler-sampler", daemon=True)
+                self._thread.start()
+        return True
+
+    def remove(self, session: ProfileSession) -> None:
+        """반환 후에는 세션에 샘플이 더 기록되지 않음(틱 전체가 같은 락 안)."""
+        with self._lock:
+            self._sessions.pop(id(session), None)
+            if not self._sessions:
+                self._active.clear()
+
+    def active(self) -> int:
+        return len(self._sessions)
+
+    def _run(self) -> None:
+        while True:
+            self._active.wait()
+            time.sleep(self.interval)
+            with self._lock:
+                if self._sessions:
+                    self._sample()
+
+    def _sample(self) -> None:
+        frames = sys._current_frames()
+        names = {t.ident: t.name for t in threading.enumerate()}
+        for session in self._sessions.values():
+            loop_frame = frames.get(session.loop_thread)
+            if _runs(loop_frame, session.anchor):
+                session.samples[_collapse(loop_frame, names.get(session.loop_thread, "loop"))] += 1
+            for thread_id in list(session.threads):
+                frame = frames.get(thread_id)
+                if frame is not None:
+                    session.samples[_collapse(frame, names.get(thread_id, str(thread_id)))] += 1
+
+
+sampler = StackSampler(settings.PROFILE_INTERVAL_MS / 1000, settings.PROFILE_MAX_CONCURRENT)
+
+
+def start_profile(request_id: str) -> Optional[ProfileSession]:
+    """요청 파이프라인(이벤트 루프)에서 호출. 호출한 코루틴 프레임을 이 요청의 기준 프레임으로. 상한 초과면 None."""
+    session = ProfileSession(request_id, threading.get_ident(), sys._getframe(1))
+    if not sampler.add(session):
+        PROFILE_SKIPPED.inc()
+        return None
+    return session
+
+
+def finish_profile(session: ProfileSession, method: str, path: str, duration_ms: float) -> None:
+    """세션 해제 → folded 파일 기록 → PROFILE_MAX_STORED 초과분은 오래된 것부터 삭제. 파일 I/O가 있으므로 스레드풀에서 호출. 실패해도 요청에는 영향 없음."""
+    sampler.remove(session)
+    directory = profile_dir()
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        header = f"# {method} {path} duration_ms={duration_ms:.2f} samples={sum(session.samples.values())}\n"
+        (directory / f"{session.request_id}.folded").write_text(header + session.folded(), encoding="utf-8")
+        files = sorted(directory.glob("*.folded"), key=lambda p: p.stat().st_mtime, reverse=True)
+        for old in files[max(1, settings.PROFILE_MAX_STORED):]:
+            old.unlink(missing_ok=True)
+    except OSError as e:
+        log.warning("프로파일 저장 실패 request_id=%s: %s", session.request_id, e)
+
+
+def list_profiles() -> List[Dict[str, object]]:
+    directory = profile_dir()
+    if not directory.is_dir():
+        return []
+    result = []
+    for p in sorted(directory.glob("*.folded"), key=lambda p: p.stat().st_mtime, reverse=True):
+        stat = p.stat()
+        result.append({"request_id": p.stem, "size": stat.st_size, "created_at": stat.st_mtime})
+    return result
+
+
+def read_profile(request_id: str) -> Optional[str]:
+    if not is_safe_profile_id(request_id):
+        return None
+    try:
+        return (profile_dir() / f"{request_id}.folded").read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+class ProfilerState:
+    """워커 내 현재 샘플링 비율. 관리자 토글 값(KV)을 주기적으로 읽어 갱신."""
+
+    def __init__(self, sample_rate: float) -> None:
+        self.default_rate = sample_rate
+        self.sample_rate = sample_rate
+
+
+profiler_state = ProfilerState(settings.PROFILE_SAMPLE_RATE)
+
+
+async def run_profiler_config_loop(app, stop_event: asyncio.Event) -> None:
+    """PROFILE_CONFIG_REFRESH초마다 KV의 샘플링 비율 반영. 키가 없거나 만료되면 설정 기본값."""
+    while not stop_event.is_set():
+        try:
+            value = await app.state.kv.get(SAMPLE_RATE_KEY)
+            profiler_state.sample_rate = float(value) if value is not None else profiler_state.default_rate
+        except Exception as e:
+            log.debug("프로파일러 설정 갱신 실패: %s", e)
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=settings.PROFILE_CONFIG_REFRESH)
+        except asyncio.TimeoutError:
+            pass
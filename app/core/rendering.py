@@ -0,0 +1,148 @@
+# 응답 형식 협상. Accept가 application/msgpack(또는 x-msgpack)을 JSON보다 선호하면 엔드포인트가 반환한 pydantic 모델(ApiResponse 등)을
+# 라우트 생성 시 1회 만든 response_model TypeAdapter로 JSON과 같은 필드명(camelCase)·구조(mode="json" 값)의 MessagePack으로 반환. 기본은 JSON.
+# JSON 응답은 FastAPI 기본 경로(response_model 검증·serialize_json) 그대로: 현재 FastAPI는 이미 pydantic-core로 바로 JSON 바이트를 만들어
+# 별도 빠른 경로의 이득이 없음(실측 100건 피드 0.76ms vs 0.79ms).
+# 직렬화 중 값이 response_model 타입과 다르면(dict 등) warnings="error"로 감지해 JSON 기본 경로(검증·필터링)로 넘김.
+import functools
+import inspect
+from typing import Any, Callable, Dict, Optional
+
+import msgpack
+from fastapi.datastructures import DefaultPlaceholder
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import PydanticSerializationError
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.core.config import settings
+from app.core.context import request_ctx
+from app.core.metrics import Counter, register
+from app.core.middleware.admission import AdmissionRoute
+from app.core.timing import TimedRoute
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+_MSGPACK_TYPES = frozenset({"application/msgpack", "application/x-msgpack"})
+_JSON_RANGES = frozenset({"application/json", "application/*", "*/*"})
+_VARY_ACCEPT = {"Vary": "Accept"}
+
+RENDER_FALLBACK = register(
+    Counter("response_render_fallback_total", "MessagePack 대신 FastAPI JSON 검증 경로로 넘긴 응답 수", ("route",))
+)
+
+# 응답 모델 필터링 옵션. 하나라도 쓰면 MessagePack 대상 아님(FastAPI가 JSON에 적용)
+_FILTER_OPTIONS = (
+    "response_model_include",
+    "response_model_exclude",
+    "response_model_exclude_unset",
+    "response_model_exclude_defaults",
+    "response_model_exclude_none",
+)
+
+
+def render_msgpack(adapter: TypeAdapter, value: Any) -> Optional[bytes]:
+    """JSON 출력과 같은 키(별칭)·값(날짜는 ISO 문자열 등)을 MessagePack으로. 값이 타입과 맞지 않으면 None."""
+    try:
+        return msgpack.packb(adapter.dump_python(value, mode="json", by_alias=True, warnings="error"))
+    except PydanticSerializationError:
+        return None
+
+
+def prefers_msgpack(accept: bytes) -> bool:
+    """Accept 헤더에서 MessagePack q값이 JSON(application/json·와일드카드) 이상이고 0보다 크면 True. 명시하지 않으면 JSON."""
+    msgpack_q = 0.0
+    json_q = 0.0
+    for item in accept.decode("latin-1").lower().split(","):
+        media_type, _, params = item.partition(";")
+        media_type = media_type.strip()
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if media_type in _MSGPACK_TYPES:
+            msgpack_q = max(msgpack_q, q)
+        elif media_type in _JSON_RANGES:
+            json_q = max(json_q, q)
+    return msgpack_q > 0 and msgpack_q >= json_q
+
+
+def _wants_msgpack() -> bool:
+    """현재 요청(RequestContext.scope)의 Accept 헤더 기준. sync 엔드포인트 스레드에서도 contextvar로 조회."""
+    ctx = request_ctx.get()
+    if ctx is None or ctx.scope is None:
+        return False
+    for name, value in ctx.scope["headers"]:
+        if name == b"accept":
+            return prefers_msgpack(value)
+    return False
+
+
+def _renderable(route_kwargs: Dict[str, Any]) -> bool:
+    response_model = route_kwargs.get("response_model")
+    if not (isinstance(response_model, type) and issubclass(response_model, BaseModel)):
+        return False
+    if not isinstance(route_kwargs.get("response_class", DefaultPlaceholder(None)), DefaultPlaceholder):
+        return False
+    if route_kwargs.get("status_code") in (204, 304) or not route_kwargs.get("response_model_by_alias", True):
+        return False
+    return not any(route_kwargs.get(name) for name in _FILTER_OPTIONS)
+
+
+def rendered_endpoint(endpoint: Callable[..., Any], path: str, route_kwargs: Dict[str, Any]) -> Callable[..., Any]:
+    """MessagePack을 선호하는 요청이면 반환 모델을 MessagePack Response로 바꾸는 래퍼. 그 외에는 반환값 그대로(FastAPI JSON 경로)."""
+    adapter = TypeAdapter(route_kwargs["response_model"])
+    status_code = route_kwargs.get("status_code") or 200
+    labels = (path,)
+
+    def respond(result: Any) -> Any:
+        if not isinstance(result, BaseModel) or not _wants_msgpack():
+            return result
+        body = render_msgpack(adapter, result)
+        if body is None:
+            RENDER_FALLBACK.inc(labels)
+            return result
+        return Response(content=body, status_code=status_code, media_type=MSGPACK_MEDIA_TYPE, headers=_VARY_ACCEPT)
+
+    if inspect.iscoroutinefunction(endpoint):
+
+        @functools.wraps(endpoint)
+        async def async_endpoint(*args: Any, **kwargs: Any) -> Any:
+            return respond(await endpoint(*args, **kwargs))
+
+        return async_endpoint
+
+    @functools.wraps(endpoint)
+    def sync_endpoint(*args: Any, **kwargs: Any) -> Any:
+        return respond(endpoint(*args, **kwargs))
+
+    return sync_endpoint
+
+
+class RenderedRoute(AdmissionRoute, TimedRoute):
+    """라우터 route_class. 동시성 한도(AdmissionRoute) + TimedRoute 구간 기록 + MessagePack 협상(RESPONSE_MSGPACK_ENABLED). OpenAPI 스키마는 response_model 그대로."""
+
+    negotiates = False
+
+    def wrap_endpoint(self, path: str, endpoint: Callable[..., Any], route_kwargs: Dict[str, Any]) -> Callable[..., Any]:
+        endpoint = super().wrap_endpoint(path, endpoint, route_kwargs)
+        if settings.RESPONSE_MSGPACK_ENABLED and _renderable(route_kwargs):
+            self.negotiates = True
+            return rendered_endpoint(endpoint, path, route_kwargs)
+        return endpoint
+
+    def get_route_handler(self) -> Callable[[Request], Any]:
+        handler = super().get_route_handler()
+        if not self.negotiates:
+            return handler
+
+        async def negotiated_handler(request: Request) -> Response:
+            response = await handler(request)
+            # JSON 응답도 Accept에 따라 달라지는 표현 → 캐시가 형식을 섞지 않도록
+            if "vary" not in response.headers:
+                response.headers["Vary"] = "Accept"
+            return response
+
+        return negotiated_handler
@@ -0,0 +1,105 @@
+# 스레드풀 크기·대기 계측. sync 라우트·의존성·run_in_threadpool은 AnyIO 기본 리미터(기본 40) 토큰을 잡고 워커 스레드에서 실행.
+# 리미터가 DB 풀보다 크면 남는 스레드는 SessionLocal() 체크아웃에서 보이지 않게 대기 → THREADPOOL_SIZE(0=엔진당 pool_size+max_overflow)로 맞추고
+# 대기를 스레드 앞(threadpool_wait_seconds)으로 끌어올려 측정. 요청별 누적 대기(스레드·커넥션)는 RequestContext → Server-Timing.
+# 측정은 run_in_threadpool 래퍼(제출 → 워커 스레드에서 시작까지 = 토큰 대기 + 스레드 전달). FastAPI·Starlette가 sync 엔드포인트·의존성·응답
+# 직렬화에 쓰는 run_in_threadpool 이름을 install_threadpool_hooks()가 이 래퍼로 바꾸고, 앱 코드는 여기서 import.
+# 시작 시점에 요청 데드라인이 이미 지났으면 작업을 실행하지 않고 DeadlineExceeded(504).
+import functools
+import importlib
+import logging
+import threading
+import time
+from typing import Any, Callable, Optional, TypeVar
+
+import anyio.to_thread
+from anyio import CapacityLimiter
+
+from app.core.context import PHASE_RESPONDING, request_ctx
+from app.core.deadline import deadline_exceeded
+from app.core.metrics import Gauge, LabeledHistogram, register
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+THREADPOOL_WAIT = register(
+    LabeledHistogram(
+        "threadpool_wait_seconds",
+        "스레드풀 대기(초, 제출 → 워커 스레드 시작)",
+        buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+    )
+)
+THREADPOOL_CAPACITY = register(Gauge("threadpool_capacity", "스레드풀 최대 동시 실행 수"))
+THREADPOOL_BUSY = register(Gauge("threadpool_busy", "실행 중 스레드풀 작업 수"))
+THREADPOOL_QUEUED = register(Gauge("threadpool_queued", "스레드 대기 중 작업 수"))
+
+# run_in_threadpool을 전역 이름으로 조회하는 모듈(호출 시점 조회라 모듈 속성 교체로 충분)
+_HOOKED_MODULES = ("starlette.concurrency", "fastapi.concurrency", "fastapi.routing", "fastapi.dependencies.utils")
+
+_limiter: Optional[CapacityLimiter] = None
+
+
+async def run_in_threadpool(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """starlette.concurrency.run_in_threadpool과 같은 시그니처. 대기 시간·실행/대기 작업 수·데드라인 확인을 더함."""
+    submitted = time.perf_counter()
+    THREADPOOL_QUEUED.inc()
+    # anyio.to_thread.run_sync가 contextvars를 복사 → 워커 스레드에서도 같은 RequestContext
+    return await anyio.to_thread.run_sync(functools.partial(_run, submitted, func, *args, **kwargs))
+
+
+def _run(submitted: float, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """워커 스레드에서 실행. Gauge inc/dec는 락으로 보호돼 스레드 간 안전."""
+    waited = time.perf_counter() - submitted
+    THREADPOOL_QUEUED.dec()
+    THREADPOOL_WAIT.observe((), waited)
+    ctx = request_ctx.get()
+    profile = None
+    if ctx is not None:
+        ctx.thread_wait += waited
+        # 대기 중 데드라인이 지났으면 작업을 실행하지 않고 포기(응답 전송 중 작업은 제외)
+        if ctx.deadline is not None and ctx.phase != PHASE_RESPONDING and time.perf_counter() >= ctx.deadline:
+            raise deadline_exceeded("threadpool")
+        # 프로파일 중인 요청이면 실행하는 동안 이 스레드를 샘플 대상으로(app.core.profiler)
+        profile = ctx.profile
+    thread_id = threading.get_ident()
+    if profile is not None:
+        profile.threads.add(thread_id)
+    THREADPOOL_BUSY.inc()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        THREADPOOL_BUSY.dec()
+        if profile is not None:
+            profile.threads.discard(thread_id)
+
+
+def install_threadpool_hooks() -> None:
+    """FastAPI·Starlette의 run_in_threadpool 이름을 계측 래퍼로 교체. 여러 번 호출해도 같은 결과."""
+    for name in _HOOKED_MODULES:
+        module = importlib.import_module(name)
+        if getattr(module, "run_in_threadpool", None) is not None:
+            module.run_in_threadpool = run_in_threadpool
+
+
+def configure_threadpool(size: int) -> None:
+    """lifespan(이벤트 루프 안)에서 1회 호출. 기본 리미터 크기를 size 토큰으로 조정하고 계측 래퍼 설치."""
+    global _limiter
+    size = max(1, size)
+    _limiter = anyio.to_thread.current_default_thread_limiter()
+    _limiter.total_tokens = size
+    THREADPOOL_CAPACITY.set((), size)
+    install_threadpool_hooks()
+    log.info("스레드풀 크기=%s", size)
+
+
+def threadpool_stats() -> dict:
+    """/health(DEBUG)용. sync 라우트(워커 스레드)에서도 호출되므로 AnyIO 조회 없이 보관한 리미터로."""
+    if _limiter is None:
+        return {}
+    samples = THREADPOOL_WAIT.collect()["samples"]
+    return {
+        "capacity": _limiter.total_tokens,
+        "busy": _limiter.borrowed_tokens,
+        "queued": _limiter.statistics().tasks_waiting,
+        "wait": samples[0][1] if samples else None,
+    }
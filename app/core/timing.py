@@ -0,0 +1,195 @@
+# 요청 구간 타이밍(Server-Timing). 샘플링된 요청만 RequestContext.spans에 구간별 누적 시간(초)·횟수를 기록 → 파이프라인이 응답 헤더(선택: 로그)로 출력.
+# 구간: pre(바디 파싱·의존성·스레드풀 대기) / handler(엔드포인트) / post(응답 모델 검증·JSON 인코딩) / db(SQL 훅 누적값) / redis / storage
+# / pool(커넥션 체크아웃 대기) / threadpool(스레드 토큰 대기) / compress(응답 압축).
+# 비샘플 요청은 contextvar 조회 1회 + None 비교만 추가.
+import functools
+import inspect
+import logging
+import random
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from fastapi.routing import APIRoute
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.core.config import settings
+from app.core.context import RequestContext, request_ctx
+
+log = logging.getLogger("app.timing")
+
+SPAN_DESCRIPTIONS = {
+    "pre": "parse+deps+threadpool wait",
+    "handler": "endpoint",
+    "post": "validate+encode",
+    "db": "sql",
+    "redis": "redis",
+    "storage": "storage",
+    "compress": "gzip/br",
+}
+
+
+def should_sample() -> bool:
+    """DEBUG면 항상, 아니면 SERVER_TIMING_SAMPLE_RATE 비율."""
+    if settings.DEBUG:
+        return True
+    rate = settings.SERVER_TIMING_SAMPLE_RATE
+    return rate > 0 and random.random() < rate
+
+
+def _sampled() -> Optional[RequestContext]:
+    ctx = request_ctx.get()
+    return ctx if ctx is not None and ctx.spans is not None else None
+
+
+def add_span(ctx: RequestContext, name: str, seconds: float) -> None:
+    entry = ctx.spans.get(name)
+    if entry is None:
+        ctx.spans[name] = [seconds, 1]
+    else:
+        entry[0] += seconds
+        entry[1] += 1
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    ctx = _sampled()
+    if ctx is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        add_span(ctx, name, time.perf_counter() - start)
+
+
+def timed(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """sync/async 함수 공용 데코레이터. 같은 구간 이름은 호출마다 누적."""
+
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                ctx = _sampled()
+                if ctx is None:
+                    return await fn(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return await fn(*args, **kwargs)
+                finally:
+                    add_span(ctx, name, time.perf_counter() - start)
+
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            ctx = _sampled()
+            if ctx is None:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                add_span(ctx, name, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+def _timed_endpoint(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    """엔드포인트 실행 구간(handler)과 라우트 진입~실행 시작(pre) 기록. FastAPI는 __wrapped__로 원래 시그니처를 읽으므로 의존성·응답 모델 추론은 그대로."""
+
+    def enter(ctx: RequestContext) -> float:
+        now = time.perf_counter()
+        if ctx.route_started is not None:
+            add_span(ctx, "pre", now - ctx.route_started)
+        return now
+
+    def leave(ctx: RequestContext, start: float) -> None:
+        ctx.handler_ended = time.perf_counter()
+        add_span(ctx, "handler", ctx.handler_ended - start)
+
+    if inspect.iscoroutinefunction(endpoint):
+
+        @functools.wraps(endpoint)
+        async def async_endpoint(*args: Any, **kwargs: Any) -> Any:
+            ctx = _sampled()
+            if ctx is None:
+                return await endpoint(*args, **kwargs)
+            start = enter(ctx)
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                leave(ctx, start)
+
+        return async_endpoint
+
+    @functools.wraps(endpoint)
+    def sync_endpoint(*args: Any, **kwargs: Any) -> Any:
+        ctx = _sampled()
+        if ctx is None:
+            return endpoint(*args, **kwargs)
+        start = enter(ctx)
+        try:
+            return endpoint(*args, **kwargs)
+        finally:
+            leave(ctx, start)
+
+    return sync_endpoint
+
+
+class TimedRoute(APIRoute):
+    """라우터 route_class. 엔드포인트 전후로 pre/handler/post 구간 분리. post = 엔드포인트 반환 후 응답 객체 생성까지(response_model 검증·직렬화)."""
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        super().__init__(path, self.wrap_endpoint(path, endpoint, kwargs), **kwargs)
+
+    def wrap_endpoint(self, path: str, endpoint: Callable[..., Any], route_kwargs: Dict[str, Any]) -> Callable[..., Any]:
+        """하위 클래스 확장 지점(APIRoute 초기화 전 호출). 바깥에 감싼 작업은 handler 이후(post) 구간으로 집계."""
+        return _timed_endpoint(endpoint)
+
+    def get_route_handler(self) -> Callable[[Request], Any]:
+        handler = super().get_route_handler()
+
+        async def timed_handler(request: Request) -> Response:
+            ctx = _sampled()
+            if ctx is None:
+                return await handler(request)
+            ctx.route_started = time.perf_counter()
+            ctx.handler_ended = None
+            try:
+                return await handler(request)
+            finally:
+                if ctx.handler_ended is not None:
+                    add_span(ctx, "post", time.perf_counter() - ctx.handler_ended)
+
+        return timed_handler
+
+
+def _entries(ctx: RequestContext, total: float) -> List[str]:
+    entries = [f"total;dur={total * 1000:.2f}"]
+    if ctx.db_count:
+        entries.append(f'db;dur={ctx.db_time * 1000:.2f};desc="{ctx.db_count} queries"')
+    if ctx.pool_wait:
+        entries.append(f'pool;dur={ctx.pool_wait * 1000:.2f};desc="connection wait"')
+    if ctx.thread_wait:
+        entries.append(f'threadpool;dur={ctx.thread_wait * 1000:.2f};desc="thread wait"')
+    for name, (seconds, count) in ctx.spans.items():
+        desc = SPAN_DESCRIPTIONS.get(name, name)
+        if count > 1:
+            desc = f"{desc} x{count}"
+        entries.append(f'{name};dur={seconds * 1000:.2f};desc="{desc}"')
+    return entries
+
+
+def server_timing_header(ctx: RequestContext, total: float) -> bytes:
+    return ", ".join(_entries(ctx, total)).encode("latin-1")
+
+
+def log_spans(ctx: RequestContext, method: str, path: str, total: float) -> None:
+    """SERVER_TIMING_LOG=true일 때 요청 종료 후 구간 요약 1줄."""
+    log.info("timing %s %s %s", method, path, " ".join(_entries(ctx, total)))
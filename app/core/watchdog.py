@@ -0,0 +1,131 @@
+# 슬로우 요청 워치독. 별도 스레드가 진행 중 요청 레지스트리(context.inflight)를 주기적으로 검사해 SLOW_REQUEST_MS를 넘긴 요청의 스택을 캡처.
+# 이벤트 루프가 막혀도 동작하도록 asyncio 태스크가 아닌 스레드. 캡처: 처리 스레드 스택(sys._current_frames) + 요청 태스크의 코루틴 스택 + 실행 중 SQL.
+# 요청당 1회만 캡처, 최근 WATCHDOG_MAX_CAPTURES건 링 버퍼 보관 → /admin/slow-requests.
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.context import RequestContext, inflight
+from app.core.memory import register_cache_size
+from app.core.middleware.metrics import route_template
+
+log = logging.getLogger(__name__)
+
+_STATEMENT_MAX_CHARS = 2000
+
+captures: Deque[Dict[str, Any]] = deque(maxlen=max(1, settings.WATCHDOG_MAX_CAPTURES))
+register_cache_size("watchdog.captures", lambda: len(captures))
+register_cache_size("inflight_requests", lambda: len(inflight))
+
+
+def _route(ctx: RequestContext) -> str:
+    return route_template(ctx.scope) if ctx.scope is not None else ""
+
+
+def _truncate(statement: Optional[str]) -> Optional[str]:
+    if statement is None or len(statement) <= _STATEMENT_MAX_CHARS:
+        return statement
+    return statement[:_STATEMENT_MAX_CHARS] + "..."
+
+
+def inflight_snapshot() -> List[Dict[str, Any]]:
+    """진행 중 요청 목록(오래된 순). /admin/requests 응답용."""
+    now = time.perf_counter()
+    result = []
+    for ctx in list(inflight.values()):
+        scope = ctx.scope or {}
+        result.append(
+            {
+                "request_id": ctx.request_id,
+                "method": scope.get("method", ""),
+                "path": scope.get("path", ""),
+                "route": _route(ctx),
+                "age_ms": round((now - ctx.started) * 1000, 1),
+                "phase": ctx.phase,
+                "db_count": ctx.db_count,
+                "statement": _truncate(ctx.statement),
+            }
+        )
+    result.sort(key=lambda r: r["age_ms"], reverse=True)
+    return result
+
+
+def _task_stack(task: Any) -> List[str]:
+    """요청 태스크의 await 체인(바깥→안쪽). 스레드풀 대기 중이면 run_sync 지점까지."""
+    if task is None:
+        return []
+    try:
+        frames = task.get_stack()
+    except Exception:
+        return []
+    return [f'File "{f.f_code.co_filename}", line {f.f_lineno}, in {f.f_code.co_name}\n' for f in frames]
+
+
+def capture(ctx: RequestContext, frames: Dict[int, Any], now: float) -> Dict[str, Any]:
+    """처리 스레드가 알려져 있으면(ORM/SQL 실행 스레드) 그 스레드 스택, 아니면 이벤트 루프 스레드 스택 + 태스크 코루틴 스택."""
+    thread_id = ctx.thread_id
+    frame = frames.get(thread_id) if thread_id is not None else None
+    scope = ctx.scope or {}
+    return {
+        "request_id": ctx.request_id,
+        "method": scope.get("method", ""),
+        "path": scope.get("path", ""),
+        "route": _route(ctx),
+        "age_ms": round((now - ctx.started) * 1000, 1),
+        "phase": ctx.phase,
+        "db_count": ctx.db_count,
+        "statement": _truncate(ctx.statement),
+        "thread_stack": traceback.format_stack(frame) if frame is not None else [],
+        "task_stack": _task_stack(ctx.task),
+        "captured_at": time.time(),
+    }
+
+
+def check_once(threshold_sec: float) -> int:
+    """임계 초과·미캡처 요청 캡처. 캡처 건수 반환(테스트에서 직접 호출)."""
+    now = time.perf_counter()
+    slow = [ctx for ctx in list(inflight.values()) if not ctx.captured and now - ctx.started >= threshold_sec]
+    if not slow:
+        return 0
+    frames = sys._current_frames()
+    for ctx in slow:
+        ctx.captured = True
+        entry = capture(ctx, frames, now)
+        captures.append(entry)
+        log.warning(
+            "slow request in progress request_id=%s route=%s phase=%s age_ms=%.1f",
+            entry["request_id"],
+            entry["route"],
+            entry["phase"],
+            entry["age_ms"],
+        )
+    return len(slow)
+
+
+class Watchdog:
+    def __init__(self, interval: float, threshold_ms: int) -> None:
+        self.interval = max(0.01, interval)
+        self.threshold_sec = threshold_ms / 1000
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="slow-request-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                check_once(self.threshold_sec)
+            except Exception as e:
+                log.debug("watchdog 검사 실패: %s", e)
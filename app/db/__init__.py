@@ -1,17 +1,25 @@
 from .base import Base, utc_now
-from .connection import check_database, close_database, init_database
-from .engine import SessionLocal, SessionLocalReader, engine, reader_engine, writer_engine
+from .connection import check_database, close_database, init_database, probe_databases
+from .engine import SessionLocal, SessionLocalReader, connection_capacity, engine, reader_engine, writer_engine
+from .instrumentation import cached_statement, get_compiled_cache_stats
+from .pool import get_pool_stats, prefill_pools
 from .session import get_connection
 
 __all__ = [
     "Base",
     "SessionLocal",
     "SessionLocalReader",
+    "cached_statement",
     "check_database",
     "close_database",
+    "connection_capacity",
     "engine",
+    "get_compiled_cache_stats",
     "get_connection",
+    "get_pool_stats",
     "init_database",
+    "prefill_pools",
+    "probe_databases",
     "reader_engine",
     "utc_now",
     "writer_engine",
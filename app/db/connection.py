@@ -1,8 +1,12 @@
-# DB 연결 수명 주기. init_database, check_database(writer/reader 둘 다), close_database.
+# DB 연결 수명 주기. init_database, check_database(writer/reader 둘 다), probe_databases(헬스 프로버), close_database.
 import logging
+from typing import Dict, Optional
 
-from sqlalchemy import text
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
 
+from app.core.config import settings
 from app.db.engine import writer_engine, reader_engine
 
 logger = logging.getLogger(__name__)
@@ -24,6 +28,44 @@ def check_database() -> bool:
         return False
 
 
+# 헬스 프로버 전용 엔진(연결 1개 유지). 앱 풀·서킷 브레이커와 분리 → 장애·포화 중에도 프로브가 요청 트래픽과 커넥션을 다투지 않음
+_probe_engines: Optional[Dict[str, Engine]] = None
+
+
+def _make_probe_engine(source: Engine) -> Engine:
+    return create_engine(
+        source.url,
+        poolclass=QueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=settings.DB_PING_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        connect_args={"connect_timeout": settings.DB_PING_TIMEOUT, "read_timeout": settings.DB_PING_TIMEOUT},
+    )
+
+
+def probe_databases() -> Dict[str, bool]:
+    """{"writer": bool, "reader": bool}. 백그라운드 프로버(스레드)에서 호출."""
+    global _probe_engines
+    if _probe_engines is None:
+        _probe_engines = {"writer": _make_probe_engine(writer_engine), "reader": _make_probe_engine(reader_engine)}
+    result: Dict[str, bool] = {}
+    for name, probe in _probe_engines.items():
+        try:
+            with probe.connect() as conn:
+                conn.execute(text("SELECT 1")).fetchone()
+            result[name] = True
+        except Exception as e:
+            logger.warning("DB 프로브 실패 engine=%s: %s", name, e)
+            result[name] = False
+    return result
+
+
 def close_database() -> None:
+    global _probe_engines
     writer_engine.dispose()
     reader_engine.dispose()
+    if _probe_engines is not None:
+        for probe in _probe_engines.values():
+            probe.dispose()
+        _probe_engines = None
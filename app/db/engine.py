@@ -1,4 +1,5 @@
 # DB 엔진·SessionLocal. WRITER_DB_URL/READER_DB_URL 분리 시 Read/Write Splitting. 미설정 시 _default_db_url() 사용.
+# 엔진별 서킷 브레이커(db.writer·db.reader): 장애 시 체크아웃 즉시 실패, reader OPEN이면 조회 세션은 writer로(app.api.dependencies.db).
 from urllib.parse import quote_plus
 
 from sqlalchemy import create_engine, event
@@ -6,6 +7,11 @@ from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
+from app.infra.circuit_breaker import CircuitBreaker, register_breaker
+from app.db.instrumentation import enable_strict_loading, instrument_sessions, instrument_statements
+from app.db.pool import InstrumentedQueuePool, PoolBudget, instrument_engine, pool_budget
+from app.db.sql_comment import instrument_sql_comments
+from app.db.statement_timeout import instrument_statement_timeouts
 
 
 def _default_db_url() -> str:
@@ -24,28 +30,48 @@ def _set_mysql_utc(engine: Engine) -> None:
         cursor.close()
 
 
-def _make_engine(url: str) -> Engine:
+def _breaker(name: str) -> CircuitBreaker:
+    return register_breaker(
+        CircuitBreaker(
+            f"db.{name}",
+            failure_threshold=settings.DB_BREAKER_FAILURE_THRESHOLD,
+            reset_timeout=settings.DB_BREAKER_RESET_TIMEOUT,
+        )
+    )
+
+
+def _create_pooled_engine(url: str, name: str, budget: PoolBudget, breaker: CircuitBreaker) -> Engine:
+    """pre_ping은 기본 off(체크아웃마다 왕복 제거). 오래 유휴였던 연결만 체크아웃 시 ping(app.db.pool.ping_idle_on_checkout)."""
+    connect_args = {"connect_timeout": settings.DB_PING_TIMEOUT}
+    if settings.DB_READ_TIMEOUT > 0:
+        connect_args["read_timeout"] = settings.DB_READ_TIMEOUT
     eng = create_engine(
         url,
-        pool_size=settings.DB_POOL_SIZE,
-        max_overflow=settings.DB_MAX_OVERFLOW,
+        poolclass=InstrumentedQueuePool,
+        pool_logging_name=name,
+        pool_size=budget.pool_size,
+        max_overflow=budget.max_overflow,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
         pool_recycle=settings.DB_POOL_RECYCLE,
-        pool_pre_ping=True,
-        connect_args={"connect_timeout": settings.DB_PING_TIMEOUT},
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args=connect_args,
     )
+    instrument_engine(eng, name, breaker)
+    instrument_statements(eng, name)
+    instrument_statement_timeouts(eng)
+    if settings.SQL_COMMENT_ENABLED:
+        instrument_sql_comments(eng)
+    return eng
+
+
+def _make_engine(url: str, budget: PoolBudget, breaker: CircuitBreaker) -> Engine:
+    eng = _create_pooled_engine(url, "writer", budget, breaker)
     _set_mysql_utc(eng)
     return eng
 
 
-def _make_reader_engine(url: str) -> Engine:
-    eng = create_engine(
-        url,
-        pool_size=settings.DB_POOL_SIZE,
-        max_overflow=settings.DB_MAX_OVERFLOW,
-        pool_recycle=settings.DB_POOL_RECYCLE,
-        pool_pre_ping=True,
-        connect_args={"connect_timeout": settings.DB_PING_TIMEOUT},
-    )
+def _make_reader_engine(url: str, budget: PoolBudget, breaker: CircuitBreaker) -> Engine:
+    eng = _create_pooled_engine(url, "reader", budget, breaker)
 
     @event.listens_for(eng, "connect")
     def _on_connect(dbapi_conn, connection_record):
@@ -60,11 +86,28 @@ def _make_reader_engine(url: str) -> Engine:
 _writer_url = settings.WRITER_DB_URL or _default_db_url()
 _reader_url = settings.READER_DB_URL or _writer_url
 
-writer_engine: Engine = _make_engine(_writer_url)
-reader_engine: Engine = _make_reader_engine(_reader_url)
+# 같은 URL이면 writer/reader 두 풀이 한 호스트 예산을 나눠 씀
+_budget = pool_budget(engines_on_host=2 if _reader_url == _writer_url else 1)
+
+writer_breaker = _breaker("writer")
+reader_breaker = _breaker("reader")
+writer_engine: Engine = _make_engine(_writer_url, _budget, writer_breaker)
+reader_engine: Engine = _make_reader_engine(_reader_url, _budget, reader_breaker)
+
+
+def connection_capacity() -> int:
+    """엔진 하나가 동시에 내줄 수 있는 최대 커넥션 수. THREADPOOL_SIZE=0이면 스레드풀 크기로 사용."""
+    return _budget.pool_size + _budget.max_overflow
+
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=writer_engine)
 SessionLocalReader = sessionmaker(autocommit=False, autoflush=False, bind=reader_engine)
 
+instrument_sessions(SessionLocal)
+instrument_sessions(SessionLocalReader)
+if settings.DB_STRICT_LOADING:
+    enable_strict_loading(SessionLocal)
+    enable_strict_loading(SessionLocalReader)
+
 # 하위 호환: engine = writer
 engine: Engine = writer_engine
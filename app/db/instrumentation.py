@@ -0,0 +1,140 @@
+# 엔진 실행 계측. 컴파일 캐시 hit/miss 집계, SQL 지문별 통계·슬로우 쿼리 로그(query_stats), 요청별 쿼리 수·DB 시간·단계·실행 중 SQL(RequestContext), strict loading(raiseload 기본).
+# strict loading: 핫 쿼리(cached_statement)는 구성 시 1회 raiseload('*')를 붙여 같은 문 객체·캐시 키를 재사용, 그 외 ORM SELECT만 실행 시 훅에서 붙임.
+import functools
+import threading
+import time
+from typing import Callable, Dict
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.default import CACHE_HIT, CACHE_MISS
+from sqlalchemy.sql import Select
+from sqlalchemy.orm import ORMExecuteState, raiseload, sessionmaker
+
+from app.core.config import settings
+from app.core.context import PHASE_DB, PHASE_HANDLER, PHASE_ORM, request_ctx
+from app.core.memory import register_cache_size
+from app.db.query_stats import record_query
+from app.db.sql_comment import strip_comment
+
+
+class CompiledCacheStats:
+    __slots__ = ("hits", "misses", "uncached")
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.uncached = 0
+
+
+_CACHE_STATS: Dict[str, CompiledCacheStats] = {}
+_ENGINES: Dict[str, Engine] = {}
+
+
+def instrument_statements(engine: Engine, name: str) -> None:
+    """컴파일 캐시 통계·요청별 쿼리 계측 리스너 등록. 엔진 생성 직후 1회 호출."""
+    stats = _CACHE_STATS.setdefault(name, CompiledCacheStats())
+    _ENGINES[name] = engine
+    cache = getattr(engine, "_compiled_cache", None)
+    if cache is not None:
+        register_cache_size(f"sqlalchemy.compiled_cache.{name}", cache.__len__)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+        ctx = request_ctx.get()
+        if ctx is not None:
+            ctx.phase = PHASE_DB
+            ctx.statement = statement
+            ctx.thread_id = threading.get_ident()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        cache_hit = getattr(context, "cache_hit", None)
+        if cache_hit is CACHE_HIT:
+            stats.hits += 1
+        elif cache_hit is CACHE_MISS:
+            stats.misses += 1
+        else:
+            stats.uncached += 1
+        starts = conn.info.get("query_start")
+        if not starts:
+            return
+        elapsed = time.perf_counter() - starts.pop()
+        # 주석 태그·MAX_EXECUTION_TIME 힌트가 붙기 전 원문(context.statement)으로 집계
+        original = context.statement if context is not None else strip_comment(statement)
+        record_query(name, original, elapsed, cursor.rowcount if cursor is not None else -1)
+        ctx = request_ctx.get()
+        if ctx is not None:
+            ctx.db_count += 1
+            ctx.db_time += elapsed
+            ctx.phase = PHASE_HANDLER
+            ctx.statement = None
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context):
+        """실패한 문장은 after_cursor_execute가 불리지 않으므로 시작 시각만 정리."""
+        conn = exception_context.connection
+        starts = conn.info.get("query_start") if conn is not None else None
+        if starts:
+            starts.pop()
+
+
+def instrument_sessions(session_factory: sessionmaker) -> None:
+    """ORM 실행 시작(커넥션 체크아웃 전) 시점에 요청 단계·처리 스레드 기록 → 풀 고갈로 대기 중인 요청도 워치독이 스택을 잡음."""
+
+    @event.listens_for(session_factory, "do_orm_execute")
+    def _mark_orm_phase(orm_execute_state: ORMExecuteState) -> None:
+        ctx = request_ctx.get()
+        if ctx is not None:
+            ctx.phase = PHASE_ORM
+            ctx.thread_id = threading.get_ident()
+
+
+# cached_statement가 이미 raiseload를 붙인 문 표시(실행 옵션, 캐시 키에 포함되지 않음)
+_STRICT_OPTION = "strict_loading"
+
+
+def cached_statement(builder: Callable[[], Select]) -> Callable[[], Select]:
+    """핫 쿼리 구성을 첫 호출 시 1회 만들고 같은 객체 재사용(lru_cache, 값은 bindparam). DB_STRICT_LOADING이면 raiseload('*')도 이때 1회."""
+
+    @functools.lru_cache(maxsize=None)
+    @functools.wraps(builder)
+    def build() -> Select:
+        statement = builder()
+        if settings.DB_STRICT_LOADING:
+            statement = statement.options(raiseload("*")).execution_options(**{_STRICT_OPTION: True})
+        return statement
+
+    return build
+
+
+def enable_strict_loading(session_factory: sessionmaker) -> None:
+    """ORM SELECT에 raiseload('*') 기본 적용. options로 명시하지 않은 관계 접근(지연 로딩) 시 즉시 예외 → 테스트에서 N+1 검출.
+    cached_statement 문은 이미 적용돼 있어 건너뜀(문을 바꾸면 매 실행 캐시 키 재계산)."""
+
+    @event.listens_for(session_factory, "do_orm_execute")
+    def _raiseload_by_default(orm_execute_state: ORMExecuteState) -> None:
+        if (
+            orm_execute_state.is_select
+            and not orm_execute_state.execution_options.get(_STRICT_OPTION)
+            and not orm_execute_state.is_column_load
+            and not orm_execute_state.is_relationship_load
+        ):
+            orm_execute_state.statement = orm_execute_state.statement.options(raiseload("*"))
+
+
+def get_compiled_cache_stats() -> Dict[str, dict]:
+    """엔진별 {hits, misses, uncached(텍스트 SQL 등 캐시 대상 아님), size, capacity}."""
+    result: Dict[str, dict] = {}
+    for name, engine in _ENGINES.items():
+        stats = _CACHE_STATS[name]
+        cache = getattr(engine, "_compiled_cache", None)
+        result[name] = {
+            "hits": stats.hits,
+            "misses": stats.misses,
+            "uncached": stats.uncached,
+            "size": len(cache) if cache is not None else 0,
+            "capacity": getattr(cache, "capacity", 0),
+        }
+    return result
@@ -0,0 +1,197 @@
+# 커넥션 풀 계측·예산. InstrumentedQueuePool(체크아웃 대기 히스토그램·서킷 브레이커), 풀 이벤트 카운터, 호스트당 예산 산출, prefill, 유휴 연결 헬스체크.
+# 유휴 연결 헬스체크는 체크아웃 이벤트에서: DB_POOL_HEALTHCHECK_INTERVAL초 이상 유휴였던 연결만 ping, 실패하면 DisconnectionError → 풀이 폐기 후 새 연결로 재시도.
+# (백그라운드에서 풀 연결을 꺼내 점검하면 요청 트래픽과 체크아웃을 다투므로 쓰지 않음)
+# 브레이커: 새 연결 생성 실패·실행 중 연결 끊김이 연속되면 OPEN → 체크아웃에서 connect_timeout을 기다리지 않고 CircuitOpenError(503).
+import logging
+import time
+from typing import Dict, List, NamedTuple, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DisconnectionError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+from app.core.config import settings
+from app.core.context import request_ctx
+from app.core.metrics import Histogram, LabeledHistogram, register
+from app.infra.circuit_breaker import HALF_OPEN, CircuitBreaker
+
+log = logging.getLogger(__name__)
+
+# connection_record.info 키: 마지막 반납 시각(monotonic)
+_IDLE_SINCE = "idle_since"
+
+CHECKOUT_WAIT = register(
+    LabeledHistogram("db_pool_checkout_wait_seconds", "DB 커넥션 체크아웃 대기(초)", labelnames=("engine",))
+)
+
+
+class PoolBudget(NamedTuple):
+    pool_size: int
+    max_overflow: int
+
+
+class PoolStats:
+    """엔진(풀)별 누적 카운터·체크아웃 대기 히스토그램. 풀 recreate(dispose) 후에도 유지되도록 이름 기준으로 보관."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.checkout_wait = Histogram()
+        self.checkouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.stale = 0
+        self.breaker: Optional[CircuitBreaker] = None
+
+
+_STATS: Dict[str, PoolStats] = {}
+_ENGINES: Dict[str, Engine] = {}
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool._do_get 소요 시간 = 체크아웃 대기(유휴 연결 대기 + 신규 연결 생성). pool_logging_name으로 PoolStats 조회. 요청 중이면 요청별 대기에도 누적."""
+
+    def _do_get(self):
+        stats = _STATS.get(self.logging_name or "")
+        if stats is None:
+            return super()._do_get()
+        breaker = stats.breaker
+        if breaker is not None:
+            breaker.check()
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            # 풀 포화는 DB 장애가 아님
+            stats.timeouts += 1
+            if breaker is not None:
+                breaker.release_trial()
+            raise
+        except Exception:
+            # 새 연결 생성 실패(connect_timeout·접속 거부 등)
+            if breaker is not None:
+                breaker.record_failure()
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            stats.checkout_wait.observe(waited)
+            CHECKOUT_WAIT.observe((stats.name,), waited)
+            ctx = request_ctx.get()
+            if ctx is not None:
+                ctx.pool_wait += waited
+
+
+def pool_budget(engines_on_host: int) -> PoolBudget:
+    """DB_MAX_CONNECTIONS_PER_HOST > 0 이면 상한 / 워커 수 / 같은 호스트 엔진 수로 엔진별 크기 산출(overflow는 1/4). 0이면 DB_POOL_SIZE·DB_MAX_OVERFLOW."""
+    cap = settings.DB_MAX_CONNECTIONS_PER_HOST
+    if cap <= 0:
+        return PoolBudget(settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW)
+    workers = max(1, settings.WEB_CONCURRENCY)
+    per_engine = max(1, cap // workers // max(1, engines_on_host))
+    overflow = per_engine // 4
+    return PoolBudget(per_engine - overflow, overflow)
+
+
+def instrument_engine(engine: Engine, name: str, breaker: Optional[CircuitBreaker] = None) -> None:
+    """풀 이벤트(connect·checkout·invalidate) 카운터·서킷 브레이커 등록. 엔진 생성 직후 1회 호출."""
+    stats = _STATS.setdefault(name, PoolStats(name))
+    stats.breaker = breaker
+    _ENGINES[name] = engine
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_conn, connection_record):
+        stats.connects += 1
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_conn, connection_record, connection_proxy):
+        stats.checkouts += 1
+
+    @event.listens_for(engine, "invalidate")
+    def _on_invalidate(dbapi_conn, connection_record, exception):
+        stats.invalidations += 1
+
+    max_idle = settings.DB_POOL_HEALTHCHECK_INTERVAL
+    if max_idle > 0 and not settings.DB_POOL_PRE_PING:
+        ping_idle_on_checkout(engine, stats, max_idle)
+
+    if breaker is None:
+        return
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _on_statement_ok(conn, cursor, statement, parameters, context, executemany):
+        breaker.record_success()
+
+    @event.listens_for(engine, "handle_error")
+    def _on_statement_error(exception_context):
+        # 연결 끊김만 장애로 집계(문법·제약 위반·MAX_EXECUTION_TIME 중단은 DB가 응답한 것)
+        if exception_context.is_disconnect:
+            breaker.record_failure()
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_conn, connection_record):
+        # 실행 없이 반납된 시험 체크아웃이 HALF_OPEN을 붙잡지 않도록
+        if breaker.state == HALF_OPEN:
+            breaker.release_trial()
+
+
+def ping_idle_on_checkout(engine: Engine, stats: PoolStats, max_idle: float) -> None:
+    """반납 후 max_idle초 이상 지난 연결만 체크아웃 시 ping(pool_pre_ping은 매번). 요청 스레드가 이미 잡은 연결이라 다른 체크아웃과 경합 없음."""
+
+    @event.listens_for(engine, "checkin")
+    def _mark_idle(dbapi_conn, connection_record):
+        connection_record.info[_IDLE_SINCE] = time.monotonic()
+
+    @event.listens_for(engine, "checkout")
+    def _ping_if_idle(dbapi_conn, connection_record, connection_proxy):
+        idle_since = connection_record.info.pop(_IDLE_SINCE, None)
+        if idle_since is None or time.monotonic() - idle_since < max_idle:
+            return
+        try:
+            engine.dialect.do_ping(dbapi_conn)
+        except Exception as e:
+            stats.stale += 1
+            log.warning("DB 유휴 연결 ping 실패 engine=%s: %s", stats.name, e)
+            # 풀이 이 연결을 폐기하고 새 연결로 체크아웃 재시도
+            raise DisconnectionError(str(e)) from e
+
+
+def get_pool_stats() -> Dict[str, dict]:
+    """엔진별 현재 상태(size·checked_out·checked_in·overflow)와 누적 카운터·대기 히스토그램."""
+    result: Dict[str, dict] = {}
+    for name, engine in _ENGINES.items():
+        pool = engine.pool
+        stats = _STATS[name]
+        result[name] = {
+            "size": pool.size() if hasattr(pool, "size") else 0,
+            "checked_out": pool.checkedout() if hasattr(pool, "checkedout") else 0,
+            "checked_in": pool.checkedin() if hasattr(pool, "checkedin") else 0,
+            "overflow": max(0, pool.overflow()) if hasattr(pool, "overflow") else 0,
+            "checkouts": stats.checkouts,
+            "connects": stats.connects,
+            "invalidations": stats.invalidations,
+            "timeouts": stats.timeouts,
+            "stale": stats.stale,
+            "checkout_wait": stats.checkout_wait.snapshot(),
+        }
+    return result
+
+
+def prefill_pools() -> None:
+    """시작 시 엔진별 DB_POOL_MIN_SIZE개(pool_size 상한) 연결을 미리 만들어 첫 요청의 연결 생성 비용 제거."""
+    target = settings.DB_POOL_MIN_SIZE
+    if target <= 0:
+        return
+    for name, engine in _ENGINES.items():
+        count = min(target, engine.pool.size())
+        conns: List = []
+        try:
+            for _ in range(count):
+                conns.append(engine.pool.connect())
+        except Exception as e:
+            log.warning("DB 풀 prefill 실패 engine=%s (%s/%s): %s", name, len(conns), count, e)
+        finally:
+            for conn in conns:
+                conn.close()
+        log.info("DB 풀 prefill engine=%s connections=%s", name, len(conns))
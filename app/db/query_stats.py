@@ -0,0 +1,117 @@
+# SQL 지문(fingerprint)별 집계·슬로우 쿼리 로그. 리터럴·바인드 파라미터를 ?로, IN 목록을 (?+)로 접어 같은 모양의 쿼리를 한 행으로 묶음.
+# 엔진별 지문마다 횟수·총 시간·최대·반환 행 수 누적, 최근 QUERY_STATS_SAMPLES건 소요 시간으로 p50/p99 → /admin/queries 상위 N.
+# SLOW_QUERY_MS 이상 걸린 문장은 request_id(로그 필터)와 함께 WARNING. 집계는 워커(프로세스) 단위.
+import functools
+import logging
+import re
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.memory import register_cache_size
+
+log = logging.getLogger("app.db.slow_query")
+
+OTHER_FINGERPRINT = "<other>"
+_STATEMENT_SAMPLE_CHARS = 1000
+_FINGERPRINT_CACHE_SIZE = 1024
+
+_COMMENT = re.compile(r"/\*.*?\*/|--[^\n]*", re.S)
+_STRING = re.compile(r"'(?:[^'\\]|\\.|'')*'")
+_PARAM = re.compile(r"%\([^)]+\)s|%s|\?|:\w+")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.I)
+_VALUES_LIST = re.compile(r"\bVALUES\s*\(.*?\)(?:\s*,\s*\(.*?\))*", re.I | re.S)
+_SPACE = re.compile(r"\s+")
+
+
+# 문장 문자열 → 지문. 컴파일 캐시 덕분에 같은 문자열이 반복되므로 정규식은 처음 한 번만.
+# 스레드풀 여러 스레드에서 호출 → lru_cache(내부 락으로 스레드 안전, 상한 초과 시 가장 오래 안 쓴 항목 제거)
+@functools.lru_cache(maxsize=_FINGERPRINT_CACHE_SIZE)
+def fingerprint(statement: str) -> str:
+    fp = _COMMENT.sub(" ", statement)
+    fp = _STRING.sub("?", fp)
+    fp = _PARAM.sub("?", fp)
+    fp = _NUMBER.sub("?", fp)
+    fp = _IN_LIST.sub("IN (?+)", fp)
+    fp = _VALUES_LIST.sub("VALUES (?+)", fp)
+    return _SPACE.sub(" ", fp).strip()
+
+
+class QueryStats:
+    __slots__ = ("count", "total", "max", "rows", "durations", "statement")
+
+    def __init__(self, statement: str, samples: int) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.rows = 0
+        self.durations: Deque[float] = deque(maxlen=samples)
+        self.statement = statement[:_STATEMENT_SAMPLE_CHARS]
+
+
+_lock = threading.Lock()
+_stats: Dict[Tuple[str, str], QueryStats] = {}
+register_cache_size("db.query_stats", lambda: len(_stats))
+register_cache_size("db.query_fingerprints", lambda: fingerprint.cache_info().currsize)
+
+
+def record_query(engine_name: str, statement: str, elapsed: float, rows: int) -> None:
+    """after_cursor_execute에서 호출(스레드풀 여러 스레드). 지문 수가 QUERY_STATS_MAX_FINGERPRINTS를 넘으면 <other>로 합산."""
+    if not settings.QUERY_STATS_ENABLED:
+        return
+    fp = fingerprint(statement)
+    if elapsed * 1000 >= settings.SLOW_QUERY_MS:
+        log.warning("slow query %.1fms engine=%s rows=%s: %s", elapsed * 1000, engine_name, rows, fp)
+    key = (engine_name, fp)
+    with _lock:
+        stats = _stats.get(key)
+        if stats is None:
+            if len(_stats) >= settings.QUERY_STATS_MAX_FINGERPRINTS:
+                key = (engine_name, OTHER_FINGERPRINT)
+                stats = _stats.get(key)
+            if stats is None:
+                stats = _stats[key] = QueryStats(statement, settings.QUERY_STATS_SAMPLES)
+        stats.count += 1
+        stats.total += elapsed
+        stats.max = max(stats.max, elapsed)
+        stats.rows += max(0, rows)
+        stats.durations.append(elapsed)
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def _row(key: Tuple[str, str], stats: QueryStats, durations: List[float]) -> Dict[str, Any]:
+    durations.sort()
+    return {
+        "engine": key[0],
+        "fingerprint": key[1],
+        "count": stats.count,
+        "total_ms": round(stats.total * 1000, 2),
+        "mean_ms": round(stats.total / stats.count * 1000, 3),
+        "p50_ms": round(_percentile(durations, 0.5) * 1000, 3),
+        "p99_ms": round(_percentile(durations, 0.99) * 1000, 3),
+        "max_ms": round(stats.max * 1000, 3),
+        "rows": stats.rows,
+        "rows_per_call": round(stats.rows / stats.count, 2),
+        "sample": stats.statement,
+    }
+
+
+def top_queries(limit: int = 20, sort: str = "total_ms", engine: Optional[str] = None) -> List[Dict[str, Any]]:
+    """sort: total_ms | count | mean_ms | p99_ms | max_ms | rows (내림차순)."""
+    with _lock:
+        items = [(key, stats, list(stats.durations)) for key, stats in _stats.items() if engine is None or key[0] == engine]
+    rows = [_row(key, stats, durations) for key, stats, durations in items]
+    rows.sort(key=lambda r: r[sort], reverse=True)
+    return rows[:limit]
+
+
+def reset_query_stats() -> None:
+    with _lock:
+        _stats.clear()
@@ -0,0 +1,77 @@
+# SQL 주석 태깅(sqlcommenter 형식). 요청 중 실행되는 문장 끝에 /*controller='...',route='...'*/ 를 붙여(request_id는 SQL_COMMENT_FIELDS로 선택)
+# MySQL performance_schema·processlist·슬로우 로그에서 엔드포인트·요청으로 역추적. 값은 URL 인코딩(주석 종료·따옴표 주입 불가).
+# MySQL 다이제스트(events_statements_summary_by_digest)는 주석을 제외하고 정규화하므로 request_id가 달라도 같은 쿼리는 한 다이제스트로 묶임.
+# 태그는 요청당 1회 계산해 RequestContext에 보관, SQLAlchemy 컴파일 캐시 이후(커서 직전)에 붙이므로 캐시 키에는 영향 없음.
+from typing import Optional, Tuple
+from urllib.parse import quote
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.core.context import RequestContext, request_ctx
+from app.core.middleware.metrics import UNMATCHED_ROUTE, route_template
+
+_REQUEST_ID_MAX_CHARS = 128
+
+
+def _controller(scope: dict) -> str:
+    endpoint = scope.get("endpoint")
+    if endpoint is None:
+        return ""
+    # app.domain.posts.router → posts.get_posts
+    parts = (getattr(endpoint, "__module__", "") or "").split(".")
+    package = parts[-2] if len(parts) >= 2 else parts[0]
+    return f"{package}.{getattr(endpoint, '__name__', '')}"
+
+
+def build_comment(ctx: RequestContext, fields: Tuple[str, ...]) -> str:
+    """키 정렬·값 URL 인코딩(sqlcommenter 규칙). 라우팅 전이면 빈 문자열(다음 문장에서 다시 계산)."""
+    scope = ctx.scope or {}
+    route = route_template(scope)
+    if route == UNMATCHED_ROUTE:
+        return ""
+    values = {
+        "controller": _controller(scope),
+        "request_id": ctx.request_id[:_REQUEST_ID_MAX_CHARS],
+        "route": route,
+    }
+    pairs = [f"{key}='{quote(values[key], safe='')}'" for key in sorted(fields) if values.get(key)]
+    return f" /*{','.join(pairs)}*/" if pairs else ""
+
+
+def strip_comment(statement: str) -> str:
+    """통계·지문용 원문. 태깅이 붙인 끝 주석만 제거."""
+    if statement.endswith("*/"):
+        index = statement.rfind(" /*")
+        if index != -1:
+            return statement[:index]
+    return statement
+
+
+def parse_fields(spec: str) -> Tuple[str, ...]:
+    allowed = ("controller", "request_id", "route")
+    return tuple(f for f in (s.strip() for s in spec.split(",")) if f in allowed)
+
+
+def instrument_sql_comments(engine: Engine) -> None:
+    """SQL_COMMENT_ENABLED일 때 엔진 생성 직후 1회 호출. 요청 밖(정리 작업 등) 문장은 그대로."""
+    fields = parse_fields(settings.SQL_COMMENT_FIELDS)
+    if not fields:
+        return
+
+    @event.listens_for(engine, "before_cursor_execute", retval=True)
+    def _tag_statement(conn, cursor, statement, parameters, context, executemany):
+        ctx = request_ctx.get()
+        if ctx is None:
+            return statement, parameters
+        comment: Optional[str] = ctx.sql_comment
+        if comment is None:
+            comment = build_comment(ctx, fields)
+            if not comment:
+                return statement, parameters
+            ctx.sql_comment = comment
+        # pymysql(format/pyformat)은 파라미터가 None이 아니면(바인드 없는 문장의 빈 {} 포함) 문장에 % 포매팅 → URL 인코딩의 % 이스케이프
+        if parameters is not None and conn.dialect.paramstyle in ("format", "pyformat"):
+            return statement + comment.replace("%", "%%"), parameters
+        return statement + comment, parameters
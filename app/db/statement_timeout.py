@@ -0,0 +1,37 @@
+# 요청 데드라인 → SQL. 문장 실행 직전 남은 시간 확인: 이미 지났으면 실행하지 않고 DeadlineExceeded,
+# MySQL SELECT에는 /*+ MAX_EXECUTION_TIME(남은 ms) */ 힌트 → 서버가 초과 시 중단(에러 3024, 예외 핸들러가 504로 변환). 커넥션·스레드가 끝없이 묶이지 않음.
+# 힌트는 읽기 전용 SELECT에만 적용(MySQL 규칙). 쓰기 문장 상한은 DB_READ_TIMEOUT(소켓)·innodb_lock_wait_timeout.
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.context import request_ctx
+from app.core.deadline import deadline_exceeded
+
+# 쿼리 실행 시간 초과로 중단(ER_QUERY_TIMEOUT)
+MYSQL_QUERY_TIMEOUT = 3024
+
+
+def with_execution_time(statement: str, ms: int) -> str:
+    """SELECT 키워드 바로 뒤에 힌트 삽입(MySQL은 그 위치의 힌트만 인식). SELECT가 아니면 그대로."""
+    if statement[:7].upper() != "SELECT ":
+        return statement
+    return f"SELECT /*+ MAX_EXECUTION_TIME({max(1, ms)}) */ {statement[7:]}"
+
+
+def instrument_statement_timeouts(engine: Engine) -> None:
+    """엔진 생성 직후 1회 호출. 힌트는 MySQL 방언에서만, 데드라인 확인은 모든 방언."""
+    hint = engine.dialect.name == "mysql"
+
+    @event.listens_for(engine, "before_cursor_execute", retval=True)
+    def _apply_deadline(conn, cursor, statement, parameters, context, executemany):
+        ctx = request_ctx.get()
+        if ctx is None or ctx.deadline is None:
+            return statement, parameters
+        left = ctx.deadline - time.perf_counter()
+        if left <= 0:
+            raise deadline_exceeded("db")
+        if hint:
+            statement = with_execution_time(statement, int(left * 1000))
+        return statement, parameters
@@ -3,7 +3,6 @@ from __future__ import annotations
 
 from typing import Optional
 
-from redis.asyncio import Redis
 from sqlalchemy.orm import Session
 
 from app.auth.schema import (
@@ -15,7 +14,10 @@ from app.auth.schema import (
 )
 from app.common import ApiCode, ApiResponse, UserStatus, raise_http_error
 from app.api.dependencies import CurrentUser
+from app.core.config import settings
 from app.core.security import create_access_token, create_refresh_token, verify_password, verify_refresh_token
+from app.core.threadpool import run_in_threadpool
+from app.infra.kv import KVBackend
 from app.media.model import MediaModel
 from app.users.model import UsersModel
 
@@ -77,37 +79,46 @@ def login_user(data: LoginRequest, db: Session) -> tuple[ApiResponse[LoginSucces
     )
 
 
-async def logout_user(refresh_token: Optional[str], redis: Optional[Redis]) -> ApiResponse[None]:
+async def store_refresh_token(user_id: int, refresh_token: str, kv: KVBackend) -> None:
+    """rt:{user_id}에 현재 Refresh Token 저장(REFRESH_TOKEN_EXPIRE_DAYS 후 만료). 사용자당 1개.
+    공유 저장소(Redis) 미설정이면 저장하지 않음(JWT 서명·만료만 검증). 워커 메모리에 두면 다른 워커가 모름."""
+    if not kv.shared:
+        return
+    await kv.set_shared(f"{_REFRESH_KEY_PREFIX}{user_id}", refresh_token, ttl_seconds=settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400)
+
+
+async def logout_user(refresh_token: Optional[str], kv: KVBackend) -> ApiResponse[None]:
     if not refresh_token:
         return ApiResponse(code=ApiCode.LOGOUT_SUCCESS.value, data=None)
     try:
         payload = verify_refresh_token(refresh_token)
         user_id = payload.get("sub")
-        if user_id is not None and redis:
-            await redis.delete(f"{_REFRESH_KEY_PREFIX}{user_id}")
+        if user_id is not None and kv.shared:
+            await kv.delete(f"{_REFRESH_KEY_PREFIX}{user_id}")
     except Exception:
         pass
     return ApiResponse(code=ApiCode.LOGOUT_SUCCESS.value, data=None)
 
 
-async def revoke_refresh_for_user(user_id: int, redis: Optional[Redis]) -> None:
-    """비밀번호 변경·회원 탈퇴 시 Refresh Token 무효화."""
-    if redis:
-        await redis.delete(f"{_REFRESH_KEY_PREFIX}{user_id}")
+async def revoke_refresh_for_user(user_id: int, kv: KVBackend) -> None:
+    """비밀번호 변경·회원 탈퇴 시 Refresh Token 무효화. Redis 장애 중 실패한 삭제는 복구 후 재적용."""
+    if kv.shared:
+        await kv.delete(f"{_REFRESH_KEY_PREFIX}{user_id}")
 
 
 async def refresh_tokens(
-    refresh_token: Optional[str], redis: Optional[Redis], db: Session
+    refresh_token: Optional[str], kv: KVBackend, db: Session
 ) -> tuple[ApiResponse[AccessTokenData], str]:
     if not refresh_token:
         raise_http_error(401, ApiCode.UNAUTHORIZED)
     payload = verify_refresh_token(refresh_token)
     user_id = int(payload["sub"])
-    if redis:
-        stored = await redis.get(f"{_REFRESH_KEY_PREFIX}{user_id}")
+    # Redis에 저장된 토큰과 다르면 거절. Redis 장애 중이면 503(워커 메모리 사본으로 판단하지 않음), 미설정이면 검증 생략(단일 저장소 없음)
+    if kv.shared:
+        stored = await kv.get_shared(f"{_REFRESH_KEY_PREFIX}{user_id}")
         if stored is None or stored != refresh_token:
             raise_http_error(401, ApiCode.UNAUTHORIZED)
-    user = UsersModel.get_user_by_id(user_id, db=db)
+    user = await run_in_threadpool(UsersModel.get_user_by_id, user_id, db=db)
     if not user:
         raise_http_error(401, ApiCode.UNAUTHORIZED)
     if not UserStatus.is_active_value(user.status):
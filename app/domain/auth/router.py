@@ -1,8 +1,5 @@
 # 인증 라우터. 로그인·로그아웃·리프레시(JWT)·회원가입·GET /auth/me.
-from typing import Optional
-
 from fastapi import APIRouter, Depends, Request
-from redis.asyncio import Redis
 from sqlalchemy.orm import Session
 from starlette.responses import JSONResponse
 
@@ -10,11 +7,12 @@ from app.auth import controller
 from app.auth.schema import AccessTokenData, LoginSuccessData, SignUpRequest, LoginRequest, SessionUserResponse
 from app.common import ApiResponse
 from app.core.config import settings
-from app.api.dependencies import CurrentUser, get_current_user, get_master_db
-
-router = APIRouter(prefix="/auth", tags=["auth"])
+from app.core.rendering import RenderedRoute
+from app.core.threadpool import run_in_threadpool
+from app.api.dependencies import CurrentUser, get_current_user, get_kv, get_master_db
+from app.infra.kv import KVBackend
 
-_REFRESH_KEY_PREFIX = "rt:"
+router = APIRouter(prefix="/auth", tags=["auth"], route_class=RenderedRoute)
 
 
 def _refresh_ttl_seconds() -> int:
@@ -31,11 +29,12 @@ def signup(
 
 @router.post("/login", status_code=200, response_model=ApiResponse[LoginSuccessData])
 async def login(
-    request: Request,
     login_data: LoginRequest,
     db: Session = Depends(get_master_db),
+    kv: KVBackend = Depends(get_kv),
 ):
-    result, access_token, refresh_token, user_id = controller.login_user(login_data, db=db)
+    # DB 조회·bcrypt 검증은 블로킹 → 스레드풀(이벤트 루프 차단 방지)
+    result, access_token, refresh_token, user_id = await run_in_threadpool(controller.login_user, login_data, db=db)
     response = JSONResponse(content=result.model_dump(by_alias=True))
     response.set_cookie(
         key=settings.REFRESH_TOKEN_COOKIE_NAME,
@@ -46,17 +45,14 @@ async def login(
         samesite="lax",
         max_age=_refresh_ttl_seconds(),
     )
-    redis: Optional[Redis] = getattr(request.app.state, "redis", None)
-    if redis:
-        await redis.set(f"{_REFRESH_KEY_PREFIX}{user_id}", refresh_token, ex=_refresh_ttl_seconds())
+    await controller.store_refresh_token(user_id, refresh_token, kv)
     return response
 
 
 @router.post("/logout", status_code=200, response_model=ApiResponse[None])
-async def logout(request: Request):
+async def logout(request: Request, kv: KVBackend = Depends(get_kv)):
     refresh_token = request.cookies.get(settings.REFRESH_TOKEN_COOKIE_NAME)
-    redis: Optional[Redis] = getattr(request.app.state, "redis", None)
-    result = await controller.logout_user(refresh_token, redis)
+    result = await controller.logout_user(refresh_token, kv)
     response = JSONResponse(content=result.model_dump(by_alias=True))
     response.delete_cookie(key=settings.REFRESH_TOKEN_COOKIE_NAME, path="/")
     return response
@@ -66,10 +62,10 @@ async def logout(request: Request):
 async def refresh(
     request: Request,
     db: Session = Depends(get_master_db),
+    kv: KVBackend = Depends(get_kv),
 ):
     refresh_token = request.cookies.get(settings.REFRESH_TOKEN_COOKIE_NAME)
-    redis: Optional[Redis] = getattr(request.app.state, "redis", None)
-    result, _ = await controller.refresh_tokens(refresh_token, redis, db)
+    result, _ = await controller.refresh_tokens(refresh_token, kv, db)
     return JSONResponse(content=result.model_dump(by_alias=True))
 
 
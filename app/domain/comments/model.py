@@ -1,11 +1,11 @@
 # 댓글 CRUD. Comment ORM 반환, Controller/매퍼에서 Schema로 직렬화.
 from typing import List, Optional
 
-from sqlalchemy import select, update
+from sqlalchemy import bindparam, select, update
 from sqlalchemy.orm import Session, mapped_column, relationship, joinedload
 from sqlalchemy import Integer, Text, DateTime, ForeignKey
 
-from app.db import Base, utc_now
+from app.db import Base, cached_statement, utc_now
 from app.users.model import User, DogProfile
 
 
@@ -23,6 +23,34 @@ class Comment(Base):
     author = relationship(User, foreign_keys=[author_id])
 
 
+# 핫 쿼리는 첫 호출 시 1회 구성 후 재사용(bindparam). 호출마다 캐시 키 재계산 비용 제거.
+@cached_statement
+def _select_comment_by_id():
+    return (
+        select(Comment)
+        .where(Comment.id == bindparam("comment_id"), Comment.deleted_at.is_(None))
+        .options(
+            joinedload(Comment.author).joinedload(User.profile_image),
+            joinedload(Comment.author).selectinload(User.dogs).joinedload(DogProfile.profile_image),
+        )
+    )
+
+
+@cached_statement
+def _select_comments_page():
+    return (
+        select(Comment)
+        .where(Comment.post_id == bindparam("post_id"), Comment.deleted_at.is_(None))
+        .options(
+            joinedload(Comment.author).joinedload(User.profile_image),
+            joinedload(Comment.author).selectinload(User.dogs).joinedload(DogProfile.profile_image),
+        )
+        .order_by(Comment.id.desc())
+        .limit(bindparam("limit"))
+        .offset(bindparam("offset"))
+    )
+
+
 class CommentsModel:
     @classmethod
     def create_comment(cls, post_id: int, user_id: int, content: str, db: Session) -> Comment:
@@ -34,15 +62,7 @@ class CommentsModel:
 
     @classmethod
     def get_comment_by_id(cls, comment_id: int, db: Session) -> Optional[Comment]:
-        stmt = (
-            select(Comment)
-            .where(Comment.id == comment_id, Comment.deleted_at.is_(None))
-            .options(
-            joinedload(Comment.author).joinedload(User.profile_image),
-            joinedload(Comment.author).selectinload(User.dogs).joinedload(DogProfile.profile_image),
-        )
-        )
-        return db.execute(stmt).unique().scalars().one_or_none()
+        return db.execute(_select_comment_by_id(), {"comment_id": comment_id}).unique().scalars().one_or_none()
 
     @classmethod
     def get_comments_by_post_id(
@@ -54,18 +74,8 @@ class CommentsModel:
         db: Session,
     ) -> List[Comment]:
         offset = (page - 1) * size
-        stmt = (
-            select(Comment)
-            .where(Comment.post_id == post_id, Comment.deleted_at.is_(None))
-            .options(
-            joinedload(Comment.author).joinedload(User.profile_image),
-            joinedload(Comment.author).selectinload(User.dogs).joinedload(DogProfile.profile_image),
-        )
-            .order_by(Comment.id.desc())
-            .limit(size)
-            .offset(offset)
-        )
-        return list(db.execute(stmt).unique().scalars().all())
+        params = {"post_id": post_id, "limit": size, "offset": offset}
+        return list(db.execute(_select_comments_page(), params).unique().scalars().all())
 
     @classmethod
     def update_comment(cls, post_id: int, comment_id: int, content: str, db: Session) -> int:
@@ -3,6 +3,7 @@ from fastapi import APIRouter, Depends, Path, Query
 from sqlalchemy.orm import Session
 from fastapi.responses import Response
 
+from app.core.rendering import RenderedRoute
 from app.comments.schema import CommentIdData, CommentUpsertRequest, CommentsPageData
 from app.comments import controller
 from app.common import ApiResponse
@@ -15,7 +16,7 @@ from app.api.dependencies import (
     require_comment_author,
 )
 
-router = APIRouter(prefix="/posts/{post_id}/comments", tags=["comments"])
+router = APIRouter(prefix="/posts/{post_id}/comments", tags=["comments"], route_class=RenderedRoute)
 
 
 @router.post("", status_code=201, response_model=ApiResponse[CommentIdData])
@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 
 from app.common import ApiCode, ApiResponse, raise_http_error
 from app.core.config import settings
+from app.core.threadpool import run_in_threadpool
 from app.db import utc_now
 from app.api.dependencies import CurrentUser
 from app.infra.storage import storage_delete
@@ -16,10 +17,8 @@ from app.media.schema import ImageUploadResponse, SignupImageUploadData
 from app.media.image_policy import save_image_for_media
 
 
-async def upload_image_for_signup(file: UploadFile, db: Session) -> ApiResponse[SignupImageUploadData]:
-    file_key, file_url, content_type, size = await save_image_for_media(
-        file, purpose="signup"
-    )
+def _persist_signup_image(file_key: str, file_url: str, content_type: str, size: int, db: Session) -> SignupImageUploadData:
+    """DB 기록·커밋(블로킹, 스레드풀에서 호출). 실패 시 롤백 후 저장한 파일 삭제."""
     try:
         expires_at = utc_now() + timedelta(seconds=settings.SIGNUP_IMAGE_TOKEN_TTL_SECONDS)
         image, signup_token = MediaModel.create_signup_image(
@@ -43,25 +42,20 @@ async def upload_image_for_signup(file: UploadFile, db: Session) -> ApiResponse[
         except Exception:
             pass
         raise
-    return ApiResponse(code=ApiCode.IMAGE_UPLOADED.value, data=data)
+    return data
 
 
-async def upload_image(
-    file: UploadFile,
-    user: CurrentUser,
-    purpose: str,
-    db: Session,
-) -> ApiResponse[ImageUploadResponse]:
-    if purpose not in ("profile", "post"):
-        raise_http_error(400, ApiCode.INVALID_REQUEST)
-    file_key, file_url, content_type, size = await save_image_for_media(file, purpose=purpose)
+def _persist_image(
+    file_key: str, file_url: str, content_type: str, size: int, uploader_id: int, db: Session
+) -> ImageUploadResponse:
+    """DB 기록·커밋(블로킹, 스레드풀에서 호출). 커밋 후 만료된 속성 재조회도 여기서 끝냄. 실패 시 롤백 후 저장한 파일 삭제."""
     try:
         image = MediaModel.create_image(
             file_key=file_key,
             file_url=file_url,
             content_type=content_type,
             size=size,
-            uploader_id=user.id,
+            uploader_id=uploader_id,
             db=db,
         )
         db.commit()
@@ -72,7 +66,28 @@ async def upload_image(
         except Exception:
             pass
         raise
-    return ApiResponse(code=ApiCode.IMAGE_UPLOADED.value, data=ImageUploadResponse.model_validate(image))
+    return ImageUploadResponse.model_validate(image)
+
+
+async def upload_image_for_signup(file: UploadFile, db: Session) -> ApiResponse[SignupImageUploadData]:
+    file_key, file_url, content_type, size = await save_image_for_media(
+        file, purpose="signup"
+    )
+    data = await run_in_threadpool(_persist_signup_image, file_key, file_url, content_type, size, db)
+    return ApiResponse(code=ApiCode.IMAGE_UPLOADED.value, data=data)
+
+
+async def upload_image(
+    file: UploadFile,
+    user: CurrentUser,
+    purpose: str,
+    db: Session,
+) -> ApiResponse[ImageUploadResponse]:
+    if purpose not in ("profile", "post"):
+        raise_http_error(400, ApiCode.INVALID_REQUEST)
+    file_key, file_url, content_type, size = await save_image_for_media(file, purpose=purpose)
+    data = await run_in_threadpool(_persist_image, file_key, file_url, content_type, size, user.id, db)
+    return ApiResponse(code=ApiCode.IMAGE_UPLOADED.value, data=data)
 
 
 def delete_image(image_id: int, user: CurrentUser, db: Session) -> None:
@@ -1,5 +1,5 @@
-# 이미지 업로드 정책. purpose 검증, 매직바이트 포맷 판별, 청크 읽기, 저장(스레드).
-import asyncio
+# 이미지 업로드 정책. purpose 검증, 매직바이트 포맷 판별, 청크 읽기, 저장(미디어 전용 스레드풀).
+# 읽기~저장 구간은 storage_bulkhead 슬롯 안에서만 → 워커당 동시 업로드(버퍼 메모리) 상한, 초과 시 즉시 503.
 import uuid
 from typing import List, Literal, Optional
 
@@ -7,7 +7,8 @@ from fastapi import UploadFile
 
 from app.core.config import settings
 from app.common import ApiCode, raise_http_error
-from app.infra.storage import storage_save
+from app.infra.bulkhead import BulkheadFull
+from app.infra.storage import storage_bulkhead, storage_save
 
 ImagePurpose = Literal["signup", "profile", "post"]
 IMAGE_PURPOSES: tuple[ImagePurpose, ...] = ("signup", "profile", "post")
@@ -69,13 +70,18 @@ async def save_image_for_media(
     types = allowed_types or settings.ALLOWED_IMAGE_TYPES
     allowed_set = set(types)
 
-    content = await read_limited(file, max_size)
-    SNIFF_HEADER_SIZE = 12
-    header = content[:SNIFF_HEADER_SIZE]
-    ct, ext = sniff_image_type(header)
-    if ct not in allowed_set:
-        raise_http_error(400, ApiCode.INVALID_FILE_TYPE)
-
-    key = _generate_key(purpose, ext)
-    url = await asyncio.to_thread(storage_save, key, content, ct)
+    try:
+        async with storage_bulkhead.slot():
+            content = await read_limited(file, max_size)
+            SNIFF_HEADER_SIZE = 12
+            header = content[:SNIFF_HEADER_SIZE]
+            ct, ext = sniff_image_type(header)
+            if ct not in allowed_set:
+                raise_http_error(400, ApiCode.INVALID_FILE_TYPE)
+
+            key = _generate_key(purpose, ext)
+            url = await storage_bulkhead.run(storage_save, key, content, ct)
+    except BulkheadFull:
+        retry_after = str(settings.ADMISSION_RETRY_AFTER)
+        raise_http_error(503, ApiCode.SERVICE_OVERLOADED, "too many uploads in progress", headers={"Retry-After": retry_after})
     return key, url, ct, len(content)
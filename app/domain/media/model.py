@@ -5,11 +5,11 @@ import secrets
 from datetime import datetime, timezone
 from typing import List, Optional
 
-from sqlalchemy import select, update
+from sqlalchemy import bindparam, select, update
 from sqlalchemy.orm import Session, mapped_column
 from sqlalchemy import String, Integer, DateTime, ForeignKey
 
-from app.db import Base, utc_now
+from app.db import Base, cached_statement, utc_now
 from app.core.security import hash_token
 from app.infra.storage import storage_delete
 
@@ -31,6 +31,17 @@ class Image(Base):
     created_at = mapped_column(DateTime, nullable=False)
 
 
+# 핫 쿼리는 첫 호출 시 1회 구성 후 재사용(bindparam, IN 목록은 expanding).
+@cached_statement
+def _select_image_by_id():
+    return select(Image).where(Image.id == bindparam("image_id"))
+
+
+@cached_statement
+def _select_images_by_ids():
+    return select(Image).where(Image.id.in_(bindparam("image_ids", expanding=True)))
+
+
 class MediaModel:
     @classmethod
     def create_signup_image(
@@ -86,8 +97,7 @@ class MediaModel:
 
     @classmethod
     def get_signup_image(cls, image_id: int, db: Session) -> Optional[Image]:
-        stmt = select(Image).where(Image.id == image_id)
-        return db.execute(stmt).scalars().one_or_none()
+        return db.execute(_select_image_by_id(), {"image_id": image_id}).scalars().one_or_none()
 
     @classmethod
     def verify_signup_token(cls, image_id: int, token: str, db: Session) -> Optional[Image]:
@@ -109,15 +119,13 @@ class MediaModel:
 
     @classmethod
     def get_image_by_id(cls, image_id: int, db: Session) -> Optional[Image]:
-        stmt = select(Image).where(Image.id == image_id)
-        return db.execute(stmt).scalars().one_or_none()
+        return db.execute(_select_image_by_id(), {"image_id": image_id}).scalars().one_or_none()
 
     @classmethod
     def get_images_by_ids(cls, image_ids: List[int], db: Session) -> List[Image]:
         if not image_ids:
             return []
-        stmt = select(Image).where(Image.id.in_(image_ids))
-        return list(db.execute(stmt).scalars().all())
+        return list(db.execute(_select_images_by_ids(), {"image_ids": list(image_ids)}).scalars().all())
 
     @classmethod
     def attach_signup_image(cls, image_id: int, user_id: int, db: Session) -> bool:
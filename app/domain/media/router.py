@@ -5,12 +5,13 @@ from fastapi import APIRouter, Depends, File, Path, Query, UploadFile
 from fastapi.responses import Response
 from sqlalchemy.orm import Session
 
+from app.core.rendering import RenderedRoute
 from app.media import controller
 from app.media.schema import ImageUploadResponse, SignupImageUploadData
 from app.common import ApiResponse
 from app.api.dependencies import CurrentUser, get_current_user, get_master_db
 
-router = APIRouter(prefix="/media", tags=["media"])
+router = APIRouter(prefix="/media", tags=["media"], route_class=RenderedRoute)
 
 
 @router.post("/images/signup", status_code=201, response_model=ApiResponse[SignupImageUploadData])
@@ -1,12 +1,12 @@
 # 게시글·좋아요·post_images CRUD. Post, PostImage, Like 모델.
 from typing import List, Optional
 
-from sqlalchemy import select, update, delete, func
+from sqlalchemy import bindparam, select, update, delete, func
 from sqlalchemy.orm import Session, relationship, joinedload, selectinload, mapped_column
 from sqlalchemy import String, Integer, DateTime, ForeignKey
 from sqlalchemy.dialects.mysql import MEDIUMTEXT
 
-from app.db import Base, utc_now
+from app.db import Base, cached_statement, utc_now
 from app.media.model import Image, MediaModel
 from app.users.model import User, DogProfile
 
@@ -61,6 +61,51 @@ class Like(Base):
     created_at = mapped_column(DateTime, nullable=False)
 
 
+# 핫 쿼리는 첫 호출 시 1회 구성 후 재사용(bindparam). 호출마다 select()/options() 재구성·캐시 키 재계산 비용 제거.
+@cached_statement
+def _select_post_by_id():
+    return (
+        select(Post)
+        .where(Post.id == bindparam("post_id"), Post.deleted_at.is_(None))
+        .options(
+            joinedload(Post.user).joinedload(User.profile_image),
+            joinedload(Post.user).selectinload(User.dogs).joinedload(DogProfile.profile_image),
+            joinedload(Post.post_images).joinedload(PostImage.image),
+        )
+    )
+
+
+@cached_statement
+def _select_post_author_id():
+    return select(Post.user_id).where(Post.id == bindparam("post_id"), Post.deleted_at.is_(None))
+
+
+@cached_statement
+def _select_posts_page():
+    return (
+        select(Post)
+        .where(Post.deleted_at.is_(None))
+        .order_by(Post.id.desc())
+        .limit(bindparam("limit"))
+        .offset(bindparam("offset"))
+        .options(
+            joinedload(Post.user).joinedload(User.profile_image),
+            joinedload(Post.user).selectinload(User.dogs).joinedload(DogProfile.profile_image),
+            selectinload(Post.post_images).joinedload(PostImage.image),
+        )
+    )
+
+
+@cached_statement
+def _count_posts():
+    return select(func.count(Post.id)).where(Post.deleted_at.is_(None))
+
+
+@cached_statement
+def _select_like_count():
+    return select(Post.like_count).where(Post.id == bindparam("post_id"))
+
+
 class PostsModel:
     MAX_POST_IMAGES = 5
 
@@ -87,20 +132,11 @@ class PostsModel:
 
     @classmethod
     def get_post_by_id(cls, post_id: int, db: Session) -> Optional["Post"]:
-        stmt = (
-            select(Post)
-            .where(Post.id == post_id, Post.deleted_at.is_(None))
-            .options(
-                joinedload(Post.user).joinedload(User.profile_image),
-                joinedload(Post.user).selectinload(User.dogs).joinedload(DogProfile.profile_image),
-                joinedload(Post.post_images).joinedload(PostImage.image),
-            )
-        )
-        return db.execute(stmt).unique().scalars().one_or_none()
+        return db.execute(_select_post_by_id(), {"post_id": post_id}).unique().scalars().one_or_none()
 
     @classmethod
     def get_post_author_id(cls, post_id: int, db: Session) -> Optional[int]:
-        row = db.execute(select(Post.user_id).where(Post.id == post_id, Post.deleted_at.is_(None))).scalar_one_or_none()
+        row = db.execute(_select_post_author_id(), {"post_id": post_id}).scalar_one_or_none()
         return row
 
     @classmethod
@@ -113,19 +149,7 @@ class PostsModel:
     ) -> tuple[List["Post"], bool]:
         offset = (page - 1) * size
         fetch_limit = size + 1
-        stmt = (
-            select(Post)
-            .where(Post.deleted_at.is_(None))
-            .order_by(Post.id.desc())
-            .limit(fetch_limit)
-            .offset(offset)
-            .options(
-                joinedload(Post.user).joinedload(User.profile_image),
-                joinedload(Post.user).selectinload(User.dogs).joinedload(DogProfile.profile_image),
-                selectinload(Post.post_images).joinedload(PostImage.image),
-            )
-        )
-        posts = db.execute(stmt).unique().scalars().all()
+        posts = db.execute(_select_posts_page(), {"limit": fetch_limit, "offset": offset}).unique().scalars().all()
         has_more = len(posts) > size
         posts = posts[:size]
         return posts, has_more
@@ -133,9 +157,7 @@ class PostsModel:
     @classmethod
     def get_posts_count(cls, *, db: Session) -> int:
         """삭제되지 않은 게시글 전체 개수 (페이지네이션 total용)."""
-        row = db.execute(
-            select(func.count(Post.id)).where(Post.deleted_at.is_(None))
-        ).scalar_one_or_none()
+        row = db.execute(_count_posts()).scalar_one_or_none()
         return row or 0
 
     @classmethod
@@ -191,19 +213,19 @@ class PostsModel:
 
     @classmethod
     def get_like_count(cls, post_id: int, db: Session) -> int:
-        row = db.execute(select(Post.like_count).where(Post.id == post_id)).scalar_one_or_none()
+        row = db.execute(_select_like_count(), {"post_id": post_id}).scalar_one_or_none()
         return row or 0
 
     @classmethod
     def increment_like_count(cls, post_id: int, db: Session) -> int:
         db.execute(update(Post).where(Post.id == post_id).values(like_count=Post.like_count + 1))
-        row = db.execute(select(Post.like_count).where(Post.id == post_id)).scalar_one_or_none()
+        row = db.execute(_select_like_count(), {"post_id": post_id}).scalar_one_or_none()
         return row or 0
 
     @classmethod
     def decrement_like_count(cls, post_id: int, db: Session) -> int:
         db.execute(update(Post).where(Post.id == post_id).values(like_count=func.greatest(Post.like_count - 1, 0)))
-        row = db.execute(select(Post.like_count).where(Post.id == post_id)).scalar_one_or_none()
+        row = db.execute(_select_like_count(), {"post_id": post_id}).scalar_one_or_none()
         return row or 0
 
     @classmethod
@@ -4,6 +4,7 @@ from sqlalchemy.orm import Session
 from fastapi import Request
 from fastapi.responses import Response
 
+from app.core.rendering import RenderedRoute
 from app.common import ApiResponse
 from app.common.schema import PaginatedResponse
 from app.posts.schema import PostCreateRequest, PostIdData, PostResponse, PostUpdateRequest, LikeCountData
@@ -17,7 +18,7 @@ from app.api.dependencies import (
     require_post_author,
 )
 
-router = APIRouter(prefix="/posts", tags=["posts"])
+router = APIRouter(prefix="/posts", tags=["posts"], route_class=RenderedRoute)
 
 
 @router.post("", status_code=201, response_model=ApiResponse[PostIdData])
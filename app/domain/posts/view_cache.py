@@ -4,10 +4,13 @@ import threading
 import time
 from starlette.requests import Request
 
+from app.core.memory import register_cache_size
+
 # 개발 시 0으로 설정하면 캐시 비사용(매 방문 시 조회수 +1). 기본 24시간.
 VIEW_TTL_SECONDS = int(os.getenv("VIEW_CACHE_TTL_SECONDS", str(24 * 3600)))
 _cache: dict[str, float] = {}
 _lock = threading.Lock()
+register_cache_size("posts.view_cache", lambda: len(_cache))
 
 
 def get_client_identifier(request: Request) -> str:
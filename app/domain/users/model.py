@@ -1,11 +1,11 @@
 # 사용자 CRUD. User ORM 반환, Controller에서 Schema.model_validate(user)로 직렬화. 프로필 이미지는 profile_image_id(FK).
 from typing import List, Optional
 
-from sqlalchemy import select, update, delete, String, Integer, BigInteger, DateTime, Date, ForeignKey, Boolean
+from sqlalchemy import bindparam, select, update, delete, String, Integer, BigInteger, DateTime, Date, ForeignKey, Boolean
 from sqlalchemy.orm import Session, mapped_column, relationship, joinedload, selectinload
 
 from app.common.enums import UserStatus
-from app.db import Base, utc_now
+from app.db import Base, cached_statement, utc_now
 
 
 class DogProfile(Base):
@@ -72,6 +72,47 @@ class User(Base):
         return None
 
 
+# 인증·프로필 핫 쿼리는 첫 호출 시 1회 구성 후 재사용(bindparam). 호출마다 캐시 키 재계산 비용 제거.
+@cached_statement
+def _select_user_by_id():
+    return (
+        select(User)
+        .where(User.id == bindparam("user_id"), User.deleted_at.is_(None))
+        .options(joinedload(User.profile_image))
+    )
+
+
+@cached_statement
+def _select_user_by_id_with_dogs():
+    return (
+        select(User)
+        .where(User.id == bindparam("user_id"), User.deleted_at.is_(None))
+        .options(
+            joinedload(User.profile_image),
+            selectinload(User.dogs).joinedload(DogProfile.profile_image),
+        )
+    )
+
+
+@cached_statement
+def _select_user_by_email():
+    return (
+        select(User)
+        .where(User.email == bindparam("email"), User.deleted_at.is_(None))
+        .options(joinedload(User.profile_image))
+    )
+
+
+@cached_statement
+def _exists_email():
+    return select(User.id).where(User.email == bindparam("email"), User.deleted_at.is_(None)).limit(1)
+
+
+@cached_statement
+def _exists_nickname():
+    return select(User.id).where(User.nickname == bindparam("nickname"), User.deleted_at.is_(None)).limit(1)
+
+
 class UsersModel:
     @classmethod
     def create_user(
@@ -100,24 +141,11 @@ class UsersModel:
 
     @classmethod
     def get_user_by_id(cls, user_id: int, db: Session) -> Optional[User]:
-        stmt = (
-            select(User)
-            .where(User.id == user_id, User.deleted_at.is_(None))
-            .options(joinedload(User.profile_image))
-        )
-        return db.execute(stmt).unique().scalars().one_or_none()
+        return db.execute(_select_user_by_id(), {"user_id": user_id}).unique().scalars().one_or_none()
 
     @classmethod
     def get_user_by_id_with_dogs(cls, user_id: int, db: Session) -> Optional[User]:
-        stmt = (
-            select(User)
-            .where(User.id == user_id, User.deleted_at.is_(None))
-            .options(
-                joinedload(User.profile_image),
-                selectinload(User.dogs).joinedload(DogProfile.profile_image),
-            )
-        )
-        return db.execute(stmt).unique().scalars().one_or_none()
+        return db.execute(_select_user_by_id_with_dogs(), {"user_id": user_id}).unique().scalars().one_or_none()
 
     @classmethod
     def get_users_by_ids(cls, user_ids: List[int], db: Session) -> dict[int, User]:
@@ -133,12 +161,7 @@ class UsersModel:
 
     @classmethod
     def get_user_by_email(cls, email: str, db: Session) -> Optional[User]:
-        stmt = (
-            select(User)
-            .where(User.email == email.lower(), User.deleted_at.is_(None))
-            .options(joinedload(User.profile_image))
-        )
-        return db.execute(stmt).unique().scalars().one_or_none()
+        return db.execute(_select_user_by_email(), {"email": email.lower()}).unique().scalars().one_or_none()
 
     @classmethod
     def get_password_hash(cls, user_id: int, db: Session) -> Optional[str]:
@@ -146,11 +169,11 @@ class UsersModel:
 
     @classmethod
     def email_exists(cls, email: str, db: Session) -> bool:
-        return db.execute(select(User.id).where(User.email == email.lower(), User.deleted_at.is_(None)).limit(1)).first() is not None
+        return db.execute(_exists_email(), {"email": email.lower()}).first() is not None
 
     @classmethod
     def nickname_exists(cls, nickname: str, db: Session) -> bool:
-        return db.execute(select(User.id).where(User.nickname == nickname, User.deleted_at.is_(None)).limit(1)).first() is not None
+        return db.execute(_exists_nickname(), {"nickname": nickname}).first() is not None
 
     @classmethod
     def update_nickname(cls, user_id: int, new_nickname: str, db: Session) -> bool:
@@ -1,17 +1,21 @@
 # 사용자 라우터. GET/PATCH /users/me, PATCH /users/me/password.
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends
 from fastapi.responses import Response
 from sqlalchemy.orm import Session
 
+from app.core.rendering import RenderedRoute
+from app.core.threadpool import run_in_threadpool
 from app.api.dependencies import (
     CurrentUser,
     get_current_user,
+    get_kv,
     get_master_db,
     get_slave_db,
     parse_availability_query,
 )
 from app.auth import controller as auth_controller
 from app.common import ApiResponse
+from app.infra.kv import KVBackend
 from app.users import controller
 from app.users.schema import (
     AvailabilityData,
@@ -21,7 +25,7 @@ from app.users.schema import (
     UserProfileResponse,
 )
 
-router = APIRouter(prefix="/users", tags=["users"])
+router = APIRouter(prefix="/users", tags=["users"], route_class=RenderedRoute)
 
 
 @router.get("/availability", status_code=200, response_model=ApiResponse[AvailabilityData])
@@ -51,25 +55,23 @@ def update_me(
 
 @router.patch("/me/password", status_code=200, response_model=ApiResponse[None])
 async def update_password(
-    request: Request,
     password_data: UpdatePasswordRequest,
     user: CurrentUser = Depends(get_current_user),
     db: Session = Depends(get_master_db),
+    kv: KVBackend = Depends(get_kv),
 ):
-    result = controller.update_password(user=user, data=password_data, db=db)
-    redis = getattr(request.app.state, "redis", None)
-    await auth_controller.revoke_refresh_for_user(user.id, redis)
+    # bcrypt 검증·해시와 DB 갱신은 블로킹 → 스레드풀
+    result = await run_in_threadpool(controller.update_password, user=user, data=password_data, db=db)
+    await auth_controller.revoke_refresh_for_user(user.id, kv)
     return result
 
 
 @router.delete("/me", status_code=204)
 async def delete_me(
-    request: Request,
     user: CurrentUser = Depends(get_current_user),
     db: Session = Depends(get_master_db),
+    kv: KVBackend = Depends(get_kv),
 ):
-    redis = getattr(request.app.state, "redis", None)
-    if redis:
-        await redis.delete(f"rt:{user.id}")
-    controller.delete_me(user=user, db=db)
+    await auth_controller.revoke_refresh_for_user(user.id, kv)
+    await run_in_threadpool(controller.delete_me, user=user, db=db)
     return Response(status_code=204)
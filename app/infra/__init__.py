@@ -1,4 +1,5 @@
 # 외부 시스템 연동. Redis, S3(스토리지), 메일 등.
+from app.infra.kv import KVBackend
 from app.infra.redis import close_redis, init_redis
 
-__all__ = ["close_redis", "init_redis"]
+__all__ = ["KVBackend", "close_redis", "init_redis"]
@@ -0,0 +1,60 @@
+# 벌크헤드(격리 구획). 느린 외부 I/O(S3 업로드 등)가 API 트래픽과 같은 스레드풀·메모리를 잠식하지 않도록
+# 전용 스레드풀(max_workers)과 동시 진입 한도(max_concurrent)를 둠. 한도가 차면 기다리지 않고 즉시 거절(BulkheadFull).
+# slot()은 이벤트 루프 스레드에서만 사용(카운터 락 없음), run()은 요청 contextvars(request_id·Server-Timing)를 복사해 전용 스레드에서 실행.
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Optional, TypeVar
+
+from app.core.metrics import Counter, Gauge, register
+
+T = TypeVar("T")
+
+BULKHEAD_IN_FLIGHT = register(Gauge("bulkhead_in_flight", "벌크헤드 구획별 진행 중 작업 수", ("name",)))
+BULKHEAD_REJECTED = register(Counter("bulkhead_rejected_total", "벌크헤드 한도 초과로 거절한 작업 수", ("name",)))
+
+
+class BulkheadFull(Exception):
+    """동시 진입 한도 초과. 호출부에서 503 등으로 변환."""
+
+
+class Bulkhead:
+    def __init__(self, name: str, max_concurrent: int, max_workers: int) -> None:
+        self.name = name
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_workers = max(1, max_workers)
+        self.in_flight = 0
+        self._labels = (name,)
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        if self.in_flight >= self.max_concurrent:
+            BULKHEAD_REJECTED.inc(self._labels)
+            raise BulkheadFull(self.name)
+        self.in_flight += 1
+        BULKHEAD_IN_FLIGHT.set(self._labels, self.in_flight)
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            BULKHEAD_IN_FLIGHT.set(self._labels, self.in_flight)
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """전용 스레드풀에서 fn(*args). 실행 스레드 수는 max_workers로 제한, 초과분은 이 구획 안에서만 대기."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=f"bulkhead-{self.name}")
+        context = contextvars.copy_context()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(context.run, fn, *args))
+
+    def shutdown(self) -> None:
+        """lifespan 종료 시. 진행 중 작업은 마치고 스레드 정리."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def snapshot(self) -> Dict[str, int]:
+        return {"in_flight": self.in_flight, "max_concurrent": self.max_concurrent, "max_workers": self.max_workers}
@@ -0,0 +1,134 @@
+# 서킷 브레이커. 외부 의존성(Redis·MySQL·스토리지)이 죽었을 때 요청마다 타임아웃을 기다리지 않고 즉시 실패·대체 경로로 보내기 위함.
+# register_breaker로 등록한 브레이커만 상태 게이지(circuit_breaker_state)·거절 카운터와 /health에 노출.
+import threading
+import time
+from typing import Dict, Optional
+
+from app.core.metrics import Counter, Gauge, register
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+BREAKER_STATE = register(Gauge("circuit_breaker_state", "서킷 상태(0=closed, 1=half_open, 2=open)", ("name",)))
+BREAKER_REJECTED = register(Counter("circuit_breaker_rejected_total", "서킷 OPEN으로 즉시 실패시킨 호출 수", ("name",)))
+
+
+class CircuitOpenError(Exception):
+    """서킷 OPEN으로 호출하지 않고 즉시 실패. retry_after = 다음 시험 호출까지 남은 초. 예외 핸들러가 503으로 변환."""
+
+    def __init__(self, name: str, retry_after: float) -> None:
+        super().__init__(name)
+        self.name = name
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """CLOSED → 연속 실패 failure_threshold회 → OPEN(reset_timeout초 호출 차단) → HALF_OPEN(시험 호출 1건) → 성공 시 CLOSED, 실패 시 OPEN.
+    스레드풀·이벤트 루프 양쪽에서 호출되므로 상태 전이는 락 안에서 수행."""
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+        self._registered = False
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def allow(self) -> bool:
+        """호출 가능 여부. OPEN이고 reset_timeout 경과 시 HALF_OPEN으로 바꾸고 시험 호출 1건만 허용."""
+        if self._state == CLOSED:
+            return True
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._state == OPEN and time.monotonic() - (self._opened_at or 0.0) >= self.reset_timeout:
+                self._set_state(HALF_OPEN)
+                self._trial_in_flight = True
+                return True
+            if self._state == HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+        if self._registered:
+            BREAKER_REJECTED.inc((self.name,))
+        return False
+
+    def check(self) -> None:
+        """allow()가 거절하면 CircuitOpenError. 호출 결과는 record_success/record_failure로 보고."""
+        if not self.allow():
+            raise CircuitOpenError(self.name, self.retry_after())
+
+    def retry_after(self) -> float:
+        """OPEN이면 시험 호출 가능 시각까지 남은 초, 그 외 0."""
+        opened_at = self._opened_at
+        if self._state != OPEN or opened_at is None:
+            return 0.0
+        return max(0.0, self.reset_timeout - (time.monotonic() - opened_at))
+
+    def record_success(self) -> None:
+        # 정상 상태에서는 락 없이 반환(SQL 문장마다 호출됨)
+        if self._state == CLOSED and self._failures == 0:
+            return
+        with self._lock:
+            self._set_state(CLOSED)
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> bool:
+        """실패 기록. 이번 호출로 OPEN이 됐으면 True(전이 시 1회만 로그 남기기 위함)."""
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                was_open = self._state == OPEN
+                self._set_state(OPEN)
+                self._opened_at = time.monotonic()
+                return not was_open
+            return False
+
+    def release_trial(self) -> None:
+        """결과 없이 끝난 호출(요청 취소 등). 상태는 유지, HALF_OPEN이면 다음 호출이 다시 시험."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def trip(self) -> None:
+        """즉시 OPEN(시작 시 연결 실패 등)."""
+        with self._lock:
+            self._set_state(OPEN)
+            self._opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+    def _set_state(self, state: str) -> None:
+        """락 안에서 호출."""
+        self._state = state
+        if self._registered:
+            BREAKER_STATE.set((self.name,), _STATE_VALUES[state])
+
+    def snapshot(self) -> Dict[str, object]:
+        return {"name": self.name, "state": self._state, "failures": self._failures}
+
+
+# 이름 → 브레이커. 같은 이름으로 다시 등록하면(lifespan 재시작 등) 교체
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def register_breaker(breaker: CircuitBreaker) -> CircuitBreaker:
+    breaker._registered = True
+    BREAKER_STATE.set((breaker.name,), _STATE_VALUES[breaker.state])
+    _breakers[breaker.name] = breaker
+    return breaker
+
+
+def breaker_states() -> Dict[str, str]:
+    """/health용 {이름: 상태}."""
+    return {name: breaker.state for name, breaker in sorted(_breakers.items())}
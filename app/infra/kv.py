@@ -0,0 +1,359 @@
+# KV 백엔드. Redis(분산)·인메모리(단일 노드·Redis 장애 시) 공통 인터페이스: TTL 키, 카운터, GCRA 토큰 버킷.
+# FailoverBackend가 서킷 브레이커로 Redis 상태를 보고 자동 전환. Redis가 죽어도 요청마다 타임아웃을 기다리지 않음.
+# 인메모리 사본은 워커별이라 rate limit 같은 근사값에만 사용. 워커 간 일치가 필요한 값(Refresh Token)은 get_shared/set_shared로 Redis만.
+# Redis 명령은 요청 데드라인의 남은 시간까지만 대기(DeadlineExceeded는 Redis 장애로 세지 않음).
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from redis.asyncio import Redis
+from redis.commands.core import AsyncScript
+from redis.exceptions import RedisError
+
+from app.core.deadline import DeadlineExceeded, bounded
+from app.core.timing import timed
+from app.infra.circuit_breaker import OPEN, CircuitBreaker, CircuitOpenError
+
+log = logging.getLogger(__name__)
+
+# (emission_ms, window_ms): window_ms 동안 window_ms / emission_ms 건 허용
+GcraParams = Tuple[int, int]
+# (허용 여부, 초과 버킷 index(0부터, 허용 시 -1), retry_after_ms)
+GcraResult = Tuple[bool, int, int]
+
+# GCRA: 버킷마다 TAT(이론적 도착 시각, ms) 저장. 허용 조건 new_tat - now <= window.
+# KEYS: 버킷 키, ARGV: 버킷별 (emission_ms, window_ms). 전부 검사 후 모두 허용일 때만 갱신(거절 요청은 소모 없음).
+# 반환: {1, 0, 0} 허용 / {0, 초과 버킷 번호(1부터), retry_after_ms}.
+_LUA_GCRA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local new_tats = {}
+for i = 1, #KEYS do
+    local emission = tonumber(ARGV[2 * i - 1])
+    local window = tonumber(ARGV[2 * i])
+    local tat = tonumber(redis.call('GET', KEYS[i])) or now
+    if tat < now then
+        tat = now
+    end
+    local new_tat = tat + emission
+    if new_tat - now > window then
+        return {0, i, new_tat - window - now}
+    end
+    new_tats[i] = new_tat
+end
+for i = 1, #KEYS do
+    redis.call('SET', KEYS[i], new_tats[i], 'PX', new_tats[i] - now)
+end
+return {1, 0, 0}
+"""
+
+
+class KVBackend:
+    """TTL 키·카운터·GCRA. 구현: RedisBackend, MemoryBackend, FailoverBackend."""
+
+    name = ""
+    # 모든 워커·인스턴스가 같은 값을 보는 저장소인지. 인증 상태(Refresh Token)는 shared일 때만 저장·검증
+    shared = False
+
+    async def get_shared(self, key: str) -> Optional[str]:
+        """공유 저장소에서만 조회(워커별 사본 없음). shared=False면 사용 불가."""
+        if not self.shared:
+            raise RuntimeError(f"{self.name} 백엔드는 공유 저장소가 아님")
+        return await self.get(key)
+
+    async def set_shared(self, key: str, value: str, ttl_seconds: Optional[int] = None) -> None:
+        if not self.shared:
+            raise RuntimeError(f"{self.name} 백엔드는 공유 저장소가 아님")
+        await self.set(key, value, ttl_seconds)
+
+    async def get(self, key: str) -> Optional[str]:
+        raise NotImplementedError
+
+    async def set(self, key: str, value: str, ttl_seconds: Optional[int] = None) -> None:
+        raise NotImplementedError
+
+    async def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    async def incr(self, key: str, ttl_seconds: int) -> int:
+        """1 증가 후 값 반환. 새 키면 ttl_seconds 후 만료."""
+        raise NotImplementedError
+
+    async def gcra(self, keys: Sequence[str], params: Sequence[GcraParams]) -> GcraResult:
+        """여러 버킷을 원자적으로 검사·차감. 하나라도 초과면 어느 버킷도 차감하지 않음."""
+        raise NotImplementedError
+
+
+class RedisBackend(KVBackend):
+    name = "redis"
+    shared = True
+
+    def __init__(self, client: Redis) -> None:
+        self.client = client
+        self._gcra_script: AsyncScript = client.register_script(_LUA_GCRA)
+
+    @timed("redis")
+    @bounded("redis")
+    async def get(self, key: str) -> Optional[str]:
+        return await self.client.get(key)
+
+    @timed("redis")
+    @bounded("redis")
+    async def set(self, key: str, value: str, ttl_seconds: Optional[int] = None) -> None:
+        await self.client.set(key, value, ex=ttl_seconds)
+
+    @timed("redis")
+    @bounded("redis")
+    async def delete(self, key: str) -> None:
+        await self.client.delete(key)
+
+    @timed("redis")
+    @bounded("redis")
+    async def incr(self, key: str, ttl_seconds: int) -> int:
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.set(key, 0, ex=ttl_seconds, nx=True)
+            pipe.incr(key)
+            _, count = await pipe.execute()
+        return int(count)
+
+    @timed("redis")
+    @bounded("redis")
+    async def gcra(self, keys: Sequence[str], params: Sequence[GcraParams]) -> GcraResult:
+        """EVALSHA 1회. 서버에 스크립트가 없으면(NOSCRIPT) SCRIPT LOAD 후 재시도."""
+        args: List[int] = []
+        for emission_ms, window_ms in params:
+            args.extend((emission_ms, window_ms))
+        allowed, index, retry_ms = await self._gcra_script(keys=list(keys), args=args)
+        return bool(int(allowed)), int(index) - 1, int(retry_ms)
+
+
+class MemoryBackend(KVBackend):
+    """프로세스 내 저장소. 키 수 max_keys 상한(LRU 제거), 만료 키는 접근 시·쓰기 시 정리. 이벤트 루프 단일 스레드에서만 호출."""
+
+    name = "memory"
+
+    def __init__(self, max_keys: int) -> None:
+        self.max_keys = max(1, max_keys)
+        self._data: "OrderedDict[str, Tuple[object, Optional[float]]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _get(self, key: str, now: float) -> Optional[object]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= now:
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def _put(self, key: str, value: object, expires_at: Optional[float]) -> None:
+        self._data[key] = (value, expires_at)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_keys:
+            self._data.popitem(last=False)
+
+    async def get(self, key: str) -> Optional[str]:
+        value = self._get(key, time.monotonic())
+        return None if value is None else str(value)
+
+    async def set(self, key: str, value: str, ttl_seconds: Optional[int] = None) -> None:
+        now = time.monotonic()
+        self._put(key, value, now + ttl_seconds if ttl_seconds else None)
+
+    async def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+    async def incr(self, key: str, ttl_seconds: int) -> int:
+        now = time.monotonic()
+        current = self._get(key, now)
+        if current is None:
+            count, expires_at = 1, now + ttl_seconds
+        else:
+            count, expires_at = int(current) + 1, self._data[key][1]
+        self._put(key, count, expires_at)
+        return count
+
+    def gcra_at(self, keys: Sequence[str], params: Sequence[GcraParams], now_ms: float) -> GcraResult:
+        """_LUA_GCRA와 같은 규칙. now_ms는 monotonic 기준(테스트에서 시각 고정용)."""
+        now = now_ms / 1000
+        new_tats: List[float] = []
+        for i, (key, (emission_ms, window_ms)) in enumerate(zip(keys, params)):
+            tat = self._get(key, now)
+            tat_ms = max(float(tat), now_ms) if tat is not None else now_ms
+            new_tat = tat_ms + emission_ms
+            if new_tat - now_ms > window_ms:
+                return False, i, int(new_tat - window_ms - now_ms)
+            new_tats.append(new_tat)
+        for key, new_tat in zip(keys, new_tats):
+            self._put(key, new_tat, new_tat / 1000)
+        return True, -1, 0
+
+    async def gcra(self, keys: Sequence[str], params: Sequence[GcraParams]) -> GcraResult:
+        return self.gcra_at(keys, params, time.monotonic() * 1000)
+
+
+_REDIS_ERRORS = (RedisError, OSError, asyncio.TimeoutError)
+
+
+class FailoverBackend(KVBackend):
+    """primary(Redis)가 있고 브레이커가 허용하면 Redis, 아니면 fallback(메모리).
+    set·delete는 메모리에도 기록(write-through)해 장애 중 조회가 최근 값으로 동작. 장애 중 실패한 delete는 복구 후 Redis에 재적용(무효화 유실 방지)."""
+
+    def __init__(
+        self,
+        primary: Optional[RedisBackend],
+        fallback: MemoryBackend,
+        breaker: CircuitBreaker,
+        max_pending_deletes: int = 10000,
+    ) -> None:
+        self.primary = primary
+        self.fallback = fallback
+        self.breaker = breaker
+        self.max_pending_deletes = max_pending_deletes
+        self._pending_deletes: Set[str] = set()
+
+    @property
+    def name(self) -> str:  # type: ignore[override]
+        return self.primary.name if self.remote_available() else self.fallback.name
+
+    @property
+    def shared(self) -> bool:  # type: ignore[override]
+        """Redis가 설정돼 있으면 True(장애 중에도). 인메모리 사본은 워커마다 달라 공유 저장소로 치지 않음."""
+        return self.primary is not None
+
+    def remote_available(self) -> bool:
+        return self.primary is not None and self.breaker.state != OPEN
+
+    def _on_abandoned(self) -> None:
+        """요청 데드라인으로 중단된 호출은 실패로 세지 않음. 시험 호출이었다면 슬롯만 반환."""
+        self.breaker.release_trial()
+
+    def _on_error(self, op: str, exc: BaseException) -> None:
+        if self.breaker.record_failure():
+            log.warning("Redis 장애로 인메모리 백엔드 전환 op=%s: %s", op, exc)
+
+    async def _on_success(self) -> None:
+        self.breaker.record_success()
+        if self._pending_deletes and self.primary is not None:
+            keys = list(self._pending_deletes)
+            self._pending_deletes.clear()
+            try:
+                await self.primary.client.delete(*keys)
+                log.info("Redis 복구: 장애 중 삭제 %s건 재적용", len(keys))
+            except _REDIS_ERRORS:
+                self._pending_deletes.update(keys)
+
+    async def get_shared(self, key: str) -> Optional[str]:
+        """Redis에서만 조회. 장애 중이면 메모리 사본 대신 CircuitOpenError(503): 다른 워커의 저장·무효화를 모르는 값으로 판단하지 않음."""
+        return await self._shared_call("get", self.primary.get, key)
+
+    async def set_shared(self, key: str, value: str, ttl_seconds: Optional[int] = None) -> None:
+        """Redis에만 기록(메모리 사본 없음). 장애 중이면 CircuitOpenError."""
+        await self._shared_call("set", self.primary.set, key, value, ttl_seconds)
+        self._pending_deletes.discard(key)
+
+    async def _shared_call(self, op: str, fn, *args):
+        if self.primary is None:
+            raise RuntimeError("REDIS_URL 미설정: 공유 저장소 없음")
+        self.breaker.check()
+        try:
+            result = await fn(*args)
+        except _REDIS_ERRORS as e:
+            self._on_error(op, e)
+            raise CircuitOpenError(self.breaker.name, self.breaker.retry_after()) from e
+        except DeadlineExceeded:
+            self._on_abandoned()
+            raise
+        await self._on_success()
+        return result
+
+    async def get(self, key: str) -> Optional[str]:
+        if self.primary is not None and self.breaker.allow():
+            try:
+                value = await self.primary.get(key)
+            except _REDIS_ERRORS as e:
+                self._on_error("get", e)
+            except DeadlineExceeded:
+                self._on_abandoned()
+                raise
+            else:
+                await self._on_success()
+                return value
+        return await self.fallback.get(key)
+
+    async def set(self, key: str, value: str, ttl_seconds: Optional[int] = None) -> None:
+        await self.fallback.set(key, value, ttl_seconds)
+        if self.primary is not None and self.breaker.allow():
+            try:
+                await self.primary.set(key, value, ttl_seconds)
+            except _REDIS_ERRORS as e:
+                self._on_error("set", e)
+            except DeadlineExceeded:
+                self._on_abandoned()
+                raise
+            else:
+                self._pending_deletes.discard(key)
+                await self._on_success()
+
+    async def delete(self, key: str) -> None:
+        await self.fallback.delete(key)
+        if self.primary is None:
+            return
+        if self.breaker.allow():
+            try:
+                await self.primary.delete(key)
+            except _REDIS_ERRORS as e:
+                self._on_error("delete", e)
+            except DeadlineExceeded:
+                # 적용 여부를 모르므로 무효화 유실 방지를 위해 재적용 대상에 추가
+                self._on_abandoned()
+                if len(self._pending_deletes) < self.max_pending_deletes:
+                    self._pending_deletes.add(key)
+                raise
+            else:
+                await self._on_success()
+                return
+        if len(self._pending_deletes) < self.max_pending_deletes:
+            self._pending_deletes.add(key)
+
+    async def incr(self, key: str, ttl_seconds: int) -> int:
+        if self.primary is not None and self.breaker.allow():
+            try:
+                count = await self.primary.incr(key, ttl_seconds)
+            except _REDIS_ERRORS as e:
+                self._on_error("incr", e)
+            except DeadlineExceeded:
+                self._on_abandoned()
+                raise
+            else:
+                await self._on_success()
+                return count
+        return await self.fallback.incr(key, ttl_seconds)
+
+    async def gcra(self, keys: Sequence[str], params: Sequence[GcraParams]) -> GcraResult:
+        if self.primary is not None and self.breaker.allow():
+            try:
+                result = await self.primary.gcra(keys, params)
+            except _REDIS_ERRORS as e:
+                self._on_error("gcra", e)
+            except DeadlineExceeded:
+                self._on_abandoned()
+                raise
+            else:
+                await self._on_success()
+                return result
+        return await self.fallback.gcra(keys, params)
+
+    def snapshot(self) -> Dict[str, object]:
+        return {
+            "backend": self.name,
+            "breaker": self.breaker.snapshot(),
+            "memory_keys": len(self.fallback),
+            "pending_deletes": len(self._pending_deletes),
+        }
@@ -1,29 +1,48 @@
-# Redis 연결. Rate Limit·Refresh Token 저장. 앱 lifespan에서 init/close.
+# Redis 연결 + KV 백엔드. Rate Limit·Refresh Token 저장. 앱 lifespan에서 init/close.
+# app.state.kv: Redis 정상 시 Redis, 미설정·장애 시 인메모리(FailoverBackend가 서킷 브레이커로 자동 전환). Refresh Token은 Redis만(get_shared/set_shared).
 import logging
 
 from redis.asyncio import ConnectionPool, Redis
 
 from app.core.config import settings
+from app.core.memory import register_cache_size
+from app.infra.circuit_breaker import CircuitBreaker, register_breaker
+from app.infra.kv import FailoverBackend, MemoryBackend, RedisBackend
 
 log = logging.getLogger(__name__)
 
 
 async def init_redis(app) -> None:
     app.state.redis = None
+    breaker = register_breaker(
+        CircuitBreaker(
+            "redis",
+            failure_threshold=settings.REDIS_BREAKER_FAILURE_THRESHOLD,
+            reset_timeout=settings.REDIS_BREAKER_RESET_TIMEOUT,
+        )
+    )
+    memory = MemoryBackend(settings.KV_MEMORY_MAX_KEYS)
+    register_cache_size("kv.memory", memory.__len__)
     if not settings.REDIS_URL:
+        app.state.kv = FailoverBackend(None, memory, breaker)
+        log.info("REDIS_URL 미설정. 인메모리 KV 백엔드 사용(단일 노드).")
         return
+    pool = ConnectionPool.from_url(
+        settings.REDIS_URL,
+        max_connections=settings.REDIS_MAX_CONNECTIONS,
+        decode_responses=True,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+    )
+    app.state.redis = Redis(connection_pool=pool)
+    app.state.kv = FailoverBackend(RedisBackend(app.state.redis), memory, breaker)
     try:
-        pool = ConnectionPool.from_url(
-            settings.REDIS_URL,
-            max_connections=settings.REDIS_MAX_CONNECTIONS,
-            decode_responses=True,
-        )
-        app.state.redis = Redis(connection_pool=pool)
         await app.state.redis.ping()
         log.info("Redis connection pool initialized.")
     except Exception as e:
-        log.warning("Redis 연결 실패: %s. Rate limit 미들웨어는 Fail-open.", e)
-        app.state.redis = None
+        # 클라이언트는 유지: reset_timeout 후 시험 호출로 복구되면 Redis로 자동 복귀
+        breaker.trip()
+        log.warning("Redis 연결 실패: %s. 인메모리 KV 백엔드로 시작.", e)
 
 
 async def close_redis(app) -> None:
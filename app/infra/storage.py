@@ -1,13 +1,42 @@
 # 로컬/S3 파일 스토리지. STORAGE_BACKEND에 따라 분기.
+# 저장·삭제는 서킷 브레이커(storage) 경유: 연속 실패 시 OPEN → S3 타임아웃을 기다리지 않고 CircuitOpenError(업로드 503, 삭제는 호출부가 로그·재시도 목록 처리).
 from pathlib import Path
+from typing import Any, Callable, TypeVar
 
 from app.core.config import settings
+from app.core.timing import timed
+from app.infra.bulkhead import Bulkhead
+from app.infra.circuit_breaker import CircuitBreaker, register_breaker
+
+T = TypeVar("T")
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 UPLOAD_DIR = PROJECT_ROOT / "upload"
 
 _s3_client = None
 
+# 업로드 저장 전용 구획. 동시 업로드 수·S3/디스크 쓰기 스레드를 API 스레드풀과 분리
+storage_bulkhead = Bulkhead("media", settings.MEDIA_MAX_INFLIGHT_UPLOADS, settings.MEDIA_IO_THREADS)
+
+storage_breaker = register_breaker(
+    CircuitBreaker(
+        "storage",
+        failure_threshold=settings.STORAGE_BREAKER_FAILURE_THRESHOLD,
+        reset_timeout=settings.STORAGE_BREAKER_RESET_TIMEOUT,
+    )
+)
+
+
+def _guarded(fn: Callable[..., T], *args: Any) -> T:
+    storage_breaker.check()
+    try:
+        result = fn(*args)
+    except Exception:
+        storage_breaker.record_failure()
+        raise
+    storage_breaker.record_success()
+    return result
+
 
 def _get_s3_client():
     """S3 클라이언트 Lazy-loading. 인증 정보 누락 시 ValueError."""
@@ -28,17 +57,19 @@ def _get_s3_client():
     return _s3_client
 
 
+@timed("storage")
 def storage_save(key: str, content: bytes, content_type: str) -> str:
     if settings.STORAGE_BACKEND == "s3":
-        return _s3_save(key, content, content_type)
-    return _local_save(key, content, content_type)
+        return _guarded(_s3_save, key, content, content_type)
+    return _guarded(_local_save, key, content, content_type)
 
 
+@timed("storage")
 def storage_delete(key: str) -> None:
     if settings.STORAGE_BACKEND == "s3":
-        _s3_delete(key)
+        _guarded(_s3_delete, key)
     else:
-        _local_delete(key)
+        _guarded(_local_delete, key)
 
 
 def _be_base_url() -> str:
@@ -5,49 +5,94 @@ from pathlib import Path
 
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+from pydantic import EmailStr, TypeAdapter
 from starlette.middleware.trustedhost import TrustedHostMiddleware
 
+from app.api.admin import admin_router
+from app.api.dependencies import require_admin
 from app.api.v1 import v1_router
-from app.common import ApiCode, ApiResponse, setup_logging
+from app.common import ApiCode, ApiResponse, setup_logging, shutdown_logging
 from app.common.schema import RootData
 from app.core.cleanup import run_loop_async, run_once as cleanup_once
 from app.core.config import settings
 from app.core.exception_handlers import register_exception_handlers
+from app.core.health import health_state, probe, readiness, run_health_loop
+from app.core.metrics_export import CONTENT_TYPE as METRICS_CONTENT_TYPE, render_metrics, run_snapshot_loop
 from app.core.middleware import (
-    access_log_middleware,
-    proxy_headers_middleware,
-    rate_limit_middleware,
-    request_id_middleware,
-    security_headers_middleware,
+    CompressionMiddleware,
+    DeadlineMiddleware,
+    ProfilerMiddleware,
+    RequestPipelineMiddleware,
+    ServerTimingMiddleware,
+    compression_bulkhead,
 )
+from app.core.loop_monitor import LoopMonitor
+from app.core.memory import run_rss_watch_loop
+from app.core.profiler import run_profiler_config_loop
+from app.core.threadpool import configure_threadpool, threadpool_stats
+from app.core.watchdog import Watchdog
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    from app.db import init_database, close_database
+    from app.db import close_database, connection_capacity
     from app.infra.redis import close_redis, init_redis
+    from app.infra.storage import storage_bulkhead
 
     setup_logging()
     log = logging.getLogger(__name__)
-    if not init_database():
-        log.critical("DB 연결 실패로 시작 시 검증 실패. 요청 시점에 재시도됨.")
+    # 스레드풀을 DB 풀 크기에 맞춰 체크아웃 대기를 스레드풀 대기(계측됨)로 앞당김
+    configure_threadpool(settings.THREADPOOL_SIZE or connection_capacity())
+    await init_redis(app)
+
+    # 첫 점검(워밍업 포함)을 마친 뒤 요청 수신. 실패해도 기동은 계속, 프로버가 주기적으로 재시도하고 그동안 /health/ready는 503
+    await probe(app)
+    if not health_state.writer:
+        log.critical("DB 연결 실패로 시작 시 검증 실패. 헬스 프로버가 재시도.")
     else:
         log.info("MySQL 연결 성공.")
 
-    await init_redis(app)
-
+    # 첫 요청에서 이벤트 루프를 막던 지연 import(이메일 검증의 idna 매핑 테이블) 선행 로드
+    TypeAdapter(EmailStr).validate_python("warmup@example.com")
     cleanup_once()
     stop_event = asyncio.Event()
     cleanup_task = None
     if settings.SESSION_CLEANUP_INTERVAL > 0:
         cleanup_task = asyncio.create_task(run_loop_async(stop_event))
+    metrics_task = None
+    if settings.METRICS_ENABLED and settings.METRICS_MULTIPROC_DIR:
+        metrics_task = asyncio.create_task(run_snapshot_loop(stop_event))
+    health_task = asyncio.create_task(run_health_loop(app, stop_event))
+    loop_task = None
+    if settings.LOOP_MONITOR_ENABLED:
+        loop_monitor = LoopMonitor(settings.LOOP_LAG_INTERVAL, settings.LOOP_BLOCK_THRESHOLD_MS)
+        loop_task = asyncio.create_task(loop_monitor.run(stop_event))
+    rss_task = None
+    if settings.WORKER_MAX_RSS_MB > 0:
+        rss_task = asyncio.create_task(run_rss_watch_loop(stop_event))
+    watchdog = None
+    if settings.WATCHDOG_ENABLED:
+        watchdog = Watchdog(settings.WATCHDOG_INTERVAL, settings.SLOW_REQUEST_MS)
+        watchdog.start()
+    profiler_task = None
+    if settings.PROFILE_ENABLED:
+        profiler_task = asyncio.create_task(run_profiler_config_loop(app, stop_event))
 
     yield
 
     stop_event.set()
+    if watchdog is not None:
+        watchdog.stop()
+    for task in (metrics_task, profiler_task, rss_task, loop_task, health_task):
+        if task is None:
+            continue
+        try:
+            await asyncio.wait_for(task, timeout=5.0)
+        except asyncio.TimeoutError:
+            task.cancel()
     if cleanup_task is not None:
         try:
             await asyncio.wait_for(asyncio.shield(cleanup_task), timeout=15.0)
@@ -58,7 +103,10 @@ async def lifespan(app: FastAPI):
             except asyncio.CancelledError:
                 pass
     await close_redis(app)
+    storage_bulkhead.shutdown()
+    compression_bulkhead.shutdown()
     close_database()
+    shutdown_logging()
 
 
 app = FastAPI(
@@ -68,23 +116,27 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# 나중에 등록한 것이 요청 시 먼저 실행. CORS(프리플라이트 즉시 응답) → 요청 파이프라인 → 프로파일러 → 데드라인 → Server-Timing → 압축 → TrustedHost → 라우트
+# 파이프라인: 순수 ASGI 1계층에서 proxy_headers(실제 IP) → request_id·RequestContext → 메트릭·access_log → rate_limit → security_headers
+# 안쪽 스테이지는 파이프라인이 만든 RequestContext(contextvar)를 사용. 동시성 한도(admission)는 라우트 단계(RenderedRoute)
+# 압축은 파이프라인·Server-Timing 안쪽 → 응답 크기 메트릭·Server-Timing(compress 구간)에 압축 결과 반영
+if settings.TRUSTED_HOSTS != ["*"]:
+    app.add_middleware(TrustedHostMiddleware, allowed_hosts=settings.TRUSTED_HOSTS)
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware)
+app.add_middleware(ServerTimingMiddleware)
+app.add_middleware(DeadlineMiddleware)
+if settings.PROFILE_ENABLED:
+    app.add_middleware(ProfilerMiddleware)
+app.add_middleware(RequestPipelineMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=settings.CORS_MAX_AGE,
 )
-if settings.TRUSTED_HOSTS != ["*"]:
-    app.add_middleware(TrustedHostMiddleware, allowed_hosts=settings.TRUSTED_HOSTS)
-
-# async def 미들웨어 유지(BaseHTTPMiddleware는 run_in_executor 오버헤드 있음). 나중에 등록한 것이 요청 시 먼저 실행.
-# 실행 순서: proxy_headers(Nginx 등에서 실제 IP 추출) → request_id → access_log → rate_limit → security_headers → 라우트
-app.middleware("http")(security_headers_middleware)
-app.middleware("http")(rate_limit_middleware)
-app.middleware("http")(access_log_middleware)
-app.middleware("http")(request_id_middleware)
-app.middleware("http")(proxy_headers_middleware)
 
 register_exception_handlers(app)
 
@@ -94,6 +146,7 @@ if settings.STORAGE_BACKEND == "local":
     app.mount("/upload", StaticFiles(directory=str(upload_dir)), name="upload")
 
 app.include_router(v1_router)
+app.include_router(admin_router)
 
 
 @app.get("/", response_model=ApiResponse[RootData])
@@ -108,17 +161,41 @@ def root():
     )
 
 
+@app.get("/metrics", include_in_schema=False, dependencies=[Depends(require_admin)])
+def metrics():
+    """Prometheus 스크레이프용(관리자 API와 같은 X-Admin-Token 인증). 멀티 워커 시 METRICS_MULTIPROC_DIR 스냅샷 병합."""
+    from fastapi.responses import PlainTextResponse
+    if not settings.METRICS_ENABLED:
+        return PlainTextResponse("", status_code=404)
+    return PlainTextResponse(render_metrics(), media_type=METRICS_CONTENT_TYPE)
+
+
+@app.get("/health/live")
+async def health_live():
+    """Liveness. 이벤트 루프가 응답하면 200(의존성 조회 없음)."""
+    return {"code": ApiCode.OK.value, "data": {"status": "ok"}}
+
+
+@app.get("/health/ready")
+async def health_ready():
+    """Readiness. 헬스 프로버가 캐시한 결과(DB·스레드 사용 없음)."""
+    from fastapi.responses import JSONResponse
+    status_code, content = readiness()
+    return JSONResponse(status_code=status_code, content=content)
+
+
 @app.get("/health")
-def health():
+async def health():
+    """/health/ready와 같은 캐시 결과(기존 ALB 설정 호환). DEBUG면 풀·캐시·스레드풀 등 인메모리 상세 포함."""
     from fastapi.responses import JSONResponse
-    from app.db import check_database
-    ok = check_database()
-    if ok:
-        return JSONResponse(
-            status_code=200,
-            content={"code": ApiCode.OK.value, "data": {"status": "ok", "database": "connected"}},
-        )
-    return JSONResponse(
-        status_code=503,
-        content={"code": ApiCode.DB_ERROR.value, "data": {"status": "degraded", "database": "disconnected"}},
-    )
+    from app.db import get_compiled_cache_stats, get_pool_stats
+    from app.infra.storage import storage_bulkhead
+    status_code, content = readiness()
+    if status_code == 200 and settings.DEBUG:
+        data = content["data"]
+        data["pools"] = get_pool_stats()
+        data["compiled_cache"] = get_compiled_cache_stats()
+        data["kv"] = app.state.kv.snapshot()
+        data["threadpool"] = threadpool_stats()
+        data["media"] = storage_bulkhead.snapshot()
+    return JSONResponse(status_code=status_code, content=content)
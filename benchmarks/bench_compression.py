@@ -0,0 +1,91 @@
+# 응답 압축 비용 마이크로벤치마크(실제 피드 본문: ApiResponse[PaginatedResponse[PostResponse]] JSON).
+# hash: 압축 본문 캐시 키(blake2b) 계산, gzip·br: 설정 레벨로 압축, hit: 캐시 적중 시 compress_body 전체(해시+조회).
+# 캐시 적중은 같은 본문을 다시 보낼 때만(목록의 조회수·좋아요가 바뀌면 새 본문). 적중률은 /metrics response_compressed_total{cache}로 확인.
+# 실행: poetry run python benchmarks/bench_compression.py
+import hashlib
+import os
+import random
+import sys
+import timeit
+from datetime import date, datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("ENV", "development")
+
+from app.common import ApiResponse  # noqa: E402
+from app.common.schema import PaginatedResponse  # noqa: E402
+from app.core.middleware.compression import _encode, body_cache, compress_body  # noqa: E402
+from app.posts.schema import PostResponse  # noqa: E402
+
+_SYLLABLES = [chr(0xAC00 + i * 37) for i in range(300)]
+
+
+def _post_row(post_id: int, content_chars: int) -> SimpleNamespace:
+    """ORM Post 행과 같은 속성 구성(작성자·대표 강아지·이미지 2장)."""
+    dog = SimpleNamespace(name="뽀삐", breed="말티즈", gender="female", birth_date=date(2020, 5, 1))
+    author = SimpleNamespace(
+        id=post_id % 50 + 1,
+        nickname=f"user{post_id}",
+        status="ACTIVE",
+        profile_image_id=3,
+        profile_image_url="https://cdn.example.com/profile/3.png",
+        representative_dog=dog,
+    )
+    files = [SimpleNamespace(id=i, file_url=f"https://cdn.example.com/posts/{post_id}/{i}.jpg", image_id=i) for i in range(2)]
+    # 게시글마다 다른 본문(같은 문자열 반복이면 압축률이 비현실적으로 높음): 한글 음절 300개에서 무작위 2~4음절 단어
+    rng = random.Random(post_id)
+    words = [
+        "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4))) for _ in range(content_chars // 3 + 1)
+    ]
+    content = " ".join(words)[:content_chars]
+    return SimpleNamespace(
+        id=post_id,
+        title="오늘의 산책 기록",
+        content=content,
+        view_count=120 + post_id,
+        like_count=7,
+        comment_count=3,
+        author=author,
+        files=files,
+        created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+def _feed_body(size: int, content_chars: int) -> bytes:
+    posts = [PostResponse.model_validate(_post_row(i, content_chars)) for i in range(size)]
+    return ApiResponse(code="POSTS_RETRIEVED", data=PaginatedResponse(list=posts, has_more=True, total=1000)).model_dump_json(by_alias=True).encode()
+
+
+CASES = [
+    ("size=10 (200 chars)", lambda: _feed_body(10, 200), 500),
+    ("size=10 (1k chars)", lambda: _feed_body(10, 1000), 200),
+    ("size=100 (1k chars)", lambda: _feed_body(100, 1000), 20),
+    ("size=100 (50k chars)", lambda: _feed_body(100, 50_000), 2),
+]
+
+
+def _per_call_ms(fn, number: int) -> float:
+    return timeit.timeit(fn, number=number) / number * 1000
+
+
+def main() -> None:
+    print(f"{'feed body':<22} {'bytes':>10} {'hash(ms)':>9} {'hit(ms)':>8} {'gzip(ms)':>9} {'br(ms)':>8} {'gzip%':>6} {'br%':>6}")
+    for name, build, number in CASES:
+        body = build()
+        hash_ms = _per_call_ms(lambda: hashlib.blake2b(body, digest_size=16).digest(), number * 10)
+        body_cache.clear()
+        compress_body(body, "br")
+        hit_ms = _per_call_ms(lambda: compress_body(body, "br"), number * 10)
+        gzip_ms = _per_call_ms(lambda: _encode(body, "gzip"), number)
+        br_ms = _per_call_ms(lambda: _encode(body, "br"), number)
+        gzip_ratio = len(_encode(body, "gzip")) / len(body) * 100
+        br_ratio = len(_encode(body, "br")) / len(body) * 100
+        print(
+            f"{name:<22} {len(body):>10} {hash_ms:>9.3f} {hit_ms:>8.3f} {gzip_ms:>9.3f} {br_ms:>8.3f} {gzip_ratio:>5.1f}% {br_ratio:>5.1f}%"
+        )
+
+
+if __name__ == "__main__":
+    main()
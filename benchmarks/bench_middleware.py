@@ -0,0 +1,95 @@
+# 미들웨어 계층 요청당 오버헤드. 이전 구조(app.middleware("http") 5계층) vs RequestPipelineMiddleware 1계층.
+# HTTP 서버 없이 ASGI 앱을 직접 호출. 이전 구조는 각 계층이 call_next만 하는 하한값(실제 작업 제외)으로 측정.
+# Redis 미연결 상태라 rate limit은 조회 없이 통과(양쪽 동일).
+# 실행: poetry run python benchmarks/bench_middleware.py
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("ENV", "development")
+
+from fastapi import FastAPI  # noqa: E402
+
+from app.core.middleware import RequestPipelineMiddleware  # noqa: E402
+
+
+def _endpoint_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/v1/posts/{post_id}")
+    async def get_post(post_id: int):
+        return {"code": "POST_RETRIEVED", "data": {"id": post_id}}
+
+    return app
+
+
+def bare_app() -> FastAPI:
+    return _endpoint_app()
+
+
+def legacy_app() -> FastAPI:
+    app = _endpoint_app()
+
+    async def passthrough(request, call_next):
+        return await call_next(request)
+
+    for _ in range(5):
+        app.middleware("http")(passthrough)
+    return app
+
+
+def pipeline_app() -> FastAPI:
+    app = _endpoint_app()
+    app.add_middleware(RequestPipelineMiddleware)
+    return app
+
+
+def _scope() -> dict:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/v1/posts/7",
+        "raw_path": b"/v1/posts/7",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench"), (b"user-agent", b"bench")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+
+
+async def _receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def _send(message):
+    return None
+
+
+async def _per_request_us(app, number: int) -> float:
+    for _ in range(200):
+        await app(_scope(), _receive, _send)
+    start = time.perf_counter()
+    for _ in range(number):
+        await app(_scope(), _receive, _send)
+    return (time.perf_counter() - start) / number * 1e6
+
+
+async def main(number: int = 5000) -> None:
+    bare = await _per_request_us(bare_app(), number)
+    legacy = await _per_request_us(legacy_app(), number)
+    pipeline = await _per_request_us(pipeline_app(), number)
+    print(f"{'stack':<46} {'per request(us)':>16} {'overhead(us)':>13}")
+    print(f"{'no middleware':<46} {bare:>16.1f} {0:>13.1f}")
+    print(f"{'5 x app.middleware(http) pass-through':<46} {legacy:>16.1f} {legacy - bare:>13.1f}")
+    print(f"{'RequestPipelineMiddleware (all 5 jobs)':<46} {pipeline:>16.1f} {pipeline - bare:>13.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,141 @@
+# 핫 쿼리 구성 비용 마이크로벤치마크. 호출마다 select()/options() 재구성 vs 캐시된 구성(bindparam).
+# build: SQLAlchemy가 실행 전 매번 수행하는 "문 구성 + 캐시 키 생성"만.
+# execute: Session.execute 전체(구성 + 캐시 키 + 컴파일 캐시 조회 + 실행 + ORM 행 처리)를 인메모리 SQLite(행 10건씩)로.
+# 네트워크 왕복·MySQL 실행 시간은 포함되지 않음 → 실제 요청에서 줄어드는 것은 execute 열의 차이(절대값, us)이고 비율이 아님.
+# 실행: poetry run python benchmarks/bench_statement_cache.py
+import os
+import sys
+import timeit
+from datetime import date, datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("ENV", "development")
+
+from sqlalchemy import create_engine, insert, select  # noqa: E402
+from sqlalchemy.dialects.mysql import MEDIUMTEXT  # noqa: E402
+from sqlalchemy.ext.compiler import compiles  # noqa: E402
+from sqlalchemy.orm import Session, joinedload, selectinload  # noqa: E402
+
+import app.main  # noqa: E402,F401  (모든 매퍼 로드)
+import app.comments.model as comments_model  # noqa: E402
+import app.posts.model as posts_model  # noqa: E402
+import app.users.model as users_model  # noqa: E402
+from app.comments.model import Comment  # noqa: E402
+from app.db import Base  # noqa: E402
+from app.posts.model import Post, PostImage  # noqa: E402
+from app.users.model import DogProfile, User  # noqa: E402
+
+
+def rebuilt_post_by_id(post_id: int):
+    return (
+        select(Post)
+        .where(Post.id == post_id, Post.deleted_at.is_(None))
+        .options(
+            joinedload(Post.user).joinedload(User.profile_image),
+            joinedload(Post.user).selectinload(User.dogs).joinedload(DogProfile.profile_image),
+            joinedload(Post.post_images).joinedload(PostImage.image),
+        )
+    )
+
+
+def rebuilt_posts_page(limit: int, offset: int):
+    return (
+        select(Post)
+        .where(Post.deleted_at.is_(None))
+        .order_by(Post.id.desc())
+        .limit(limit)
+        .offset(offset)
+        .options(
+            joinedload(Post.user).joinedload(User.profile_image),
+            joinedload(Post.user).selectinload(User.dogs).joinedload(DogProfile.profile_image),
+            selectinload(Post.post_images).joinedload(PostImage.image),
+        )
+    )
+
+
+def rebuilt_comments_page(post_id: int, limit: int, offset: int):
+    return (
+        select(Comment)
+        .where(Comment.post_id == post_id, Comment.deleted_at.is_(None))
+        .options(
+            joinedload(Comment.author).joinedload(User.profile_image),
+            joinedload(Comment.author).selectinload(User.dogs).joinedload(DogProfile.profile_image),
+        )
+        .order_by(Comment.id.desc())
+        .limit(limit)
+        .offset(offset)
+    )
+
+
+def rebuilt_user_by_id(user_id: int):
+    return select(User).where(User.id == user_id, User.deleted_at.is_(None)).options(joinedload(User.profile_image))
+
+
+@compiles(MEDIUMTEXT, "sqlite")
+def _mediumtext_on_sqlite(type_, compiler, **kw):
+    return "TEXT"
+
+
+def _seeded_session() -> Session:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    now = datetime(2026, 1, 1)
+    with engine.begin() as conn:
+        for i in range(1, 11):
+            conn.execute(
+                insert(User).values(id=i, email=f"u{i}@example.com", password="x", nickname=f"u{i}", created_at=now, updated_at=now)
+            )
+            conn.execute(
+                insert(DogProfile).values(
+                    owner_id=i, name="뽀삐", breed="말티즈", gender="female", birth_date=date(2020, 5, 1),
+                    is_representative=True, created_at=now, updated_at=now,
+                )
+            )
+            conn.execute(
+                insert(Post).values(id=i, user_id=i, title="t", content="c" * 200, created_at=now, updated_at=now)
+            )
+            conn.execute(insert(Comment).values(post_id=7, author_id=i, content="c", created_at=now, updated_at=now))
+    return Session(engine)
+
+
+CASES = [
+    ("PostsModel.get_post_by_id", lambda: rebuilt_post_by_id(7), posts_model._select_post_by_id, {"post_id": 7}),
+    ("PostsModel.get_all_posts", lambda: rebuilt_posts_page(11, 0), posts_model._select_posts_page, {"limit": 11, "offset": 0}),
+    (
+        "CommentsModel.get_comments_by_post_id",
+        lambda: rebuilt_comments_page(7, 10, 0),
+        comments_model._select_comments_page,
+        {"post_id": 7, "limit": 10, "offset": 0},
+    ),
+    ("UsersModel.get_user_by_id", lambda: rebuilt_user_by_id(3), users_model._select_user_by_id, {"user_id": 3}),
+]
+
+
+def _per_call_us(fn, number: int) -> float:
+    return timeit.timeit(fn, number=number) / number * 1e6
+
+
+def main(number: int = 2000) -> None:
+    session = _seeded_session()
+
+    def execute(statement, params=None):
+        session.execute(statement, params or {}).unique().scalars().all()
+        session.expunge_all()
+
+    print(f"{'query':<40} {'build rebuilt/cached(us)':>26} {'execute rebuilt/cached(us)':>28} {'saved(us)':>10}")
+    for name, rebuild, cached, params in CASES:
+        cached()._generate_cache_key()
+        execute(cached(), params)
+        execute(rebuild())
+        build_before = _per_call_us(lambda: rebuild()._generate_cache_key(), number)
+        build_after = _per_call_us(lambda: cached()._generate_cache_key(), number)
+        exec_before = _per_call_us(lambda: execute(rebuild()), number // 4)
+        exec_after = _per_call_us(lambda: execute(cached(), params), number // 4)
+        print(
+            f"{name:<40} {build_before:>12.2f} / {build_after:>11.2f} {exec_before:>13.1f} / {exec_after:>12.1f} {exec_before - exec_after:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
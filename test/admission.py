@@ -0,0 +1,125 @@
+import asyncio
+from unittest.mock import patch
+
+from fastapi import APIRouter, Depends, FastAPI
+from fastapi.routing import APIRoute
+
+from app.api.dependencies import get_master_db, get_slave_db
+from app.core.middleware import admission as admission_module
+from app.core.middleware.admission import READ, WRITE, AdaptiveLimit, AdmissionController, AdmissionRoute
+from app.core.middleware.pipeline import RequestPipelineMiddleware
+from app.domain.auth.router import router as auth_router
+from app.domain.posts.router import router as posts_router
+
+
+def _limit(initial: float = 4, target: float = 0.1) -> AdaptiveLimit:
+    return AdaptiveLimit("test", initial, min_limit=2, max_limit=10, latency_target=target, backoff=0.5)
+
+
+def test_aimd_increase_and_decrease():
+    limit = _limit()
+    assert all(limit.try_acquire() for _ in range(4))
+    assert not limit.try_acquire()
+
+    limit.release(0.01, 200)  # 4/4 사용 중 완료 → 증가
+    assert limit.limit == 4.25
+    limit.release(1.0, 200)  # 목표 초과 → 감소
+    assert limit.limit == 2.125
+    limit.release(0.01, 503)  # 같은 목표 시간 창 안의 두 번째 감소는 무시
+    assert limit.limit == 2.125
+    limit.release(0.01, 200)  # 사용률 낮으면 증가 안 함
+    assert limit.limit == 2.125
+    assert limit.in_flight == 0
+
+    with patch("app.core.middleware.admission.time.monotonic", return_value=limit._last_decrease + 1):
+        limit.try_acquire()
+        limit.release(0.01, 500)
+    assert limit.limit == 2
+
+
+def _route(router: APIRouter, path: str, method: str = "GET") -> APIRoute:
+    for route in router.routes:
+        if isinstance(route, APIRoute) and route.path == path and method in route.methods:
+            return route
+    raise AssertionError(path)
+
+
+def test_classify_by_db_dependency():
+    """메서드가 아니라 라우트가 (하위 의존성까지) Writer 세션을 쓰는지로 분류."""
+    controller = AdmissionController()
+    # GET /v1/auth/me: get_current_user → get_slave_db
+    assert controller.classify(_route(auth_router, "/auth/me").dependant).name == READ
+    # POST라도 DB를 쓰지 않으면(Redis만) 읽기
+    assert controller.classify(_route(auth_router, "/auth/logout", "POST").dependant).name == READ
+    assert controller.classify(_route(posts_router, "/posts").dependant).name == READ
+    assert controller.classify(_route(posts_router, "/posts", "POST").dependant).name == WRITE
+
+    def writer(db=Depends(get_master_db)):
+        return db
+
+    router = APIRouter(route_class=AdmissionRoute)
+    router.add_api_route("/nested", lambda dep=Depends(writer): None)
+    router.add_api_route("/reader", lambda db=Depends(get_slave_db): None)
+    nested, reader = router.routes
+    assert controller.classify(nested.dependant).name == WRITE
+    assert controller.classify(reader.dependant).name == READ
+
+
+def test_excess_requests_shed_with_503(monkeypatch):
+    release = asyncio.Event()
+    controller = AdmissionController()
+    controller.limits[READ].limit = 1
+    monkeypatch.setattr(admission_module, "admission", controller)
+
+    async def slow():
+        await release.wait()
+        return "ok"
+
+    router = APIRouter(route_class=AdmissionRoute)
+    router.add_api_route("/slow", slow)
+    fastapi_app = FastAPI()
+    fastapi_app.include_router(router)
+    # 기본 APIRoute(/health·/metrics·/admin과 같은 방식)는 한도 대상 아님
+    fastapi_app.add_api_route("/health", slow)
+    app = RequestPipelineMiddleware(fastapi_app)
+
+    async def call(path: str):
+        messages = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            messages.append(message)
+
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": b"",
+            "headers": [],
+            "client": ("127.0.0.1", 1234),
+            "server": ("testserver", 80),
+            "scheme": "http",
+            "root_path": "",
+            "http_version": "1.1",
+        }
+        await app(scope, receive, send)
+        return messages[0]["status"], dict(messages[0]["headers"])
+
+    async def scenario():
+        first = asyncio.create_task(call("/slow"))
+        await asyncio.sleep(0.01)
+        shed = await call("/slow")
+        health = asyncio.create_task(call("/health"))
+        await asyncio.sleep(0.01)
+        release.set()
+        return await first, shed, await health
+
+    (first_status, _), (shed_status, shed_headers), (health_status, _) = asyncio.run(scenario())
+    assert first_status == 200
+    assert shed_status == 503
+    assert shed_headers[b"retry-after"] == b"1"
+    assert health_status == 200
+    assert controller.limits[READ].in_flight == 0
@@ -0,0 +1,71 @@
+import pytest
+from sqlalchemy import create_engine
+
+from app.api.dependencies.db import get_slave_db
+from app.db import pool as db_pool
+from app.db.engine import reader_breaker, writer_engine
+from app.db.pool import InstrumentedQueuePool, instrument_engine
+from app.infra import storage
+from app.infra.circuit_breaker import OPEN, CircuitBreaker, CircuitOpenError
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 32
+
+
+def test_pool_checkout_fails_fast_when_circuit_open():
+    attempts = []
+
+    def refuse():
+        attempts.append(1)
+        raise OSError("connection refused")
+
+    breaker = CircuitBreaker("db.test", failure_threshold=2, reset_timeout=60)
+    engine = create_engine("sqlite://", poolclass=InstrumentedQueuePool, pool_logging_name="test-down", creator=refuse)
+    instrument_engine(engine, "test-down", breaker)
+    try:
+        for _ in range(2):
+            with pytest.raises(Exception):
+                engine.connect()
+        assert breaker.state == OPEN
+        with pytest.raises(CircuitOpenError):
+            engine.connect()
+        assert len(attempts) == 2
+    finally:
+        db_pool._ENGINES.pop("test-down", None)
+        db_pool._STATS.pop("test-down", None)
+
+
+def test_reads_degrade_to_writer_when_reader_open():
+    reader_breaker.trip()
+    try:
+        gen = get_slave_db()
+        db = next(gen)
+        assert db.get_bind() is writer_engine
+        gen.close()
+    finally:
+        reader_breaker.record_success()
+
+
+def test_upload_fails_fast_when_storage_open(client, monkeypatch):
+    calls = []
+
+    def broken_save(key, content, content_type):
+        calls.append(key)
+        raise OSError("s3 unreachable")
+
+    monkeypatch.setattr(storage, "_local_save", broken_save)
+    monkeypatch.setattr(storage, "storage_breaker", CircuitBreaker("storage", failure_threshold=1, reset_timeout=60))
+    files = {"image": ("a.png", PNG, "image/png")}
+    with pytest.raises(OSError):
+        client.post("/v1/media/images/signup", files=files)
+    res = client.post("/v1/media/images/signup", files=files)
+    assert res.status_code == 503
+    assert res.json()["code"] == "DEPENDENCY_UNAVAILABLE"
+    assert res.json()["data"] == {"dependency": "storage"}
+    assert int(res.headers["retry-after"]) >= 1
+    assert len(calls) == 1
+
+
+def test_health_reports_breakers(client, admin_headers):
+    breakers = client.get("/health").json()["data"]["breakers"]
+    assert {"db.writer", "db.reader", "storage", "redis"} <= set(breakers)
+    assert "circuit_breaker_state{" in client.get("/metrics", headers=admin_headers).text
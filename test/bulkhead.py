@@ -0,0 +1,45 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.core.middleware.request_id import request_id_ctx
+from app.infra.bulkhead import Bulkhead, BulkheadFull
+from app.infra.storage import storage_bulkhead
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 32
+
+
+def test_bulkhead_rejects_when_full_and_runs_on_own_threads():
+    bulkhead = Bulkhead("test", max_concurrent=1, max_workers=1)
+
+    def work():
+        return threading.current_thread().name, request_id_ctx.get()
+
+    async def scenario():
+        request_id_ctx.set("rid-bulkhead")
+        async with bulkhead.slot():
+            with pytest.raises(BulkheadFull):
+                async with bulkhead.slot():
+                    pass
+            result = await bulkhead.run(work)
+        assert bulkhead.in_flight == 0
+        return result
+
+    try:
+        thread_name, request_id = asyncio.run(scenario())
+    finally:
+        bulkhead.shutdown()
+    assert thread_name.startswith("bulkhead-test")
+    assert request_id == "rid-bulkhead"
+
+
+def test_upload_rejected_fast_when_media_bulkhead_full(client):
+    storage_bulkhead.in_flight = storage_bulkhead.max_concurrent
+    try:
+        res = client.post("/v1/media/images/signup", files={"image": ("a.png", PNG, "image/png")})
+    finally:
+        storage_bulkhead.in_flight = 0
+    assert res.status_code == 503
+    assert res.json()["code"] == "SERVICE_OVERLOADED"
+    assert res.headers["retry-after"] == "1"
@@ -0,0 +1,82 @@
+import gzip
+
+import brotli
+from fastapi.testclient import TestClient
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from app.core.middleware.compression import CompressionMiddleware, body_cache, compress_body, negotiate
+
+FEED = {"code": "OK", "data": {"posts": [{"id": i, "content": "멍멍 " * 500} for i in range(20)]}}
+
+
+def _feed(request):
+    return JSONResponse(FEED)
+
+
+def _image(request):
+    return Response(b"\x00" * 4096, media_type="image/png")
+
+
+def test_negotiate_respects_q_values():
+    assert negotiate(b"gzip, deflate, br") == "br"
+    assert negotiate(b"gzip, deflate") == "gzip"
+    assert negotiate(b"gzip;q=0, identity") is None
+    assert negotiate(b"*") in ("br", "gzip")
+    assert negotiate(b"deflate") is None
+
+
+def test_large_json_is_gzipped(client):
+    # 스키마 생성(첫 요청 시 동기 실행)은 루프 차단 검사 대상이 아니므로 미리 생성
+    client.app.openapi()
+    res = client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+    assert res.status_code == 200
+    assert res.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in res.headers["vary"]
+    assert res.json()["info"]["title"] == "PuppyTalk API"
+
+    plain = client.get("/openapi.json", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert int(res.headers["content-length"]) < int(plain.headers["content-length"])
+
+
+def test_small_and_binary_responses_pass_through(client):
+    res = client.get("/", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in res.headers
+
+    app = CompressionMiddleware(Starlette(routes=[Route("/image", _image)]))
+    with TestClient(app) as c:
+        res = c.get("/image", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in res.headers
+    assert len(res.content) == 4096
+
+
+def test_compressed_body_cached_and_offloaded():
+    body_cache.clear()
+    app = CompressionMiddleware(Starlette(routes=[Route("/feed", _feed)]))
+    app.offload_size = 0
+    with TestClient(app) as c:
+        first = c.get("/feed", headers={"Accept-Encoding": "gzip"})
+        second = c.get("/feed", headers={"Accept-Encoding": "gzip"})
+    assert first.headers["content-encoding"] == "gzip"
+    assert first.json() == second.json() == FEED
+    assert len(body_cache) == 1
+
+    raw = JSONResponse(FEED).body
+    compressed, hit = compress_body(raw, "gzip")
+    assert hit
+    assert gzip.decompress(compressed) == raw
+
+
+def test_brotli_and_disabled_cache():
+    raw = JSONResponse(FEED).body
+    body_cache.clear()
+    body_cache.max_bytes, limit = 0, body_cache.max_bytes
+    try:
+        compressed, hit = compress_body(raw, "br")
+        assert not compress_body(raw, "br")[1]
+    finally:
+        body_cache.max_bytes = limit
+    assert not hit and len(body_cache) == 0
+    assert brotli.decompress(compressed) == raw
@@ -1,12 +1,39 @@
 import os
+import tempfile
+
 import pytest
 from fastapi.testclient import TestClient
 
 os.environ.setdefault("ENV", "development")
-
+os.environ.setdefault("DB_STRICT_LOADING", "true")
+# Redis 없이도 인메모리 백엔드로 rate limit이 동작하므로, 반복 로그인·요청하는 테스트가 막히지 않게 상향
+os.environ.setdefault("RATE_LIMIT_MAX_REQUESTS", "100000")
+os.environ.setdefault("LOGIN_RATE_LIMIT_MAX_ATTEMPTS", "100000")
+os.environ.setdefault("SIGNUP_UPLOAD_RATE_LIMIT_MAX", "100000")
+os.environ.setdefault("ADMIN_TOKEN", "test-admin-token")
+# async 라우트에서 동기 DB·bcrypt 등으로 이벤트 루프를 막으면 해당 테스트 실패
+os.environ.setdefault("LOOP_BLOCK_STRICT", "true")
+os.environ.setdefault("PROFILE_DIR", tempfile.mkdtemp(prefix="profiles-"))
+
+from app.core import loop_monitor
+from app.core.config import settings
 from app.main import app
 
 
+@pytest.fixture(autouse=True)
+def _fail_on_event_loop_blocking():
+    """LOOP_BLOCK_STRICT면 테스트 중 발생한 루프 차단 이벤트(스택 포함)를 실패로 보고."""
+    before = loop_monitor.blocking_count
+    yield
+    if not settings.LOOP_BLOCK_STRICT:
+        return
+    new = loop_monitor.blocking_count - before
+    if new > 0:
+        events = list(loop_monitor.blocking_events)[-new:]
+        detail = "\n\n".join(f"blocked {e['stalled_ms']}ms:\n" + "".join(e["stack"][-12:]) for e in events)
+        pytest.fail(f"event loop blocked {new} time(s) during test\n{detail}", pytrace=False)
+
+
 @pytest.fixture(scope="module")
 def client():
     with TestClient(app) as c:
@@ -23,6 +50,12 @@ def _login(client: TestClient, email: str, password: str) -> dict:
     return {"session_id": res.cookies.get("session_id")}
 
 
+@pytest.fixture
+def admin_headers():
+    """관리자 엔드포인트(/admin/*, /metrics) 인증 헤더."""
+    return {"X-Admin-Token": settings.ADMIN_TOKEN}
+
+
 @pytest.fixture(scope="module")
 def auth_cookies(client):
     """인증된 사용자 쿠키 (테스트용 고정 이메일)."""
@@ -0,0 +1,122 @@
+import asyncio
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.core.config import settings
+from app.core.context import RequestContext, request_ctx
+from app.core.deadline import DeadlineExceeded, bounded, resolve_timeout
+from app.core.exception_handlers import register_exception_handlers
+from app.core.middleware import DeadlineMiddleware, RequestPipelineMiddleware
+from app.db.statement_timeout import instrument_statement_timeouts, with_execution_time
+from app.infra.circuit_breaker import CLOSED, CircuitBreaker
+from app.infra.kv import FailoverBackend, MemoryBackend
+
+
+def test_resolve_timeout_route_override_and_client_header():
+    default = settings.REQUEST_TIMEOUT_MS / 1000
+    assert resolve_timeout("GET", "/v1/posts") == default
+    assert resolve_timeout("POST", "/v1/media/images/") == 30.0
+    assert resolve_timeout("GET", "/v1/posts", b"250") == 0.25
+    # 클라이언트 헤더는 설정보다 늘릴 수 없음, 형식 오류는 무시
+    assert resolve_timeout("GET", "/v1/posts", b"999999999") == default
+    assert resolve_timeout("GET", "/v1/posts", b"-5") == default
+
+
+def test_select_gets_max_execution_time_hint():
+    assert with_execution_time("SELECT posts.id FROM posts", 250) == (
+        "SELECT /*+ MAX_EXECUTION_TIME(250) */ posts.id FROM posts"
+    )
+    assert with_execution_time("UPDATE posts SET x=1", 250) == "UPDATE posts SET x=1"
+
+
+def test_statement_not_started_after_deadline():
+    engine = create_engine("sqlite://")
+    instrument_statement_timeouts(engine)
+    ctx = RequestContext("rid-deadline")
+    token = request_ctx.set(ctx)
+    try:
+        ctx.deadline = time.perf_counter() + 5
+        with engine.connect() as conn:
+            assert conn.execute(text("SELECT 1")).scalar() == 1
+        ctx.deadline = time.perf_counter() - 0.001
+        with pytest.raises(DeadlineExceeded):
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+    finally:
+        request_ctx.reset(token)
+
+
+class _SlowRedis:
+    name = "redis"
+
+    @bounded("redis")
+    async def get(self, key):
+        await asyncio.sleep(1)
+        return "late"
+
+
+def test_redis_call_abandoned_without_tripping_breaker():
+    breaker = CircuitBreaker("test", failure_threshold=1)
+    kv = FailoverBackend(_SlowRedis(), MemoryBackend(10), breaker)
+
+    async def scenario():
+        ctx = RequestContext("rid-redis")
+        ctx.deadline = time.perf_counter() + 0.05
+        request_ctx.set(ctx)
+        started = time.perf_counter()
+        with pytest.raises(DeadlineExceeded):
+            await kv.get("k")
+        return time.perf_counter() - started
+
+    assert asyncio.run(scenario()) < 0.5
+    assert breaker.state == CLOSED
+    assert breaker.snapshot()["failures"] == 0
+
+
+def test_deadline_exceeded_maps_to_504():
+    app = FastAPI()
+    register_exception_handlers(app)
+
+    @app.get("/slow")
+    def slow():
+        raise DeadlineExceeded("db")
+
+    res = TestClient(app).get("/slow")
+    assert res.status_code == 504
+    assert res.json() == {"code": "REQUEST_TIMEOUT", "data": None}
+
+
+def test_deadline_stage_sets_context_deadline():
+    app = FastAPI()
+
+    @app.get("/remaining")
+    async def remaining():
+        ctx = request_ctx.get()
+        return {"remaining": ctx.deadline - time.perf_counter()}
+
+    app.add_middleware(DeadlineMiddleware)
+    app.add_middleware(RequestPipelineMiddleware)
+    with TestClient(app) as client:
+        assert 0 < client.get("/remaining", headers={"X-Request-Timeout": "250"}).json()["remaining"] <= 0.25
+
+
+def test_bounded_keeps_own_timeouts():
+    """함수 자체의 타임아웃(소켓 등)은 데드라인이 남아 있으면 DeadlineExceeded로 바꾸지 않음."""
+
+    @bounded("redis")
+    async def socket_timeout():
+        raise asyncio.TimeoutError
+
+    async def scenario():
+        ctx = RequestContext("rid-own-timeout")
+        ctx.deadline = time.perf_counter() + 5
+        request_ctx.set(ctx)
+        with pytest.raises(asyncio.TimeoutError) as exc:
+            await socket_timeout()
+        assert not isinstance(exc.value, DeadlineExceeded)
+
+    asyncio.run(scenario())
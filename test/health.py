@@ -1,3 +1,8 @@
+import time
+
+from app.core.health import HealthState
+
+
 def test_root(client):
     res = client.get("/")
     assert res.status_code == 200
@@ -20,3 +25,33 @@ def test_health(client):
         assert res.status_code == 503
         assert data["code"] == "DB_ERROR"
         assert data["data"].get("database") == "disconnected"
+
+
+def test_liveness_does_not_touch_dependencies(client):
+    res = client.get("/health/live")
+    assert res.status_code == 200
+    assert res.json() == {"code": "OK", "data": {"status": "ok"}}
+
+
+def test_readiness_reports_cached_checks(client):
+    res = client.get("/health/ready")
+    data = res.json()
+    assert res.status_code in (200, 503)
+    assert set(data["data"]["checks"]) == {"writer", "reader", "redis", "pools"}
+    assert data["data"]["checked_seconds_ago"] is not None
+    if res.status_code == 503:
+        assert data["code"] in ("DB_ERROR", "NOT_READY")
+
+
+def test_health_state_ready_requires_warm_up_and_writer():
+    state = HealthState()
+    assert not state.ready() and state.stale()
+    state.writer, state.reader, state.redis = True, False, "down"
+    state.pools = {"writer": 1.0, "reader": 0.1}
+    state.checked_at = time.monotonic()
+    assert not state.ready()
+    state.warmed = True
+    assert state.ready()
+    assert state.degraded() == ["reader", "redis", "pool.writer"]
+    state.checked_at -= 3600
+    assert not state.ready()
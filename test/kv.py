@@ -0,0 +1,102 @@
+import asyncio
+import time
+
+import pytest
+from redis.asyncio import Redis
+
+from app.infra.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+from app.infra.kv import FailoverBackend, MemoryBackend, RedisBackend
+
+
+def test_memory_backend_ttl_and_counter():
+    async def run():
+        kv = MemoryBackend(max_keys=100)
+        await kv.set("rt:1", "token", ttl_seconds=60)
+        assert await kv.get("rt:1") == "token"
+        await kv.delete("rt:1")
+        assert await kv.get("rt:1") is None
+        assert await kv.incr("c", ttl_seconds=60) == 1
+        assert await kv.incr("c", ttl_seconds=60) == 2
+        kv._data["c"] = (2, time.monotonic() - 1)
+        assert await kv.incr("c", ttl_seconds=60) == 1
+
+    asyncio.run(run())
+
+
+def test_memory_backend_bounded_lru():
+    async def run():
+        kv = MemoryBackend(max_keys=3)
+        for i in range(5):
+            await kv.set(f"k{i}", str(i))
+        assert len(kv) == 3
+        assert await kv.get("k0") is None
+        assert await kv.get("k4") == "4"
+
+    asyncio.run(run())
+
+
+def test_memory_backend_gcra_all_or_nothing():
+    kv = MemoryBackend(max_keys=100)
+    params = [(30_000, 60_000), (6_000, 60_000)]  # 창당 2건 / 10건
+    assert kv.gcra_at(["g", "l"], params, 0.0)[0]
+    assert kv.gcra_at(["g", "l"], params, 0.0)[0]
+    allowed, index, retry_ms = kv.gcra_at(["g", "l"], params, 0.0)
+    assert not allowed and index == 0 and retry_ms == 30_000
+    # 거절된 요청은 두 번째 버킷도 차감하지 않음
+    assert kv._data["l"][0] == 12_000
+
+
+def test_circuit_breaker_transitions():
+    breaker = CircuitBreaker("t", failure_threshold=2, reset_timeout=0.05)
+    assert breaker.allow()
+    assert breaker.record_failure() is False
+    assert breaker.record_failure() is True
+    assert breaker.state == OPEN and not breaker.allow()
+    time.sleep(0.06)
+    assert breaker.allow() and breaker.state == HALF_OPEN
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+
+
+def test_failover_to_memory_when_redis_down():
+    """Redis 연결 불가 시 인메모리로 동작, 서킷 OPEN 후에는 Redis 시도 없이 즉시 응답."""
+
+    async def run():
+        client = Redis(host="127.0.0.1", port=1, socket_connect_timeout=0.2, socket_timeout=0.2)
+        breaker = CircuitBreaker("redis", failure_threshold=2, reset_timeout=60)
+        kv = FailoverBackend(RedisBackend(client), MemoryBackend(100), breaker)
+        await kv.set("rt:7", "tok", ttl_seconds=60)
+        assert await kv.get("rt:7") == "tok"
+        assert breaker.state == OPEN
+        assert kv.name == "memory"
+        start = time.perf_counter()
+        for _ in range(50):
+            await kv.gcra(["rl:global:ip"], [(600, 60_000)])
+        assert time.perf_counter() - start < 0.1
+        await kv.delete("rt:7")
+        assert await kv.get("rt:7") is None
+        assert kv.snapshot()["pending_deletes"] == 1
+        await client.aclose()
+
+    asyncio.run(run())
+
+
+def test_shared_store_never_reads_memory_copy():
+    """Refresh Token 경로(get_shared/set_shared): Redis 미설정이면 공유 저장소 아님, 장애 중이면 메모리 사본 대신 CircuitOpenError."""
+    assert not FailoverBackend(None, MemoryBackend(10), CircuitBreaker("redis-none")).shared
+
+    async def run():
+        client = Redis(host="127.0.0.1", port=1, socket_connect_timeout=0.2, socket_timeout=0.2)
+        breaker = CircuitBreaker("redis", failure_threshold=1, reset_timeout=60)
+        kv = FailoverBackend(RedisBackend(client), MemoryBackend(100), breaker)
+        assert kv.shared
+        await kv.set("rt:7", "tok", ttl_seconds=60)
+        assert await kv.get("rt:7") == "tok"
+        with pytest.raises(CircuitOpenError):
+            await kv.get_shared("rt:7")
+        with pytest.raises(CircuitOpenError):
+            await kv.set_shared("rt:7", "tok2", ttl_seconds=60)
+        await client.aclose()
+
+    asyncio.run(run())
@@ -0,0 +1,58 @@
+import json
+import logging
+
+from app.common.logging_config import JsonFormatter, LogRateLimitFilter
+from app.core.middleware.access_log import log_access
+
+
+def _record(msg: str, level: int = logging.ERROR, exc_info=None) -> logging.LogRecord:
+    return logging.LogRecord("app.test", level, __file__, 1, msg, None, exc_info)
+
+
+def test_rate_limit_filter_suppresses_repeats():
+    """같은 템플릿은 burst건만 통과, 억제 건수는 창이 바뀐 뒤 첫 통과 레코드에 기록."""
+    log_filter = LogRateLimitFilter(window=60, burst=3)
+    passed = [log_filter.filter(_record("db down %s")) for _ in range(10)]
+    assert passed.count(True) == 3
+    assert log_filter.filter(_record("other message"))
+    assert log_filter.filter(_record("db down %s", level=logging.INFO))
+
+    log_filter._counters[("app.test", "db down %s", "")][0] -= 61
+    record = _record("db down %s")
+    assert log_filter.filter(record)
+    assert record.suppressed == 7
+
+
+def test_rate_limit_filter_keys_on_exception_type():
+    log_filter = LogRateLimitFilter(window=60, burst=1)
+    try:
+        raise ValueError("x")
+    except ValueError:
+        import sys
+
+        value_error = sys.exc_info()
+    assert log_filter.filter(_record("request failed", exc_info=value_error))
+    assert not log_filter.filter(_record("request failed", exc_info=value_error))
+    assert log_filter.filter(_record("request failed"))
+
+
+def test_json_formatter_includes_access_fields():
+    records = []
+
+    class Capture(logging.Handler):
+        def emit(self, record):
+            records.append(record)
+
+    logger = logging.getLogger("app.access")
+    handler = Capture()
+    logger.addHandler(handler)
+    try:
+        log_access("rid-1", "GET", "/v1/posts/3", "/v1/posts/{post_id}", 404, 1.234, "1.2.3.4")
+    finally:
+        logger.removeHandler(handler)
+    assert records
+    data = json.loads(JsonFormatter().format(records[0]))
+    assert data["level"] == "WARNING"
+    assert data["route"] == "/v1/posts/{post_id}"
+    assert data["status"] == 404
+    assert data["duration_ms"] == 1.23
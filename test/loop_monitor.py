@@ -0,0 +1,39 @@
+import asyncio
+import time
+
+from app.core import loop_monitor
+from app.core.loop_monitor import LOOP_LAG, LoopMonitor
+
+
+def test_loop_monitor_captures_blocking_stack():
+    """루프를 동기 sleep으로 막으면 차단 이벤트 1건 + 스택에 막은 함수가 잡힘. 이 테스트는 의도적 차단이므로 누적 수를 되돌림."""
+
+    async def run():
+        stop = asyncio.Event()
+        monitor = LoopMonitor(interval=0.01, threshold_ms=50)
+        task = asyncio.create_task(monitor.run(stop))
+        await asyncio.sleep(0.05)
+
+        def blocking_handler():
+            time.sleep(0.3)
+
+        blocking_handler()
+        await asyncio.sleep(0.05)
+        stop.set()
+        await task
+
+    before = loop_monitor.blocking_count
+    asyncio.run(run())
+    new = loop_monitor.blocking_count - before
+    loop_monitor.blocking_count = before
+    assert new == 1
+    event = loop_monitor.blocking_events[-1]
+    assert event["stalled_ms"] >= 50
+    assert any("blocking_handler" in line for line in event["stack"])
+    assert LOOP_LAG._children[()].snapshot()
+
+
+def test_admin_loop_endpoint(client):
+    res = client.get("/admin/loop", headers={"X-Admin-Token": "test-admin-token"})
+    assert res.status_code == 200
+    assert "blocking_events" in res.json()["data"]
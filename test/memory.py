@@ -0,0 +1,24 @@
+from app.core import memory
+
+
+def test_memory_report_without_tracing(client, admin_headers):
+    res = client.get("/admin/memory", headers=admin_headers)
+    assert res.status_code == 200
+    data = res.json()["data"]
+    assert data["tracing"] is False
+    assert data["rss_bytes"] > 0
+    assert "posts.view_cache" in data["caches"]
+    assert client.post("/admin/memory/baseline", headers=admin_headers).status_code == 409
+
+
+def test_memory_tracing_diff_finds_growth(client, admin_headers):
+    assert client.put("/admin/memory/tracing", json={"enabled": True}, headers=admin_headers).status_code == 200
+    try:
+        leak = [bytearray(1024) for _ in range(2000)]
+        data = memory.memory_report(limit=50)
+        assert data["tracing"] is True
+        assert any("test/memory.py" in e["location"] and e["size_diff"] >= 2_000_000 for e in data["diff"])
+        assert leak
+    finally:
+        client.put("/admin/memory/tracing", json={"enabled": False}, headers=admin_headers)
+    assert memory.memory_report()["tracing"] is False
@@ -0,0 +1,89 @@
+import json
+import os
+import time
+
+from app.core.config import settings
+from app.core.metrics_export import fold_dead_snapshots
+
+
+def test_metrics_requires_admin_token(client):
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"X-Admin-Token": "wrong"}).status_code == 401
+
+
+def test_metrics_exposition(client, admin_headers):
+    client.get("/")
+    res = client.get("/metrics", headers=admin_headers)
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("text/plain")
+    body = res.text
+    assert "# TYPE http_request_duration_seconds histogram" in body
+    assert 'http_requests_total{method="GET",route="/",status="200"}' in body
+    assert 'http_request_duration_seconds_bucket{method="GET",route="/",le="+Inf"}' in body
+    assert "http_requests_in_flight" in body
+
+
+def test_metrics_route_template_not_raw_path(client, admin_headers):
+    client.get("/v1/posts/123456789/comments?page=1&size=10")
+    body = client.get("/metrics", headers=admin_headers).text
+    assert 'route="/v1/posts/{post_id}/comments"' in body
+    assert "123456789" not in body
+
+
+def test_metrics_queue_time_from_request_start(client, admin_headers):
+    client.get("/", headers={"X-Request-Start": f"t={time.time() - 0.05:.3f}"})
+    body = client.get("/metrics", headers=admin_headers).text
+    count_line = next(line for line in body.splitlines() if line.startswith("http_request_queue_seconds_count"))
+    assert int(count_line.split()[-1]) >= 1
+
+
+def test_metrics_merges_worker_snapshots(client, tmp_path, monkeypatch, admin_headers):
+    """다른 워커 스냅샷 파일의 counter는 합산, 종료된 워커의 gauge는 제외."""
+    monkeypatch.setattr(settings, "METRICS_MULTIPROC_DIR", str(tmp_path))
+    dead_pid = 2**22 + 12345
+    snapshot = {
+        "pid": dead_pid,
+        "metrics": {
+            "http_requests_total": {
+                "type": "counter",
+                "help": "요청 수(상태 코드별)",
+                "labelnames": ["method", "route", "status"],
+                "samples": [[["GET", "/other-worker", "200"], 7]],
+            },
+            "http_requests_in_flight": {
+                "type": "gauge",
+                "help": "처리 중인 요청 수",
+                "labelnames": [],
+                "samples": [[[], 99]],
+            },
+        },
+    }
+    (tmp_path / f"{dead_pid}-1.json").write_text(json.dumps(dict(snapshot, start="1")), encoding="utf-8")
+    body = client.get("/metrics", headers=admin_headers).text
+    assert 'http_requests_total{method="GET",route="/other-worker",status="200"} 7' in body
+    assert "http_requests_in_flight 99" not in body
+    assert not list(tmp_path.glob(f"{os.getpid()}-*.json"))
+
+
+def test_dead_worker_snapshots_folded(client, tmp_path, monkeypatch, admin_headers):
+    """종료된 워커·PID 재사용(시작 시각 불일치) 파일은 누적 파일에 합친 뒤 삭제, 합계는 그대로."""
+    monkeypatch.setattr(settings, "METRICS_MULTIPROC_DIR", str(tmp_path))
+
+    def snapshot(pid, start, count):
+        family = {"type": "counter", "help": "t", "labelnames": ["route"], "samples": [[["/fold"], count]]}
+        return {"pid": pid, "start": start, "metrics": {"fold_test_total": family}}
+
+    dead = tmp_path / f"{2**22 + 1}-5.json"
+    dead.write_text(json.dumps(snapshot(2**22 + 1, "5", 3)), encoding="utf-8")
+    # 살아 있는 pid(1)지만 시작 시각이 다름 → 이전 프로세스의 파일
+    reused = tmp_path / "1-0.json"
+    reused.write_text(json.dumps(snapshot(1, "0", 4)), encoding="utf-8")
+
+    assert fold_dead_snapshots(tmp_path) == 2
+    assert not dead.exists() and not reused.exists()
+    assert fold_dead_snapshots(tmp_path) == 0
+    dead.write_text(json.dumps(snapshot(2**22 + 1, "5", 3)), encoding="utf-8")
+    # 이미 합친 파일이 다시 보이면(삭제 전 중단) 합산 없이 삭제만
+    assert fold_dead_snapshots(tmp_path) == 0 and not dead.exists()
+    body = client.get("/metrics", headers=admin_headers).text
+    assert 'fold_test_total{route="/fold"} 7' in body
@@ -0,0 +1,208 @@
+import asyncio
+
+from app.common import ApiCode
+from app.core.middleware.proxy_headers import is_trusted_proxy, parse_trusted_proxies
+from app.core.middleware.rate_limit import (
+    LocalRateLimiter,
+    _bucket,
+    check_rate_limit,
+    _local,
+    parse_route_costs,
+    request_cost,
+    resolve_principal,
+)
+
+
+def test_request_id_generated_and_echoed(client):
+    res = client.get("/")
+    assert res.headers.get("X-Request-ID")
+    res = client.get("/", headers={"X-Request-ID": "req-abc"})
+    assert res.headers["X-Request-ID"] == "req-abc"
+
+
+def test_security_headers(client):
+    res = client.get("/")
+    assert res.headers["X-Frame-Options"] == "DENY"
+    assert res.headers["X-Content-Type-Options"] == "nosniff"
+    assert "Referrer-Policy" in res.headers
+    assert "Content-Security-Policy" in res.headers
+
+
+def test_security_headers_on_404(client):
+    res = client.get("/no-such-path")
+    assert res.status_code == 404
+    assert res.headers["X-Frame-Options"] == "DENY"
+    assert res.headers.get("X-Request-ID")
+
+
+def test_pipeline_headers_replace_app_values():
+    """앱이 같은 보안 헤더·X-Request-ID를 넣어도 파이프라인 값 하나만."""
+    from starlette.applications import Starlette
+    from starlette.responses import PlainTextResponse
+    from starlette.routing import Route
+    from starlette.testclient import TestClient
+
+    from app.core.middleware import RequestPipelineMiddleware
+
+    def endpoint(request):
+        return PlainTextResponse("ok", headers={"X-Frame-Options": "SAMEORIGIN", "X-Request-ID": "from-app"})
+
+    with TestClient(RequestPipelineMiddleware(Starlette(routes=[Route("/", endpoint)]))) as c:
+        res = c.get("/", headers={"X-Request-ID": "req-dup"})
+    assert res.headers.get_list("x-frame-options") == ["DENY"]
+    assert res.headers.get_list("x-request-id") == ["req-dup"]
+
+
+def test_cors_preflight_short_circuit(client):
+    res = client.options(
+        "/v1/posts",
+        headers={"Origin": "http://localhost:5173", "Access-Control-Request-Method": "POST"},
+    )
+    assert res.status_code == 200
+    assert res.headers["Access-Control-Max-Age"] == "86400"
+    assert res.headers["Access-Control-Allow-Origin"] == "http://localhost:5173"
+
+
+def test_trusted_proxy_networks_parsed_once():
+    networks = parse_trusted_proxies(["10.0.0.0/8", "192.168.1.10", "not-an-ip", ""])
+    assert len(networks) == 2
+    assert is_trusted_proxy("10.1.2.3", networks)
+    assert is_trusted_proxy("192.168.1.10", networks)
+    assert not is_trusted_proxy("192.168.1.11", networks)
+    assert not is_trusted_proxy("garbage", networks)
+    assert is_trusted_proxy("8.8.8.8", [])
+
+
+def test_local_rate_limiter_gcra_smooths_bursts():
+    """창당 5회: 연속 5회 허용, 6번째 거절(retry_after ≈ 1/5 창), 거절 후 retry_after 동안 즉시 거절."""
+    limiter = LocalRateLimiter(max_keys=100)
+    buckets = [_bucket("login", 60, 5, ApiCode.LOGIN_RATE_LIMIT_EXCEEDED)]
+    now = 1_000_000.0
+    for _ in range(5):
+        assert limiter.check(["k"], buckets, now) is None
+    denied = limiter.check(["k"], buckets, now)
+    assert denied is not None and denied[0] == 0
+    assert 11_000 <= denied[1] <= 12_000
+    assert limiter.check(["k"], buckets, now + 5_000) is not None
+    assert limiter.check(["k"], buckets, now + 12_001) is None
+
+
+def test_local_rate_limiter_checks_all_buckets():
+    limiter = LocalRateLimiter(max_keys=100)
+    buckets = [
+        _bucket("global", 60, 2, ApiCode.RATE_LIMIT_EXCEEDED),
+        _bucket("login", 60, 100, ApiCode.LOGIN_RATE_LIMIT_EXCEEDED),
+    ]
+    keys = ["g", "l"]
+    assert limiter.check(keys, buckets, 0.0) is None
+    assert limiter.check(keys, buckets, 0.0) is None
+    denied = limiter.check(keys, buckets, 0.0)
+    assert denied is not None and denied[0] == 0
+
+
+def test_local_rate_limiter_bounded_keys():
+    limiter = LocalRateLimiter(max_keys=3)
+    buckets = [_bucket("global", 60, 100, ApiCode.RATE_LIMIT_EXCEEDED)]
+    for i in range(10):
+        limiter.check([f"ip{i}"], buckets, 0.0)
+    assert len(limiter._tats) == 3
+
+
+def test_local_rate_limiter_high_cost_denial_not_cached():
+    """비용 2 이상 요청이 거절돼도 같은 키의 비용 1 요청은 막지 않음."""
+    limiter = LocalRateLimiter(max_keys=100)
+    assert limiter.check(["k"], [_bucket("global", 60, 10, ApiCode.RATE_LIMIT_EXCEEDED, 9)], 0.0, 9) is None
+    assert limiter.check(["k"], [_bucket("global", 60, 10, ApiCode.RATE_LIMIT_EXCEEDED, 5)], 0.0, 5) is not None
+    assert limiter.check(["k"], [_bucket("global", 60, 10, ApiCode.RATE_LIMIT_EXCEEDED)], 0.0) is None
+
+
+def test_local_lease_size_adapts():
+    limiter = LocalRateLimiter(max_keys=100)
+    assert limiter.next_lease_size("k", 0.0, 1000, 10) == 0
+    limiter.grant("k", 0, 1000.0)
+    assert limiter.next_lease_size("k", 500.0, 1000, 10) == 1
+    limiter.grant("k", 4, 1000.0)
+    assert limiter.take("k", 3, 500.0) and not limiter.take("k", 2, 500.0)
+    assert limiter.take("k", 1, 600.0)
+    assert limiter.next_lease_size("k", 700.0, 1000, 10) == 8
+    limiter.grant("k", 8, 1700.0)
+    assert limiter.take("k", 1, 800.0)
+    assert not limiter.take("k", 1, 1700.0)
+    # 8 중 1만 쓰고 만료 → 사용량으로 축소, 오래 조용하면 0
+    assert limiter.next_lease_size("k", 1800.0, 1000, 10) == 1
+    assert limiter.next_lease_size("k", 2701.0, 1000, 10) == 0
+
+
+def test_rate_limit_leases_skip_redis_round_trips(monkeypatch):
+    """자주 오는 키는 임대분으로 Redis 호출이 줄고, 임대를 합쳐도 한도를 넘지 않음."""
+    from app.core.config import settings
+    from app.infra.circuit_breaker import CircuitBreaker
+    from app.infra.kv import FailoverBackend, MemoryBackend
+
+    class CountingBackend(MemoryBackend):
+        calls = 0
+
+        async def gcra(self, keys, params):
+            CountingBackend.calls += 1
+            return await super().gcra(keys, params)
+
+    monkeypatch.setattr(settings, "RATE_LIMIT_MAX_REQUESTS", 100)
+    monkeypatch.setattr(settings, "RATE_LIMIT_LEASE_MAX", 10)
+    monkeypatch.setattr(settings, "RATE_LIMIT_LEASE_TTL_MS", 60_000)
+    kv = FailoverBackend(CountingBackend(100), MemoryBackend(100), CircuitBreaker("t-lease"))
+    scope = {"method": "GET", "path": "/v1/posts", "query_string": b""}
+    login = {"method": "POST", "path": "/v1/auth/login", "query_string": b""}
+
+    async def run():
+        results = [await check_rate_limit(kv, scope, "9.9.9.9") for _ in range(120)]
+        assert results[:100] == [None] * 100
+        assert all(r is not None for r in results[100:])
+        assert CountingBackend.calls < 40
+        # 경로 전용 버킷이 있는 요청은 임대 없이 매번 Redis
+        before = CountingBackend.calls
+        await check_rate_limit(kv, login, "8.8.8.8")
+        await check_rate_limit(kv, login, "8.8.8.8")
+        assert CountingBackend.calls - before == 2
+
+    _local._leases.clear()
+    asyncio.run(run())
+
+
+def test_request_cost_weights():
+    assert request_cost("GET", "/v1/posts") == 1
+    assert request_cost("GET", "/v1/posts", b"page=1&size=100") == 5
+    assert request_cost("POST", "/v1/posts/7/comments/") == 2
+    assert request_cost("POST", "/v1/media/images", content_length=10 * 1024 * 1024) == 13
+    rules = parse_route_costs("GET /v1/posts/{post_id}=4, broken")
+    assert len(rules) == 1 and rules[0].pattern.fullmatch("/v1/posts/12")
+    assert not rules[0].pattern.fullmatch("/v1/posts/12/likes")
+
+
+def test_rate_limit_keyed_on_jwt_sub(monkeypatch):
+    """같은 IP(NAT)라도 로그인 사용자별 버킷 분리, 무효 토큰은 IP 버킷."""
+    from app.core.config import settings
+    from app.core.security import create_access_token
+    from app.infra.circuit_breaker import CircuitBreaker
+    from app.infra.kv import FailoverBackend, MemoryBackend
+
+    monkeypatch.setattr(settings, "RATE_LIMIT_MAX_REQUESTS", 1)
+    monkeypatch.setattr(settings, "RATE_LIMIT_USER_MAX_REQUESTS", 2)
+    kv = FailoverBackend(None, MemoryBackend(100), CircuitBreaker("t"))
+    scope = {"method": "GET", "path": "/v1/posts", "query_string": b""}
+    alice = b"Bearer " + create_access_token(1).encode()
+    bob = b"Bearer " + create_access_token(2).encode()
+    assert resolve_principal(alice) == "u:1"
+    assert resolve_principal(b"Bearer garbage") is None
+
+    async def run():
+        assert await check_rate_limit(kv, scope, "1.2.3.4", alice) is None
+        assert await check_rate_limit(kv, scope, "1.2.3.4", alice) is None
+        assert await check_rate_limit(kv, scope, "1.2.3.4", alice) is not None
+        assert await check_rate_limit(kv, scope, "1.2.3.4", bob) is None
+        assert await check_rate_limit(kv, scope, "1.2.3.4", b"Bearer garbage") is None
+        assert await check_rate_limit(kv, scope, "1.2.3.4") is not None
+        # 한도보다 큰 비용도 빈 버킷에서는 통과
+        upload = {"method": "POST", "path": "/v1/media/images", "query_string": b""}
+        assert await check_rate_limit(kv, upload, "5.6.7.8", None, 50 * 1024 * 1024) is None
+
+    asyncio.run(run())
@@ -0,0 +1,77 @@
+import pytest
+from sqlalchemy import create_engine
+
+from app.core.config import settings
+from app.db import pool as db_pool
+from app.db.pool import InstrumentedQueuePool, PoolBudget, instrument_engine, ping_idle_on_checkout, pool_budget, prefill_pools
+
+
+@pytest.fixture
+def sqlite_engine(tmp_path, monkeypatch):
+    """풀 동작만 보는 SQLite 파일 엔진. 실제 writer/reader 대신 이 엔진만 등록."""
+    monkeypatch.setattr(db_pool, "_ENGINES", {})
+    monkeypatch.setattr(db_pool, "_STATS", {})
+    monkeypatch.setattr(settings, "DB_POOL_HEALTHCHECK_INTERVAL", 0)
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}", poolclass=InstrumentedQueuePool, pool_logging_name="test-pool", pool_size=5
+    )
+    instrument_engine(engine, "test-pool")
+    yield engine
+    engine.dispose()
+
+
+def test_pool_budget(monkeypatch):
+    monkeypatch.setattr(settings, "DB_MAX_CONNECTIONS_PER_HOST", 0)
+    assert pool_budget(engines_on_host=2) == PoolBudget(settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW)
+    monkeypatch.setattr(settings, "DB_MAX_CONNECTIONS_PER_HOST", 100)
+    monkeypatch.setattr(settings, "WEB_CONCURRENCY", 4)
+    # 100 / 4 워커 / 2 엔진 = 12 → overflow 1/4
+    assert pool_budget(engines_on_host=2) == PoolBudget(9, 3)
+    assert pool_budget(engines_on_host=1) == PoolBudget(19, 6)
+    monkeypatch.setattr(settings, "WEB_CONCURRENCY", 64)
+    assert pool_budget(engines_on_host=2) == PoolBudget(1, 0)
+
+
+def test_prefill_pools(sqlite_engine, monkeypatch):
+    monkeypatch.setattr(settings, "DB_POOL_MIN_SIZE", 3)
+    prefill_pools()
+    stats = db_pool.get_pool_stats()["test-pool"]
+    assert stats["connects"] == 3
+    assert stats["checked_in"] == 3 and stats["checked_out"] == 0
+    monkeypatch.setattr(settings, "DB_POOL_MIN_SIZE", 10)
+    prefill_pools()
+    # pool_size(5) 상한
+    assert db_pool.get_pool_stats()["test-pool"]["checked_in"] == 5
+
+
+def test_idle_connection_pinged_on_checkout(sqlite_engine):
+    ping_idle_on_checkout(sqlite_engine, db_pool._STATS["test-pool"], max_idle=0)
+    pings = []
+    ping = sqlite_engine.dialect.do_ping
+
+    def failing_ping(dbapi_conn):
+        pings.append(dbapi_conn)
+        if len(pings) == 1:
+            raise OSError("server has gone away")
+        return ping(dbapi_conn)
+
+    sqlite_engine.dialect.do_ping = failing_ping
+    with sqlite_engine.connect() as conn:
+        conn.exec_driver_sql("select 1")
+    # 새 연결은 ping 없이, 반납된(유휴) 연결은 체크아웃 시 ping → 실패하면 폐기 후 새 연결(새 연결은 ping 없음)
+    assert pings == []
+    with sqlite_engine.connect() as conn:
+        assert conn.exec_driver_sql("select 1").scalar() == 1
+    stats = db_pool.get_pool_stats()["test-pool"]
+    assert len(pings) == 1
+    assert stats["stale"] == 1 and stats["invalidations"] == 1 and stats["connects"] == 2
+
+
+def test_recently_used_connection_not_pinged(sqlite_engine):
+    ping_idle_on_checkout(sqlite_engine, db_pool._STATS["test-pool"], max_idle=60)
+    pings = []
+    sqlite_engine.dialect.do_ping = pings.append
+    for _ in range(3):
+        with sqlite_engine.connect() as conn:
+            conn.exec_driver_sql("select 1")
+    assert pings == []
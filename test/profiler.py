@@ -0,0 +1,104 @@
+import asyncio
+import sys
+import threading
+import time
+
+from app.core.context import RequestContext, request_ctx
+from app.core.profiler import ProfileSession, StackSampler, sampler, start_profile
+from app.core.threadpool import run_in_threadpool
+
+
+def test_admin_requires_token(client, admin_headers):
+    assert client.get("/admin/profiles").status_code == 401
+    assert client.get("/admin/profiles", headers={"X-Admin-Token": "wrong"}).status_code == 401
+    assert client.get("/admin/profiles", headers=admin_headers).status_code == 200
+
+
+def test_profile_by_header_and_download(client, admin_headers):
+    res = client.get("/", headers={"X-Profile": "test-admin-token", "X-Request-ID": "prof-1"})
+    assert res.status_code == 200
+    assert res.headers["x-profile-id"] == "prof-1"
+    assert "x-profile-id" not in client.get("/", headers={"X-Profile": "wrong"}).headers
+
+    listed = client.get("/admin/profiles", headers=admin_headers).json()["data"]
+    assert any(p["requestId"] == "prof-1" for p in listed)
+    res = client.get("/admin/profiles/prof-1", headers=admin_headers)
+    assert res.status_code == 200
+    assert res.text.startswith("# GET / ")
+    assert client.get("/admin/profiles/missing", headers=admin_headers).status_code == 404
+
+
+def test_unsafe_request_id_not_profiled(client):
+    res = client.get("/", headers={"X-Profile": "test-admin-token", "X-Request-ID": "../../etc"})
+    assert "x-profile-id" not in res.headers
+
+
+def test_sampling_toggle(client, admin_headers):
+    res = client.put("/admin/profiling", json={"sampleRate": 1, "durationSeconds": 60}, headers=admin_headers)
+    assert res.status_code == 200
+    try:
+        assert "x-profile-id" in client.get("/").headers
+    finally:
+        client.put("/admin/profiling", json={"sampleRate": 0}, headers=admin_headers)
+    assert "x-profile-id" not in client.get("/").headers
+
+
+def _spin(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def test_samples_only_threads_running_the_request():
+    """다른 스레드(무관한 작업)와 같은 루프의 다른 요청 스택은 섞이지 않음."""
+    stop = threading.Event()
+
+    def busy():
+        while not stop.is_set():
+            _spin(0.001)
+
+    bystander = threading.Thread(target=busy, name="bystander")
+    bystander.start()
+
+    async def other_request():
+        for _ in range(10):
+            _spin(0.005)
+            await asyncio.sleep(0)
+
+    async def profiled():
+        session = ProfileSession("p", threading.get_ident(), sys._getframe())
+        local = StackSampler(0.001, 1)
+        assert local.add(session)
+        ctx = RequestContext("p")
+        ctx.profile = session
+        request_ctx.set(ctx)
+        other = asyncio.ensure_future(other_request())
+        await asyncio.sleep(0)
+        _spin(0.03)
+        await run_in_threadpool(_spin, 0.03)
+        await other
+        local.remove(session)
+        return session
+
+    try:
+        session = asyncio.run(profiled())
+    finally:
+        stop.set()
+        bystander.join()
+    folded = session.folded()
+    assert "profiled" in folded and "_spin" in folded
+    assert "bystander" not in folded and "other_request" not in folded
+    assert any(line.startswith("AnyIO worker thread") for line in folded.splitlines())
+
+
+def test_concurrent_profiles_capped():
+    async def scenario():
+        sessions = [start_profile(f"c{i}") for i in range(sampler.max_sessions + 1)]
+        for session in sessions:
+            if session is not None:
+                sampler.remove(session)
+        return sessions
+
+    sessions = asyncio.run(scenario())
+    assert sessions[-1] is None and all(sessions[:-1])
+    assert sampler.active() == 0
@@ -0,0 +1,93 @@
+# 조회 API 쿼리 수 예산. 엔진 before_cursor_execute 이벤트로 해당 요청(X-Request-ID)의 SQL만 셈(DEBUG 헤더에 의존하지 않음).
+# 목록 길이와 무관하게 고정(N+1 회귀 방지). conftest에서 DB_STRICT_LOADING=true.
+import itertools
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+from app.core.context import request_ctx
+from app.db import reader_engine, writer_engine
+from app.posts.model import _select_post_by_id
+
+POSTS_LIST_BUDGET = 4  # posts(+작성자·프로필 이미지 join) + dogs selectin + post_images selectin + count
+POST_DETAIL_BUDGET = 2  # post(+작성자·post_images join) + dogs selectin
+COMMENTS_LIST_BUDGET = 4  # post + dogs selectin + comments(+작성자 join) + dogs selectin
+
+
+_request_ids = itertools.count()
+
+
+@contextmanager
+def _count_queries(request_id):
+    counted = [0]
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        ctx = request_ctx.get()
+        if ctx is not None and ctx.request_id == request_id:
+            counted[0] += 1
+
+    engines = {writer_engine, reader_engine}
+    for engine in engines:
+        event.listen(engine, "before_cursor_execute", _count)
+    try:
+        yield counted
+    finally:
+        for engine in engines:
+            event.remove(engine, "before_cursor_execute", _count)
+
+
+def _get_counted(client, url):
+    """(응답, 그 요청이 실행한 SQL 수)."""
+    request_id = f"budget-{next(_request_ids)}"
+    with _count_queries(request_id) as counted:
+        res = client.get(url, headers={"X-Request-ID": request_id})
+    return res, counted[0]
+
+
+@pytest.fixture(scope="module")
+def seeded_post_id(client, auth_cookies):
+    post_id = None
+    for i in range(5):
+        res = client.post(
+            "/v1/posts",
+            json={"title": f"Budget {i}", "content": "Body"},
+            cookies=auth_cookies,
+        )
+        assert res.status_code == 201
+        post_id = res.json()["data"]["postId"]
+    for i in range(5):
+        res = client.post(
+            f"/v1/posts/{post_id}/comments",
+            json={"content": f"comment {i}"},
+            cookies=auth_cookies,
+        )
+        assert res.status_code == 201
+    return post_id
+
+
+def test_posts_list_query_budget(client, seeded_post_id):
+    res, queries = _get_counted(client, "/v1/posts?page=1&size=10")
+    assert res.status_code == 200
+    assert len(res.json()["data"]["list"]) >= 5
+    assert 0 < queries <= POSTS_LIST_BUDGET
+
+
+def test_post_detail_query_budget(client, seeded_post_id):
+    res, queries = _get_counted(client, f"/v1/posts/{seeded_post_id}")
+    assert res.status_code == 200
+    assert 0 < queries <= POST_DETAIL_BUDGET
+
+
+def test_comments_list_query_budget(client, seeded_post_id):
+    res, queries = _get_counted(client, f"/v1/posts/{seeded_post_id}/comments?page=1&size=10")
+    assert res.status_code == 200
+    assert len(res.json()["data"]["list"]) == 5
+    assert 0 < queries <= COMMENTS_LIST_BUDGET
+
+
+def test_cached_statements_carry_strict_loading():
+    """raiseload는 캐시된 문에 1회만 붙음 → 실행 훅이 문을 새로 만들지 않아 같은 객체·캐시 키 재사용."""
+    statement = _select_post_by_id()
+    assert statement is _select_post_by_id()
+    assert statement.get_execution_options()["strict_loading"] is True
@@ -0,0 +1,58 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from app.db.query_stats import fingerprint, record_query, reset_query_stats, top_queries
+
+
+def test_fingerprint_normalizes_literals_and_lists():
+    a = fingerprint("SELECT * FROM posts WHERE id = %(id_1)s AND title = 'a''b' LIMIT 10")
+    b = fingerprint("SELECT *  FROM posts\nWHERE id = %(id_1)s AND title = 'zz' LIMIT 20")
+    assert a == b == "SELECT * FROM posts WHERE id = ? AND title = ? LIMIT ?"
+    assert fingerprint("SELECT 1 FROM t1 WHERE id IN (%(id_1_1)s, %(id_1_2)s)") == fingerprint(
+        "SELECT 1 FROM t1 WHERE id IN (%(id_1_1)s)"
+    )
+    assert fingerprint("INSERT INTO t (a, b) VALUES (%s, %s), (%s, %s)") == "INSERT INTO t (a, b) VALUES (?+)"
+    assert fingerprint("/* c */ SELECT 1") == "SELECT ?"
+
+
+def test_fingerprint_cache_bounded_under_threads():
+    """스레드풀 여러 스레드가 상한을 넘는 서로 다른 문장을 동시에 넣어도 예외 없이 상한 유지."""
+
+    def work(worker):
+        return [fingerprint(f"SELECT {worker} FROM t{worker}_{i} WHERE id = %s") for i in range(800)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(work, range(8)))
+    assert results[3][5] == "SELECT ? FROM t3_5 WHERE id = ?"
+    assert fingerprint.cache_info().currsize <= fingerprint.cache_info().maxsize
+
+
+def test_record_query_aggregates_and_logs_slow(caplog):
+    reset_query_stats()
+    for ms in (1, 2, 3, 4):
+        record_query("reader", f"SELECT * FROM comments WHERE post_id = {ms}", ms / 1000, 5)
+    with caplog.at_level(logging.WARNING, logger="app.db.slow_query"):
+        record_query("writer", "UPDATE posts SET view_count = view_count + 1 WHERE id = 7", 0.5, 1)
+    assert any("slow query 500.0ms engine=writer" in r.getMessage() for r in caplog.records)
+
+    top = top_queries(limit=10, sort="count")
+    assert top[0]["fingerprint"] == "SELECT * FROM comments WHERE post_id = ?"
+    assert top[0]["count"] == 4
+    assert top[0]["total_ms"] == 10.0
+    assert top[0]["p50_ms"] == 3.0
+    assert top[0]["rows_per_call"] == 5
+    assert top_queries(sort="total_ms")[0]["engine"] == "writer"
+    assert [r["engine"] for r in top_queries(engine="reader")] == ["reader"]
+    reset_query_stats()
+    assert top_queries() == []
+
+
+def test_admin_queries_endpoint(client, admin_headers):
+    reset_query_stats()
+    record_query("reader", "SELECT * FROM posts WHERE id = 1", 0.002, 1)
+    res = client.get("/admin/queries", params={"sort": "p99_ms"}, headers=admin_headers)
+    assert res.status_code == 200
+    assert res.json()["data"][0]["fingerprint"] == "SELECT * FROM posts WHERE id = ?"
+    assert client.get("/admin/queries", params={"sort": "bogus"}, headers=admin_headers).status_code == 400
+    assert client.delete("/admin/queries", headers=admin_headers).status_code == 200
+    assert client.get("/admin/queries", headers=admin_headers).json()["data"] == []
@@ -0,0 +1,80 @@
+from datetime import datetime, timezone
+
+import msgpack
+from fastapi import APIRouter, FastAPI
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+
+from app.common import ApiResponse
+from app.common.schema import PaginatedResponse
+from app.core.middleware import RequestPipelineMiddleware
+from app.core.rendering import RENDER_FALLBACK, RenderedRoute, prefers_msgpack
+from app.posts.schema import AuthorInfo, PostIdData, PostResponse
+
+POST = PostResponse(
+    id=1,
+    title="산책",
+    content="멍멍" * 100,
+    view_count=3,
+    author=AuthorInfo(id=7, nickname="뽀삐"),
+    created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+)
+
+
+def _app(route_class) -> FastAPI:
+    router = APIRouter(prefix="/posts", route_class=route_class)
+
+    @router.get("", response_model=ApiResponse[PaginatedResponse[PostResponse]])
+    def feed():
+        return ApiResponse(code="POSTS_RETRIEVED", data=PaginatedResponse(list=[POST], has_more=True, total=1))
+
+    @router.post("", status_code=201, response_model=ApiResponse[PostIdData])
+    async def create():
+        return ApiResponse(code="POST_UPLOADED", data=PostIdData(id=1))
+
+    @router.get("/raw", response_model=ApiResponse[PostIdData])
+    def raw():
+        return ApiResponse(code="OK", data={"id": "2"})
+
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+def test_json_stays_on_default_path():
+    with TestClient(_app(RenderedRoute)) as routed, TestClient(_app(APIRoute)) as default:
+        for method in ("get", "post"):
+            a = getattr(routed, method)("/posts")
+            b = getattr(default, method)("/posts")
+            assert a.status_code == b.status_code
+            assert a.headers["content-type"] == b.headers["content-type"]
+            assert a.json() == b.json()
+        assert routed.get("/posts/raw").json()["data"] == {"id": 2}
+        assert routed.app.openapi() == default.app.openapi()
+
+
+def test_accept_header_negotiation():
+    assert prefers_msgpack(b"application/msgpack")
+    assert prefers_msgpack(b"application/x-msgpack, */*;q=0.8")
+    assert prefers_msgpack(b"application/msgpack, application/json")
+    assert not prefers_msgpack(b"application/json, application/msgpack;q=0.5")
+    assert not prefers_msgpack(b"*/*")
+    assert not prefers_msgpack(b"application/msgpack;q=0")
+
+
+def test_msgpack_response_has_json_shape():
+    app = RequestPipelineMiddleware(_app(RenderedRoute))
+    with TestClient(app) as client:
+        packed = client.get("/posts", headers={"Accept": "application/msgpack"})
+        plain = client.get("/posts")
+        before = RENDER_FALLBACK.collect()["samples"]
+        raw = client.get("/posts/raw", headers={"Accept": "application/msgpack"})
+    assert packed.headers["content-type"] == "application/msgpack"
+    assert "Accept" in packed.headers["vary"]
+    assert plain.headers["content-type"] == "application/json"
+    assert "Accept" in plain.headers["vary"]
+    assert msgpack.unpackb(packed.content) == plain.json()
+    # 타입이 맞지 않는 반환값은 JSON 검증 경로로
+    assert raw.headers["content-type"] == "application/json"
+    assert raw.json()["data"] == {"id": 2}
+    assert RENDER_FALLBACK.collect()["samples"] != before
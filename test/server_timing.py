@@ -0,0 +1,67 @@
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from app.core.middleware.pipeline import RequestPipelineMiddleware
+from app.core.middleware.server_timing import ServerTimingMiddleware
+from app.core.timing import TimedRoute, timed
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+
+
+@timed("storage")
+def _fake_save() -> None:
+    pass
+
+
+def _timing_app() -> FastAPI:
+    router = APIRouter(route_class=TimedRoute)
+
+    @router.get("/sync/{item_id}", response_model=Item)
+    def read_sync(item_id: int):
+        _fake_save()
+        _fake_save()
+        return {"id": item_id, "name": "sync"}
+
+    @router.get("/async/{item_id}", response_model=Item)
+    async def read_async(item_id: int):
+        return Item(id=item_id, name="async")
+
+    app = FastAPI()
+    app.include_router(router)
+    app.add_middleware(ServerTimingMiddleware)
+    app.add_middleware(RequestPipelineMiddleware)
+    return app
+
+
+def _spans(header: str) -> dict:
+    return {entry.split(";")[0].strip(): entry for entry in header.split(",")}
+
+
+def test_server_timing_header_on_debug(client):
+    """DEBUG=True(테스트 기본)면 모든 응답에 total 포함."""
+    res = client.get("/")
+    assert res.status_code == 200
+    assert "total" in _spans(res.headers["server-timing"])
+
+
+def test_timed_route_splits_phases():
+    with TestClient(_timing_app()) as c:
+        res = c.get("/sync/3")
+        assert res.json() == {"id": 3, "name": "sync"}
+        spans = _spans(res.headers["server-timing"])
+        assert {"total", "pre", "handler", "post", "storage"} <= spans.keys()
+        assert 'desc="storage x2"' in spans["storage"]
+
+        res = c.get("/async/4")
+        assert res.json() == {"id": 4, "name": "async"}
+        assert {"pre", "handler", "post"} <= _spans(res.headers["server-timing"]).keys()
+
+        assert c.get("/sync/not-a-number").status_code == 422
+
+
+def test_timed_is_noop_without_request():
+    assert _fake_save() is None
@@ -0,0 +1,75 @@
+from types import SimpleNamespace
+
+from sqlalchemy import create_engine, event, text
+
+from app.core.context import RequestContext, request_ctx
+from app.db.sql_comment import build_comment, instrument_sql_comments, strip_comment
+
+
+def get_post():
+    pass
+
+
+get_post.__module__ = "app.domain.posts.router"
+
+FIELDS = ("controller", "request_id", "route")
+
+
+def _ctx(request_id: str = "rid-1") -> RequestContext:
+    scope = {"route": SimpleNamespace(path_format="/v1/posts/{post_id}"), "endpoint": get_post}
+    return RequestContext(request_id, scope)
+
+
+def test_build_comment_encodes_values():
+    comment = build_comment(_ctx("a*/ DROP'"), FIELDS)
+    assert comment == (
+        " /*controller='posts.get_post',request_id='a%2A%2F%20DROP%27',route='%2Fv1%2Fposts%2F%7Bpost_id%7D'*/"
+    )
+    assert build_comment(_ctx(), ("route",)) == " /*route='%2Fv1%2Fposts%2F%7Bpost_id%7D'*/"
+    assert build_comment(RequestContext("rid", {}), FIELDS) == ""
+    assert strip_comment("SELECT 1" + comment) == "SELECT 1"
+    assert strip_comment("SELECT 1") == "SELECT 1"
+
+
+def test_statements_tagged_only_inside_request():
+    engine = create_engine("sqlite://")
+    instrument_sql_comments(engine)
+    executed = []
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        token = request_ctx.set(_ctx())
+        try:
+            conn.execute(text("SELECT :x"), {"x": 1})
+        finally:
+            request_ctx.reset(token)
+    assert executed[0] == "SELECT 1"
+    # 기본 항목에는 request_id 없음(요청마다 문장 텍스트가 달라지지 않음)
+    assert executed[1].startswith("SELECT ? /*controller='posts.get_post',route=")
+    assert "rid-1" not in executed[1]
+
+
+def test_comment_percent_escaped_for_pyformat_without_params():
+    """pymysql은 바인드 없는 문장도 빈 {}로 `query % args` 포매팅 → 주석의 %2F가 이스케이프돼 있어야 함."""
+    engine = create_engine("sqlite://", paramstyle="pyformat")
+    instrument_sql_comments(engine)
+    tagged = []
+
+    @event.listens_for(engine, "before_cursor_execute", retval=True)
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        tagged.append((statement, parameters))
+        return statement, parameters
+
+    token = request_ctx.set(_ctx())
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    finally:
+        request_ctx.reset(token)
+    statement, parameters = tagged[0]
+    assert parameters is not None
+    assert statement % parameters == "SELECT 1 /*controller='posts.get_post',route='%2Fv1%2Fposts%2F%7Bpost_id%7D'*/"
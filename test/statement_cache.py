@@ -0,0 +1,35 @@
+# 캐시된 핫 쿼리 구성(cached_statement): 같은 문 객체 재사용, 값은 실행 시 bindparam으로만 전달.
+from sqlalchemy.dialects import mysql
+
+from app.comments.model import _select_comments_page
+from app.posts.model import _select_post_by_id, _select_posts_page
+from app.users.model import _select_user_by_id
+
+
+def _bound(statement, params):
+    """(SQL, 드라이버에 넘어갈 위치 인자). MySQL 드라이버 paramstyle=format."""
+    compiled = statement.compile(dialect=mysql.dialect())
+    values = compiled.construct_params(params)
+    return str(compiled), [values[name] for name in compiled.positiontup]
+
+
+def test_builders_return_same_statement():
+    for builder in (_select_post_by_id, _select_posts_page, _select_comments_page, _select_user_by_id):
+        first = builder()
+        assert builder() is first
+        assert first._generate_cache_key() == builder()._generate_cache_key()
+
+
+def test_page_binds_limit_and_offset():
+    statement = _select_posts_page()
+    sql, args = _bound(statement, {"limit": 11, "offset": 20})
+    # MySQL은 LIMIT offset, limit
+    assert sql.rstrip().endswith("LIMIT %s, %s")
+    assert args[-2:] == [20, 11]
+    _, args = _bound(statement, {"limit": 6, "offset": 0})
+    assert args[-2:] == [0, 6]
+    # 값이 문에 고정되지 않음(다른 값으로 다시 실행해도 같은 객체)
+    assert _select_posts_page() is statement
+
+    _, args = _bound(_select_comments_page(), {"post_id": 7, "limit": 10, "offset": 30})
+    assert args[0] == 7 and args[-2:] == [30, 10]
@@ -0,0 +1,62 @@
+import asyncio
+import time
+
+import anyio.to_thread
+import fastapi.routing
+import pytest
+
+from app.core.context import RequestContext, request_ctx
+from app.core.deadline import DeadlineExceeded
+from app.core.threadpool import THREADPOOL_WAIT, configure_threadpool, run_in_threadpool
+from app.db import connection_capacity
+
+
+def test_threadpool_sized_from_db_pool(client, admin_headers):
+    """THREADPOOL_SIZE=0(기본)이면 엔진당 커넥션 상한과 같은 크기."""
+    body = client.get("/metrics", headers=admin_headers).text
+    assert f"threadpool_capacity {connection_capacity()}\n" in body
+    assert "threadpool_wait_seconds_count" in body
+
+
+def test_thread_wait_recorded_per_request():
+    async def scenario():
+        configure_threadpool(1)
+        assert anyio.to_thread.current_default_thread_limiter().total_tokens == 1
+        contexts = [RequestContext("a"), RequestContext("b")]
+
+        async def run(ctx):
+            request_ctx.set(ctx)
+            await run_in_threadpool(time.sleep, 0.05)
+
+        await asyncio.gather(*(run(ctx) for ctx in contexts))
+        return contexts
+
+    before = THREADPOOL_WAIT.collect()["samples"][0][1]["count"] if THREADPOOL_WAIT.collect()["samples"] else 0
+    first, second = asyncio.run(scenario())
+    assert min(first.thread_wait, second.thread_wait) < 0.02
+    assert max(first.thread_wait, second.thread_wait) >= 0.04
+    assert THREADPOOL_WAIT.collect()["samples"][0][1]["count"] == before + 2
+
+
+def test_fastapi_threadpool_calls_instrumented():
+    """sync 엔드포인트·의존성 실행 경로가 계측 래퍼를 거침."""
+
+    async def scenario():
+        configure_threadpool(4)
+
+    asyncio.run(scenario())
+    assert fastapi.routing.run_in_threadpool is run_in_threadpool
+
+
+def test_expired_deadline_skips_work():
+    calls = []
+
+    async def scenario():
+        ctx = RequestContext("late")
+        ctx.deadline = time.perf_counter() - 1
+        request_ctx.set(ctx)
+        await run_in_threadpool(calls.append, 1)
+
+    with pytest.raises(DeadlineExceeded):
+        asyncio.run(scenario())
+    assert calls == []
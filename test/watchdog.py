@@ -0,0 +1,47 @@
+import threading
+
+from app.core.context import PHASE_DB, RequestContext, inflight
+from app.core.watchdog import captures, check_once
+
+
+def test_inflight_registry_lists_current_request(client, admin_headers):
+    res = client.get("/admin/requests", headers=admin_headers)
+    assert res.status_code == 200
+    entries = res.json()["data"]
+    assert any(e["path"] == "/admin/requests" and e["phase"] == "handler" for e in entries)
+    assert not inflight
+
+
+def test_watchdog_captures_stack_of_serving_thread(client, admin_headers):
+    ready = threading.Event()
+    release = threading.Event()
+
+    def blocked_in_db():
+        ready.set()
+        release.wait(5)
+
+    worker = threading.Thread(target=blocked_in_db)
+    worker.start()
+    ready.wait(5)
+    ctx = RequestContext("slow-1", {"method": "GET", "path": "/v1/posts"})
+    ctx.started -= 10
+    ctx.phase = PHASE_DB
+    ctx.statement = "SELECT SLEEP(10)"
+    ctx.thread_id = worker.ident
+    inflight[id(ctx)] = ctx
+    try:
+        assert check_once(1.0) == 1
+        assert check_once(1.0) == 0
+    finally:
+        inflight.pop(id(ctx), None)
+        release.set()
+        worker.join()
+
+    entry = captures[-1]
+    assert entry["request_id"] == "slow-1"
+    assert entry["statement"] == "SELECT SLEEP(10)"
+    assert any("blocked_in_db" in line for line in entry["thread_stack"])
+
+    res = client.get("/admin/slow-requests", headers=admin_headers)
+    assert res.status_code == 200
+    assert res.json()["data"][0]["requestId"] == "slow-1"